@@ -0,0 +1,78 @@
+"""
+Compares the creation of blank datasets via deep copies of a template
+dataset with the creation from the cached metadatablock classes.
+
+Usage:
+    python benchmarks/bench_create_dataset.py --n 1000
+
+By default, the metadatablocks found in 'tests/fixtures/metadatablocks'
+are used. Pass '--blocks' to point to a directory containing the JSON
+responses of '/api/metadatablocks/{name}' of a real installation.
+"""
+
+import argparse
+import glob
+import json
+import os
+import time
+from copy import deepcopy
+
+from dotted_dict import DottedDict
+
+from easyDataverse.dataset import Dataset
+from easyDataverse.registry import MetadatablockRegistry
+
+DEFAULT_BLOCKS = os.path.join(
+    os.path.dirname(__file__), "..", "tests", "fixtures", "metadatablocks"
+)
+
+
+def load_registry(directory: str) -> MetadatablockRegistry:
+    payloads = []
+
+    for path in sorted(glob.glob(os.path.join(directory, "*.json"))):
+        with open(path, "r") as f:
+            payloads.append(DottedDict(json.load(f)))
+
+    registry = MetadatablockRegistry.from_payloads(payloads)
+    registry.build_all()
+
+    return registry
+
+
+def measure(fun, n: int) -> float:
+    start = time.perf_counter()
+
+    for _ in range(n):
+        fun()
+
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--n", type=int, default=1000, help="Number of datasets")
+    parser.add_argument("--blocks", default=DEFAULT_BLOCKS, help="Metadatablock directory")
+    args = parser.parse_args()
+
+    registry = load_registry(args.blocks)
+    template = Dataset.from_registry(registry)
+
+    results = {
+        "deepcopy": measure(lambda: deepcopy(template), args.n),
+        "factory": measure(lambda: Dataset.from_registry(registry), args.n),
+        "factory (lazy)": measure(
+            lambda: Dataset.from_registry(registry, lazy=True), args.n
+        ),
+    }
+
+    print(f"Blocks: {', '.join(registry.names)}")
+    print(f"Datasets: {args.n}\n")
+
+    for name, elapsed in results.items():
+        per_dataset = elapsed / args.n * 1e6
+        print(f"{name:<16} {elapsed:8.3f} s  {per_dataset:10.1f} µs/dataset")
+
+
+if __name__ == "__main__":
+    main()
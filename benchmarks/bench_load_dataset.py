@@ -0,0 +1,109 @@
+"""
+Compares parsing fetched datasets into block classes with and without the
+field index cached on the generated classes. Loading a dataset resolves the
+fetched fields through this index, which replaces the schema tree that was
+previously rebuilt for every block on every load. Without the cache, the
+index of each block class is rebuilt on every load.
+
+Usage:
+    python benchmarks/bench_load_dataset.py --n 1000
+
+By default, the metadatablocks found in 'tests/fixtures/metadatablocks'
+are used. Pass '--blocks' to point to a directory containing the JSON
+responses of '/api/metadatablocks/{name}' of a real installation.
+"""
+
+import argparse
+import time
+from typing import Type, get_args
+
+from dotted_dict import DottedDict
+
+from bench_create_dataset import DEFAULT_BLOCKS, load_registry
+from easyDataverse.base import DataverseBase
+from easyDataverse.dataset import Dataset
+from easyDataverse.dataverse import Dataverse
+from easyDataverse.registry import MetadatablockRegistry
+
+
+def fetched_blocks(registry: MetadatablockRegistry, n_authors: int) -> DottedDict:
+    """Returns the metadatablocks as they would be fetched from an installation"""
+
+    dataset = Dataset.from_registry(registry)
+    dataset.citation.title = "My dataset"  # type: ignore
+
+    for index in range(n_authors):
+        dataset.citation.add_author(  # type: ignore
+            name=f"Author {index}",
+            affiliation="University",
+        )
+
+    return DottedDict(dataset.dataverse_dict()["datasetVersion"]["metadataBlocks"])
+
+
+def clear_field_index_cache(cls: Type[DataverseBase]) -> None:
+    """Removes the field index cached on a block class and its compounds"""
+
+    if "_field_index_cache" in cls.__dict__:
+        delattr(cls, "_field_index_cache")
+
+    for field in cls.model_fields.values():
+        for dtype in get_args(field.annotation) or (field.annotation,):
+            if isinstance(dtype, type) and issubclass(dtype, DataverseBase):
+                clear_field_index_cache(dtype)
+
+
+def load(
+    dataverse: Dataverse,
+    registry: MetadatablockRegistry,
+    blocks: DottedDict,
+    cached: bool,
+) -> None:
+    dataset = Dataset.from_registry(registry)
+
+    if not cached:
+        for name in registry.names:
+            clear_field_index_cache(registry.get_class(name))
+
+    dataverse._construct_block_classes(blocks, dataset)
+
+
+def measure(fun, n: int) -> float:
+    start = time.perf_counter()
+
+    for _ in range(n):
+        fun()
+
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--n", type=int, default=1000, help="Number of loads")
+    parser.add_argument("--authors", type=int, default=10, help="Authors per dataset")
+    parser.add_argument("--blocks", default=DEFAULT_BLOCKS, help="Metadatablock directory")
+    args = parser.parse_args()
+
+    registry = load_registry(args.blocks)
+    dataverse = Dataverse.model_construct()
+    blocks = fetched_blocks(registry, args.authors)
+
+    results = {
+        "without cache": measure(
+            lambda: load(dataverse, registry, blocks, cached=False), args.n
+        ),
+        "with cache": measure(
+            lambda: load(dataverse, registry, blocks, cached=True), args.n
+        ),
+    }
+
+    print(f"Blocks: {', '.join(registry.names)}")
+    print(f"Loads: {args.n}\n")
+
+    for name, elapsed in results.items():
+        per_load = elapsed / args.n * 1e6
+        print(f"{name:<16} {elapsed:8.3f} s  {per_load:10.1f} µs/load")
+
+
+if __name__ == "__main__":
+    main()
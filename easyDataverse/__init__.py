@@ -1,10 +1,28 @@
+from .asyncdataverse import AsyncDataverse  # noqa: F401
+from .cache import SchemaCache  # noqa: F401
 from .dataset import Dataset  # noqa: F401
 from .dataverse import Dataverse  # noqa: F401
+from .journal import UploadJournal  # noqa: F401
 from .license import CustomLicense, License  # noqa: F401
-import nest_asyncio
+from .progress import ProgressUpdate  # noqa: F401
+from .results import LoadResult, UploadResult  # noqa: F401
+from .session import Session  # noqa: F401
+from .validation import FieldError, MetadataValidationError  # noqa: F401
 
-__all__ = ["Dataset", "Dataverse", "CustomLicense", "License"]
-
-nest_asyncio.apply()
+__all__ = [
+    "AsyncDataverse",
+    "Dataset",
+    "Dataverse",
+    "CustomLicense",
+    "FieldError",
+    "License",
+    "LoadResult",
+    "MetadataValidationError",
+    "ProgressUpdate",
+    "SchemaCache",
+    "Session",
+    "UploadJournal",
+    "UploadResult",
+]
 
 __version__ = "0.4.4"
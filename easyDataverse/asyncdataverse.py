@@ -0,0 +1,267 @@
+from typing import List, Optional, Tuple
+from urllib import parse
+
+import rich
+from pydantic import UUID4, HttpUrl
+
+from easyDataverse.cache import SchemaCache
+from easyDataverse.dataset import Dataset
+from easyDataverse.dataverse import Dataverse
+from easyDataverse.downloader import MAX_RETRIES, SEGMENT_THRESHOLD
+from easyDataverse.journal import UploadJournal
+from easyDataverse.progress import ProgressCallback
+from easyDataverse.results import LoadResult, UploadResult
+from easyDataverse.session import Session
+
+
+class AsyncDataverse(Dataverse):
+    """
+    Asynchronous counterpart of 'Dataverse' that runs on the caller's event loop.
+
+    Use 'AsyncDataverse.connect' to create an instance, since connecting
+    requires awaiting the handshake with the installation:
+
+        dataverse = await AsyncDataverse.connect("https://demo.dataverse.org")
+        dataset = await dataverse.load_dataset("doi:10.5072/FK2/ABCDEF")
+
+    Metadatablock classes are generated by the same machinery as for
+    'Dataverse', such that datasets of both are interchangeable.
+    """
+
+    @classmethod
+    async def connect(
+        cls,
+        server_url: HttpUrl,
+        api_token: Optional[UUID4] = None,
+        schema_cache: Optional[SchemaCache] = None,
+        lazy: bool = False,
+        license_ttl: Optional[float] = None,
+        session: Optional[Session] = None,
+    ) -> "AsyncDataverse":
+        """Connects to a Dataverse installation.
+
+        Args:
+            server_url (HttpUrl): The URL of the Dataverse installation.
+            api_token (Optional[UUID4], optional): The API token to use for authentication. Defaults to None.
+            schema_cache (Optional[SchemaCache], optional): On-disk cache for metadatablocks. Defaults to None.
+            lazy (bool, optional): Whether to generate metadatablock classes on first access. Defaults to False.
+            license_ttl (Optional[float], optional): Time in seconds after which licenses are fetched again. Defaults to None.
+            session (Optional[Session], optional): The HTTP session to use. Defaults to None.
+
+        Raises:
+            ValueError: If the installation is not compatible with easyDataverse.
+
+        Returns:
+            AsyncDataverse: The connected Dataverse installation.
+        """
+
+        dataverse = cls(
+            server_url=server_url,
+            api_token=api_token,
+            schema_cache=schema_cache,
+            lazy=lazy,
+            license_ttl=license_ttl,
+            session=session,
+        )
+
+        await dataverse._handshake()
+        dataverse._setup_dataset_generation()
+
+        rich.print(f"🎉 [bold]Connected to '{dataverse.server_url}'[/bold]")
+
+        return dataverse
+
+    def _connect(self) -> None:
+        """Connecting is deferred to 'AsyncDataverse.connect'."""
+
+    async def aclose(self) -> None:
+        """Closes the HTTP connections of this Dataverse installation."""
+
+        if self.session is not None:
+            await self.session.aclose()
+            self.session.close()
+
+    async def load_dataset(  # type: ignore
+        self,
+        pid: str,
+        version: str = "latest",
+        filedir: str = ".",
+        filenames: List[str] = [],
+        download_files: bool = True,
+        n_parallel_downloads: int = 10,
+        sync: bool = False,
+        bundle: bool = False,
+        policy: str = "largest-first",
+        max_bytes_in_flight: Optional[int] = None,
+        segment_threshold: Optional[int] = SEGMENT_THRESHOLD,
+        max_retries: int = MAX_RETRIES,
+        progress: str = "auto",
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> Dataset:
+        """Retrieves dataset from DOI if connected to an installation as a Dataset object.
+
+        Args:
+            pid (str): Persistent identifier of the dataset.
+            version (str, optional): Version of the dataset. Defaults to "latest".
+            filedir (str, optional): Directory to store the files in. Defaults to ".".
+            filenames (Optional[List[str]], optional): List of filenames to download. Defaults to None.
+            download_files (bool, optional): Whether to download the files or not. Defaults to True.
+            n_parallel_downloads (int, optional): Number of parallel downloads. Defaults to 10.
+            sync (bool, optional): Whether to skip files whose local copy matches in size and checksum. Defaults to False.
+            bundle (bool, optional): Whether to download small files together as zip archives. Defaults to False.
+            policy (str, optional): Order in which files are downloaded, one of 'largest-first', 'smallest-first' or 'lpt'. Defaults to "largest-first".
+            max_bytes_in_flight (Optional[int], optional): Maximum total size in bytes of files downloaded at once. Defaults to None.
+            segment_threshold (Optional[int], optional): Minimum size in bytes to download a file in parallel segments. Pass None to disable segmented downloads. Defaults to 1 GB.
+            max_retries (int, optional): Maximum number of retries of a failed download, which resumes from the bytes already written. Defaults to 5.
+            progress (str, optional): How download progress is displayed, one of 'auto', 'files', 'aggregate' or 'silent'. Defaults to "auto".
+            progress_callback (Optional[ProgressCallback], optional): Called with a 'ProgressUpdate' as files download. Defaults to None.
+
+        Returns:
+            Dataset: The dataset.
+        """
+
+        if progress != "silent":
+            rich.print(f"[bold]Fetching dataset '{pid}' from '{self.server_url}'[/bold]\n")
+
+        remote_ds = await self._fetch_dataset_async(pid, version)
+        await self._ensure_licenses_async()
+        dataset = self._build_dataset(remote_ds)
+        files = remote_ds.data.latestVersion.files  # type: ignore
+
+        if progress != "silent":
+            self._print_dataset_info(dataset, version, files)
+
+        if download_files and len(files) > 0:
+            downloaded = await self._download_files(
+                data_api=self._data_api(),
+                files_list=files,
+                filedir=filedir,
+                filenames=filenames,
+                n_parallel_downloads=n_parallel_downloads,
+                sync=sync,
+                bundle=bundle,
+                policy=policy,
+                max_bytes_in_flight=max_bytes_in_flight,
+                segment_threshold=segment_threshold,
+                max_retries=max_retries,
+                progress=progress,
+                progress_callback=progress_callback,
+            )
+            dataset._track_files(downloaded)
+
+        return dataset
+
+    async def load_datasets(  # type: ignore
+        self,
+        pids: List[str],
+        version: str = "latest",
+        concurrency: int = 10,
+        download_files: bool = False,
+        filedir: str = ".",
+        n_parallel_downloads: int = 10,
+        sync: bool = False,
+        bundle: bool = False,
+        policy: str = "largest-first",
+        max_bytes_in_flight: Optional[int] = None,
+        segment_threshold: Optional[int] = SEGMENT_THRESHOLD,
+        max_retries: int = MAX_RETRIES,
+        progress: str = "auto",
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> List[LoadResult]:
+        """Retrieves multiple datasets concurrently from their persistent identifiers.
+
+        See 'Dataverse.load_datasets' for details on the arguments.
+
+        Returns:
+            List[LoadResult]: One result per persistent identifier, in the given order.
+        """
+
+        return await self._load_datasets(
+            pids=pids,
+            version=version,
+            concurrency=concurrency,
+            download_files=download_files,
+            filedir=filedir,
+            n_parallel_downloads=n_parallel_downloads,
+            sync=sync,
+            bundle=bundle,
+            policy=policy,
+            max_bytes_in_flight=max_bytes_in_flight,
+            segment_threshold=segment_threshold,
+            max_retries=max_retries,
+            progress=progress,
+            progress_callback=progress_callback,
+        )
+
+    async def upload_many(  # type: ignore
+        self,
+        datasets: List[Dataset],
+        collection: str,
+        concurrency: int = 10,
+        n_parallel: int = 1,
+        journal: Optional[UploadJournal] = None,
+    ) -> List[UploadResult]:
+        """Uploads multiple datasets concurrently to a collection.
+
+        See 'Dataverse.upload_many' for details on the arguments.
+
+        Returns:
+            List[UploadResult]: One result per dataset, in the given order.
+        """
+
+        return await self._upload_many(
+            datasets=datasets,
+            collection=collection,
+            concurrency=concurrency,
+            n_parallel=n_parallel,
+            journal=journal,
+        )
+
+    @classmethod
+    async def load_from_url(  # type: ignore
+        cls,
+        url: str,
+        api_token: Optional[str] = None,
+        filedir: str = ".",
+        download_files: bool = True,
+        filenames: List[str] = [],
+        n_parallel_downloads: int = 10,
+        version: Optional[str] = None,
+        schema_cache: Optional[SchemaCache] = None,
+        lazy: bool = False,
+    ) -> Tuple[Dataset, "AsyncDataverse"]:
+        """Fetches a dataset and Dataverse specific information from an URL.
+
+        See 'Dataverse.load_from_url' for details on the arguments.
+
+        Returns:
+            Tuple[Dataset, AsyncDataverse]: The dataset and the Dataverse installation.
+        """
+
+        parsed_url = parse.urlparse(url)
+        query = parse.parse_qs(parsed_url.query)
+        p_id = query["persistentId"][0]
+
+        if version is None:
+            version = query.get("version", ["latest"])[0]
+
+        server_url = parse.urlunparse(
+            (parsed_url.scheme, parsed_url.netloc, "", "", "", "")
+        )
+
+        dataverse = await cls.connect(
+            server_url,  # type: ignore
+            api_token,  # type: ignore
+            schema_cache=schema_cache,
+            lazy=lazy,
+        )
+        dataset = await dataverse.load_dataset(
+            pid=p_id,
+            version=version,  # type: ignore
+            filedir=filedir,
+            download_files=download_files,
+            filenames=filenames,
+            n_parallel_downloads=n_parallel_downloads,
+        )
+
+        return dataset, dataverse
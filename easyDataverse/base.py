@@ -11,11 +11,19 @@ import xmltodict
 from anytree import Node, RenderTree, ContRoundStyle
 from enum import Enum
 from pydantic import BaseModel, ConfigDict, PrivateAttr
-from typing import Any, Dict, List, Optional, get_args, get_origin
+from typing import Any, Dict, List, NamedTuple, Optional, get_args, get_origin
 
 from easyDataverse.utils import YAMLDumper
 
 
+class FieldIndexEntry(NamedTuple):
+    """Resolves a Dataverse 'typeName' to the attribute of a class."""
+
+    name: str
+    type_class: str
+    children: Optional[Dict[str, "FieldIndexEntry"]]
+
+
 class DataverseBase(BaseModel):
     model_config = ConfigDict(
         validate_default=True,
@@ -350,6 +358,42 @@ class DataverseBase(BaseModel):
 
         return root
 
+    @classmethod
+    def _field_index(cls) -> Dict[str, FieldIndexEntry]:
+        """Maps the 'typeName' of each field to its attribute name, type class
+        and the index of its compound class, if any.
+
+        The index is built once per class and reused across all instances.
+        """
+
+        index = cls.__dict__.get("_field_index_cache")
+
+        if index is not None:
+            return index
+
+        index = {}
+
+        for name, field in cls.model_fields.items():
+            if get_args(field.annotation):
+                dtype = get_args(field.annotation)[0]
+            else:
+                dtype = field.annotation
+
+            if hasattr(dtype, "model_fields"):
+                children = dtype._field_index()
+            else:
+                children = None
+
+            index[field.json_schema_extra["typeName"]] = FieldIndexEntry(  # type: ignore
+                name=name,
+                type_class=field.json_schema_extra["typeClass"],  # type: ignore
+                children=children,
+            )
+
+        cls._field_index_cache = index  # type: ignore
+
+        return index
+
     # ! Template exporter
     @classmethod
     def export_template(
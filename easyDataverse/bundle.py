@@ -0,0 +1,396 @@
+import os
+import struct
+import zlib
+from typing import AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+import aiofiles
+import httpx
+
+from easyDataverse.checksum import new_hash
+
+# Default of the ':ZipDownloadLimit' setting of Dataverse installations
+BUNDLE_SIZE_LIMIT = 100 * 1024**2  # 100 MB
+BUNDLE_MAX_FILES = 500
+
+LOCAL_HEADER = b"PK\x03\x04"
+CENTRAL_HEADER = b"PK\x01\x02"
+END_OF_CENTRAL_DIRECTORY = b"PK\x05\x06"
+DATA_DESCRIPTOR = b"PK\x07\x08"
+
+FLAG_DATA_DESCRIPTOR = 0x08
+FLAG_UTF8 = 0x800
+ZIP64_EXTRA = 0x0001
+ZIP64_LIMIT = 0xFFFFFFFF
+
+
+class BundleError(Exception):
+    """Raised when a zip bundle cannot be extracted."""
+
+
+class _StreamReader:
+    """Reads exact amounts of bytes from an async byte iterator."""
+
+    def __init__(self, chunks: AsyncIterator[bytes]):
+        self._chunks = chunks
+        self._buffer = b""
+
+    async def read_exact(self, size: int) -> bytes:
+        """Reads exactly 'size' bytes.
+
+        Raises:
+            BundleError: If the stream ends before.
+        """
+
+        while len(self._buffer) < size:
+            try:
+                self._buffer += await self._chunks.__anext__()
+            except StopAsyncIteration:
+                raise BundleError("Unexpected end of zip stream.")
+
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+
+        return data
+
+    async def read_some(self, limit: Optional[int] = None) -> bytes:
+        """Reads the buffered bytes or the next chunk, at most 'limit' bytes.
+
+        Raises:
+            BundleError: If the stream has ended.
+        """
+
+        while not self._buffer:
+            try:
+                self._buffer = await self._chunks.__anext__()
+            except StopAsyncIteration:
+                raise BundleError("Unexpected end of zip stream.")
+
+        if limit is None:
+            limit = len(self._buffer)
+
+        data, self._buffer = self._buffer[:limit], self._buffer[limit:]
+
+        return data
+
+    def unread(self, data: bytes) -> None:
+        """Puts bytes back in front of the stream."""
+
+        self._buffer = data + self._buffer
+
+
+async def extract_zip_stream(
+    chunks: AsyncIterator[bytes],
+    target: Callable[[str], Optional[str]],
+    on_extracted: Optional[Callable[[str, str, int, Optional[str]], None]] = None,
+    checksum_types: Optional[Dict[str, str]] = None,
+) -> List[str]:
+    """Extracts a zip archive while it streams, without buffering it on disk.
+
+    Entries are read one after another from their local headers. Stored and
+    deflated entries are supported, including entries whose sizes are given
+    in a trailing data descriptor. Extraction stops at the central directory.
+
+    Args:
+        chunks (AsyncIterator[bytes]): The bytes of the zip archive.
+        target (Callable[[str], Optional[str]]): Maps an entry name to the local path to
+            extract it to. Entries mapped to None are skipped.
+        on_extracted (Optional[Callable]): Called with the entry name, local path,
+            size and digest of each extracted entry.
+        checksum_types (Optional[Dict[str, str]]): Checksum type per entry name, to
+            compute the digest of an entry while it is extracted.
+
+    Raises:
+        BundleError: If the archive is malformed or uses unsupported features.
+
+    Returns:
+        List[str]: The names of all extracted entries.
+    """
+
+    reader = _StreamReader(chunks)
+    checksum_types = checksum_types or {}
+    extracted = []
+
+    while True:
+        signature = await reader.read_exact(4)
+
+        if signature in (CENTRAL_HEADER, END_OF_CENTRAL_DIRECTORY):
+            break
+        elif signature != LOCAL_HEADER:
+            raise BundleError("Invalid local file header in zip stream.")
+
+        (
+            _,
+            flags,
+            method,
+            _,
+            _,
+            crc,
+            compressed_size,
+            size,
+            name_length,
+            extra_length,
+        ) = struct.unpack("<HHHHHIIIHH", await reader.read_exact(26))
+
+        raw_name = await reader.read_exact(name_length)
+        name = raw_name.decode("utf-8" if flags & FLAG_UTF8 else "cp437")
+        extra = await reader.read_exact(extra_length)
+
+        has_descriptor = bool(flags & FLAG_DATA_DESCRIPTOR)
+        compressed_size, size = _zip64_sizes(extra, compressed_size, size)
+
+        path = target(name) if not name.endswith("/") else None
+        checksum_type = checksum_types.get(name)
+        hasher = new_hash(checksum_type) if path and checksum_type else None
+
+        if path is not None:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            part_path = path + ".part"
+            handle = await aiofiles.open(part_path, "wb")
+        else:
+            part_path = None
+            handle = None
+
+        try:
+            try:
+                n_compressed, n_written, actual_crc = await _extract_entry(
+                    reader=reader,
+                    method=method,
+                    has_descriptor=has_descriptor,
+                    compressed_size=compressed_size,
+                    handle=handle,
+                    hasher=hasher,
+                )
+            finally:
+                if handle is not None:
+                    await handle.close()
+
+            if has_descriptor:
+                crc, compressed_size, size = await _read_data_descriptor(
+                    reader, n_compressed, n_written
+                )
+
+            if n_written != size or actual_crc != crc:
+                raise BundleError(f"Entry '{name}' of zip stream is corrupt.")
+        except BaseException:
+            if part_path is not None and os.path.exists(part_path):
+                os.remove(part_path)
+
+            raise
+
+        if path is not None:
+            os.replace(part_path, path)  # type: ignore
+            extracted.append(name)
+
+            if on_extracted is not None:
+                digest = hasher.hexdigest() if hasher is not None else None
+                on_extracted(name, path, n_written, digest)
+
+    return extracted
+
+
+async def _extract_entry(
+    reader: _StreamReader,
+    method: int,
+    has_descriptor: bool,
+    compressed_size: int,
+    handle,
+    hasher,
+) -> Tuple[int, int, int]:
+    """Extracts the data of a single entry.
+
+    Returns:
+        Tuple[int, int, int]: Number of compressed bytes read, number of bytes written and CRC-32.
+    """
+
+    if method == 8:
+        decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+    elif method == 0 and not has_descriptor:
+        decompressor = None
+    else:
+        raise BundleError(f"Unsupported zip entry (method {method}).")
+
+    n_compressed = 0
+    n_written = 0
+    crc = 0
+
+    while True:
+        if decompressor is None and n_compressed == compressed_size:
+            break
+
+        limit = None if has_descriptor else compressed_size - n_compressed
+        data = await reader.read_some(limit)
+        n_compressed += len(data)
+
+        if decompressor is not None:
+            output = decompressor.decompress(data)
+
+            if decompressor.eof:
+                unused = decompressor.unused_data
+                n_compressed -= len(unused)
+                reader.unread(unused)
+        else:
+            output = data
+
+        crc = zlib.crc32(output, crc)
+        n_written += len(output)
+
+        if hasher is not None:
+            hasher.update(output)
+
+        if handle is not None and output:
+            await handle.write(output)
+
+        if decompressor is not None and decompressor.eof:
+            break
+
+    return n_compressed, n_written, crc
+
+
+async def _read_data_descriptor(
+    reader: _StreamReader,
+    n_compressed: int,
+    n_written: int,
+) -> Tuple[int, int, int]:
+    """Reads the data descriptor following an entry.
+
+    The descriptor holds 4-byte sizes, or 8-byte sizes for zip64 entries. Since
+    the local header does not reveal which is used, the sizes are compared with
+    the number of bytes actually read.
+
+    Returns:
+        Tuple[int, int, int]: The CRC-32, compressed size and size of the entry.
+    """
+
+    head = await reader.read_exact(4)
+
+    if head == DATA_DESCRIPTOR:
+        head = await reader.read_exact(4)
+
+    (crc,) = struct.unpack("<I", head)
+    compressed_size, size = struct.unpack("<II", await reader.read_exact(8))
+
+    if (compressed_size, size) == (n_compressed, n_written):
+        return crc, compressed_size, size
+
+    compressed_size, size = struct.unpack(
+        "<QQ",
+        struct.pack("<II", compressed_size, size) + await reader.read_exact(8),
+    )
+
+    return crc, compressed_size, size
+
+
+def _zip64_sizes(extra: bytes, compressed_size: int, size: int) -> Tuple[int, int]:
+    """Reads the sizes from the zip64 extra field, if the header refers to it."""
+
+    offset = 0
+
+    while offset + 4 <= len(extra):
+        header_id, length = struct.unpack("<HH", extra[offset : offset + 4])
+        data = extra[offset + 4 : offset + 4 + length]
+        offset += 4 + length
+
+        if header_id != ZIP64_EXTRA:
+            continue
+
+        values = list(struct.unpack(f"<{len(data) // 8}Q", data[: len(data) // 8 * 8]))
+
+        if size == ZIP64_LIMIT and values:
+            size = values.pop(0)
+        if compressed_size == ZIP64_LIMIT and values:
+            compressed_size = values.pop(0)
+
+    return compressed_size, size
+
+
+def plan_bundles(
+    files: List[Dict],
+    size_limit: int = BUNDLE_SIZE_LIMIT,
+    max_files: int = BUNDLE_MAX_FILES,
+) -> Tuple[List[List[Dict]], List[Dict]]:
+    """Groups files into bundles that fit into the zip download limit.
+
+    Args:
+        files (List[Dict]): The file metadata.
+        size_limit (int): Maximum total size of the files in a bundle.
+        max_files (int): Maximum number of files in a bundle.
+
+    Returns:
+        Tuple[List[List[Dict]], List[Dict]]: The bundles and the files exceeding the limit on their own.
+    """
+
+    bundles: List[List[Dict]] = []
+    oversized = []
+    current: List[Dict] = []
+    current_size = 0
+
+    for file in files:
+        filesize = int(file["dataFile"].get("filesize") or 0)
+
+        if filesize > size_limit:
+            oversized.append(file)
+            continue
+
+        if current and (
+            current_size + filesize > size_limit or len(current) >= max_files
+        ):
+            bundles.append(current)
+            current, current_size = [], 0
+
+        current.append(file)
+        current_size += filesize
+
+    if current:
+        bundles.append(current)
+
+    return bundles, oversized
+
+
+def bundle_url(files: List[Dict]) -> str:
+    """Returns the zip access endpoint for the given files."""
+
+    ids = ",".join(str(file["dataFile"]["id"]) for file in files)
+
+    return f"/api/access/datafiles/{ids}"
+
+
+async def stream_bundle(
+    client: httpx.AsyncClient,
+    files: List[Dict],
+    targets: Dict[str, str],
+    headers: Optional[Dict[str, str]] = None,
+    checksum_types: Optional[Dict[str, str]] = None,
+    on_extracted: Optional[Callable[[str, str, int, Optional[str]], None]] = None,
+) -> List[str]:
+    """Downloads a bundle of files as a zip archive and extracts it while streaming.
+
+    Args:
+        client (httpx.AsyncClient): The httpx async client.
+        files (List[Dict]): The file metadata of the bundle.
+        targets (Dict[str, str]): Maps the names of the entries to their local path.
+        headers (Optional[Dict[str, str]]): Headers to send, e.g. for authentication.
+        checksum_types (Optional[Dict[str, str]]): Checksum type per entry name.
+        on_extracted (Optional[Callable]): Called for each extracted entry.
+
+    Raises:
+        httpx.HTTPError: If the request fails.
+        BundleError: If the archive cannot be extracted.
+
+    Returns:
+        List[str]: The names of all extracted entries.
+    """
+
+    async with client.stream(
+        "GET",
+        bundle_url(files),
+        headers=headers,
+        timeout=httpx.Timeout(None),
+        follow_redirects=True,
+    ) as response:
+        response.raise_for_status()
+
+        return await extract_zip_stream(
+            response.aiter_bytes(),
+            target=targets.get,
+            on_extracted=on_extracted,
+            checksum_types=checksum_types,
+        )
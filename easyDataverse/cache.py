@@ -0,0 +1,166 @@
+import hashlib
+import json
+import os
+import re
+import time
+from glob import glob
+from typing import Dict, List, Optional
+
+from dotted_dict import DottedDict
+from pydantic import BaseModel, Field
+
+
+def _default_cache_dir() -> str:
+    """Returns the default directory to store cached metadatablocks in.
+
+    The location can be overridden by setting the environment variable
+    'EASYDATAVERSE_CACHE_DIR'. Otherwise, the XDG cache directory is used.
+    """
+
+    if "EASYDATAVERSE_CACHE_DIR" in os.environ:
+        return os.environ["EASYDATAVERSE_CACHE_DIR"]
+
+    cache_home = os.environ.get(
+        "XDG_CACHE_HOME",
+        os.path.join(os.path.expanduser("~"), ".cache"),
+    )
+
+    return os.path.join(cache_home, "easyDataverse")
+
+
+class SchemaCache(BaseModel):
+    """
+    On-disk cache for the metadatablock definitions of Dataverse installations.
+
+    Entries are keyed by the server URL and the Dataverse version and carry a
+    hash of the metadatablock payloads. An entry is only used if it has not
+    expired and its content still matches the stored hash. Once an installation
+    has been cached, connecting to it does not require any metadatablock request.
+    """
+
+    directory: str = Field(
+        default_factory=_default_cache_dir,
+        description="The directory in which cached metadatablocks are stored.",
+    )
+
+    ttl: Optional[float] = Field(
+        default=None,
+        description="Time in seconds after which a cache entry expires. If not provided, entries never expire.",
+    )
+
+    def load(self, server_url: str, version: str) -> Optional[List[DottedDict]]:
+        """Loads the metadatablocks of a Dataverse installation from the cache.
+
+        Args:
+            server_url (str): The URL of the Dataverse installation.
+            version (str): The version of the Dataverse installation.
+
+        Returns:
+            Optional[List[DottedDict]]: The cached metadatablocks or None, if there is no valid entry.
+        """
+
+        path = self._entry_path(server_url, version)
+
+        if not os.path.isfile(path):
+            return None
+
+        try:
+            with open(path, "r") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if self._is_expired(entry) or not self._is_intact(entry):
+            return None
+
+        return [DottedDict(block) for block in entry["blocks"]]
+
+    def store(self, server_url: str, version: str, blocks: List[Dict]) -> str:
+        """Stores the metadatablocks of a Dataverse installation in the cache.
+
+        Args:
+            server_url (str): The URL of the Dataverse installation.
+            version (str): The version of the Dataverse installation.
+            blocks (List[Dict]): The metadatablocks as returned by the API.
+
+        Returns:
+            str: The path to the cache entry.
+        """
+
+        os.makedirs(self.directory, exist_ok=True)
+
+        path = self._entry_path(server_url, version)
+        entry = {
+            "server_url": self._normalize_url(server_url),
+            "version": version,
+            "created_at": time.time(),
+            "hash": self.payload_hash(blocks),
+            "blocks": blocks,
+        }
+
+        # Write to a temporary file first to never expose partial entries
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(entry, f)
+
+        os.replace(tmp_path, path)
+
+        return path
+
+    def invalidate(self, server_url: Optional[str] = None) -> None:
+        """Removes cache entries.
+
+        Args:
+            server_url (Optional[str], optional): The URL of the Dataverse installation whose
+                entries should be removed. If not provided, all entries are removed. Defaults to None.
+        """
+
+        if server_url is None:
+            pattern = os.path.join(self.directory, "*.json")
+        else:
+            pattern = os.path.join(self.directory, f"{self._url_key(server_url)}_*.json")
+
+        for path in glob(pattern):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    @staticmethod
+    def payload_hash(blocks: List[Dict]) -> str:
+        """Computes a hash over the given metadatablock payloads."""
+
+        payload = json.dumps(blocks, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _is_expired(self, entry: Dict) -> bool:
+        """Checks whether a cache entry has exceeded the TTL."""
+
+        if self.ttl is None:
+            return False
+
+        return time.time() - entry.get("created_at", 0) > self.ttl
+
+    def _is_intact(self, entry: Dict) -> bool:
+        """Checks whether the content of a cache entry matches its hash."""
+
+        if "blocks" not in entry:
+            return False
+
+        return entry.get("hash") == self.payload_hash(entry["blocks"])
+
+    def _entry_path(self, server_url: str, version: str) -> str:
+        """Returns the path of the cache entry for an installation and version."""
+
+        version = re.sub(r"[^\w.-]", "_", version)
+        return os.path.join(self.directory, f"{self._url_key(server_url)}_{version}.json")
+
+    @classmethod
+    def _url_key(cls, server_url: str) -> str:
+        """Returns a filesystem-safe key for the given server URL."""
+
+        return hashlib.sha256(cls._normalize_url(server_url).encode()).hexdigest()[:16]
+
+    @staticmethod
+    def _normalize_url(server_url: str) -> str:
+        return str(server_url).rstrip("/").lower()
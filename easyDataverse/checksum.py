@@ -0,0 +1,53 @@
+import hashlib
+from typing import Any
+
+READ_SIZE = 1024**2  # 1 MB
+
+# Maps the checksum types reported by Dataverse to hashlib algorithms
+ALGORITHMS = {
+    "MD5": "md5",
+    "SHA-1": "sha1",
+    "SHA-256": "sha256",
+    "SHA-512": "sha512",
+}
+
+
+def new_hash(checksum_type: str) -> Any:
+    """Creates a hashlib object for a checksum type reported by Dataverse.
+
+    Args:
+        checksum_type (str): The checksum type, e.g. 'MD5' or 'SHA-256'.
+
+    Raises:
+        ValueError: If the checksum type is not supported.
+
+    Returns:
+        The hashlib object.
+    """
+
+    try:
+        return hashlib.new(ALGORITHMS[checksum_type.upper()])
+    except KeyError:
+        raise ValueError(
+            f"Checksum type '{checksum_type}' is not supported. Supported types are: {list(ALGORITHMS)}"
+        )
+
+
+def file_checksum(path: str, checksum_type: str) -> str:
+    """Computes the checksum of a local file.
+
+    Args:
+        path (str): The path to the file.
+        checksum_type (str): The checksum type, e.g. 'MD5' or 'SHA-256'.
+
+    Returns:
+        str: The hex digest of the file.
+    """
+
+    hasher = new_hash(checksum_type)
+
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(READ_SIZE), b""):
+            hasher.update(chunk)
+
+    return hasher.hexdigest()
@@ -1,49 +1,156 @@
 import asyncio
-from typing import List
+from typing import Dict, List, Optional
 from urllib.parse import urljoin
 
 import httpx
 from dotted_dict import DottedDict
 
 
-def gather_metadatablock_names(base_url: str):
+def gather_metadatablock_names(base_url: str, client: Optional[httpx.Client] = None):
     """
     Retrieves the names of all metadata blocks from the given base URL.
 
     Args:
         base_url (str): The base URL of the Dataverse instance.
+        client (Optional[httpx.Client], optional): Client to use for the request.
+            If not provided, a new client is created. Defaults to None.
 
     Returns:
         list: A list of metadata block names.
     """
+
+    if client is None:
+        with httpx.Client() as client:
+            return gather_metadatablock_names(base_url, client)
+
     all_blocks_url = urljoin(base_url, "api/metadatablocks")
-    with httpx.Client() as client:
-        response = client.get(all_blocks_url)
-        response.raise_for_status()
+    response = client.get(all_blocks_url)
+    response.raise_for_status()
 
-        return [block["name"] for block in response.json()["data"]]
+    return [block["name"] for block in response.json()["data"]]
 
 
-async def fetch_metadatablocks(block_names: List[str], base_url: str):
+async def fetch_metadatablocks(
+    block_names: List[str],
+    base_url: str,
+    client: Optional[httpx.AsyncClient] = None,
+):
     """
     Fetches metadata blocks for the given block names asynchronously.
 
     Args:
         block_names (List[str]): A list of block names to fetch metadata for.
+        base_url (str): The base URL of the Dataverse instance.
+        client (Optional[httpx.AsyncClient], optional): Client to use for the requests.
+            If not provided, a new client is created. Defaults to None.
 
     Returns:
         List[dict]: A list of dictionaries containing the metadata for each block.
     """
-    async with httpx.AsyncClient() as client:
-        tasks = [
-            _fetch_metadatablock(
-                client,
-                block_name,
-                base_url,
-            )
-            for block_name in block_names
-        ]
-        return await asyncio.gather(*tasks)
+
+    if client is None:
+        async with httpx.AsyncClient() as client:
+            return await fetch_metadatablocks(block_names, base_url, client)
+
+    tasks = [
+        _fetch_metadatablock(
+            client,
+            block_name,
+            base_url,
+        )
+        for block_name in block_names
+    ]
+    return await asyncio.gather(*tasks)
+
+
+async def fetch_all_metadatablocks(
+    client: httpx.AsyncClient,
+    base_url: str,
+) -> List[DottedDict]:
+    """
+    Fetches the names of all metadata blocks and then all blocks concurrently.
+
+    Args:
+        client (httpx.AsyncClient): The httpx async client.
+        base_url (str): The base URL of the Dataverse instance.
+
+    Returns:
+        List[DottedDict]: A list of dictionaries containing the metadata for each block.
+    """
+    response = await client.get(urljoin(base_url, "api/metadatablocks"))
+    response.raise_for_status()
+
+    block_names = [block["name"] for block in response.json()["data"]]
+
+    return await fetch_metadatablocks(block_names, base_url, client)
+
+
+async def fetch_version(client: httpx.AsyncClient, base_url: str) -> str:
+    """
+    Fetches the version of a Dataverse installation.
+
+    Args:
+        client (httpx.AsyncClient): The httpx async client.
+        base_url (str): The base URL of the Dataverse instance.
+
+    Raises:
+        ValueError: If the URL does not point to a Dataverse installation.
+
+    Returns:
+        str: The version string of the Dataverse installation.
+    """
+    response = await client.get(urljoin(base_url, "api/info/version"))
+
+    if response.status_code != 200:
+        raise ValueError(
+            f"URL '{base_url}' is not a valid Dataverse installation. Couldn't find version info."
+        )
+
+    return response.json()["data"]["version"]
+
+
+async def fetch_licenses(client: httpx.AsyncClient, base_url: str) -> List[Dict]:
+    """
+    Fetches the licenses of a Dataverse installation.
+
+    Args:
+        client (httpx.AsyncClient): The httpx async client.
+        base_url (str): The base URL of the Dataverse instance.
+
+    Raises:
+        Exception: If the licenses could not be fetched.
+
+    Returns:
+        List[Dict]: The licenses as returned by the API.
+    """
+    response = await client.get(urljoin(base_url, "api/licenses"))
+
+    if response.status_code != 200:
+        raise Exception(f"Error getting licenses: {response.text}")
+
+    return response.json()["data"]
+
+
+async def fetch_dataset_types(client: httpx.AsyncClient, base_url: str) -> List[Dict]:
+    """
+    Fetches the dataset types of a Dataverse installation.
+
+    Installations below version 6.4 do not support dataset types,
+    in which case an empty list is returned.
+
+    Args:
+        client (httpx.AsyncClient): The httpx async client.
+        base_url (str): The base URL of the Dataverse instance.
+
+    Returns:
+        List[Dict]: The dataset types as returned by the API.
+    """
+    response = await client.get(urljoin(base_url, "api/datasets/datasetTypes"))
+
+    if not response.is_success:
+        return []
+
+    return response.json()["data"]
 
 
 async def _fetch_metadatablock(client, block_name, base_url):
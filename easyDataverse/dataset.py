@@ -1,20 +1,45 @@
 import json
 import os
+from functools import partial
 from json import dumps
-from typing import Dict, List, Optional, Union
+from typing import AbstractSet, Any, Callable, Dict, List, Optional, Set, Union
 
-import nob
+import httpx
 import xmltodict
 import yaml
-from pydantic import BaseModel, ConfigDict, Field, ValidationInfo, field_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    PrivateAttr,
+    SerializerFunctionWrapHandler,
+    ValidationInfo,
+    field_serializer,
+    model_validator,
+)
+from pydantic.functional_validators import ModelWrapValidatorHandler
 
 from dvuploader import File, add_directory
 
 from easyDataverse.base import DataverseBase
 from easyDataverse.datasettype import DatasetType
+from easyDataverse.diff import MetadataDiff, MetadataSnapshot, diff_metadata
+from easyDataverse.filestate import FilePlan, FileState, dataset_path, plan_file_updates
+from easyDataverse.journal import UploadJournal
 from easyDataverse.license import CustomLicense, License
-from easyDataverse.uploader import update_dataset, upload_to_dataverse
+from easyDataverse.registry import LazyMetadatablocks, MetadatablockRegistry
+from easyDataverse.uploader import (
+    update_dataset,
+    upload_to_dataverse,
+    upload_to_dataverse_async,
+)
 from easyDataverse.utils import YAMLDumper
+from easyDataverse.validation import (
+    FieldError,
+    MetadataValidationError,
+    compile_rules,
+    validate_metadata,
+)
 
 # These may be inferred from the collection
 # in the future, but for now the basic fields
@@ -63,42 +88,120 @@ class Dataset(BaseModel):
     API_TOKEN: Optional[str] = Field(None)
     DATAVERSE_URL: Optional[str] = Field(None)
 
+    _dataverse: Optional[Any] = PrivateAttr(default=None)
+    _dataset_type_names: Optional[Set[str]] = PrivateAttr(default=None)
+    _file_states: Dict[str, FileState] = PrivateAttr(default_factory=dict)
+    _metadata_snapshot: Optional[MetadataSnapshot] = PrivateAttr(default=None)
+
     # ! Validators
-    @field_validator("dataset_type", mode="after")
+    @model_validator(mode="wrap")
+    @classmethod
     def _validate_dataset_type(
         cls,
-        dataset_type: Optional[str],
+        data: Any,
+        handler: ModelWrapValidatorHandler["Dataset"],
         info: ValidationInfo,
-    ) -> Optional[str]:
+    ) -> "Dataset":
         """Validates the dataset type against available types in the Dataverse installation.
 
         This validator ensures that the provided dataset type is valid and available
-        in the target Dataverse installation. It fetches the available dataset types
-        from the Dataverse instance and validates the provided type against them.
+        in the target Dataverse installation. If the dataset has been created by a
+        'Dataverse' object, the dataset types cached by it are used. Otherwise, the
+        available dataset types are fetched once and cached on the dataset.
+
+        On assignment, the validator only runs for 'dataset_type' and restores the
+        previous dataset type if the new one is rejected.
 
         Note:
-            If dataset_type is None, validation is skipped and None is returned.
+            If dataset_type is None, validation is skipped.
             The DATAVERSE_URL must be set in the model for validation to work.
         """
-        if dataset_type is None:
-            return dataset_type
-        elif info.data["DATAVERSE_URL"] is None:
-            raise ValueError(
-                "No Dataverse URL has been provided. Please provide a Dataverse URL to validate the dataset type.",
-                "This error should not happen and is likely a bug in the code.",
-                "Please report this issue https://github.com/gdcc/easyDataverse/issues",
-            )
 
-        available_types = DatasetType.from_instance(info.data["DATAVERSE_URL"])  # type: ignore
-        available_names = [type.name for type in available_types]
+        # On assignment, the dataset itself is passed with its previous values
+        previous = data.dataset_type if isinstance(data, Dataset) else None
+        dataset = handler(data)
 
-        if dataset_type not in available_names:
-            raise ValueError(
-                f"Dataset type '{dataset_type}' is not available in the Dataverse installation. "
-                f"Please use 'list_dataset_types' to see which dataset types are available."
-            )
+        if info.field_name not in (None, "dataset_type"):
+            return dataset
+        elif dataset.dataset_type is None:
+            return dataset
+        elif dataset.dataset_type in dataset._available_dataset_types():
+            return dataset
+
+        rejected = dataset.dataset_type
+
+        if isinstance(data, Dataset):
+            dataset.__dict__["dataset_type"] = previous
+
+        raise ValueError(
+            f"Dataset type '{rejected}' is not available in the Dataverse installation. "
+            f"Please use 'list_dataset_types' to see which dataset types are available."
+        )
+
+    # ! Serializers
+    @field_serializer("metadatablocks", mode="wrap")
+    def _serialize_metadatablocks(
+        self,
+        metadatablocks: Dict[str, DataverseBase],
+        handler: SerializerFunctionWrapHandler,
+    ) -> Dict[str, Any]:
+        """Serializes only metadatablocks that have been created so far.
+
+        Deferred metadatablocks are empty and are thus left out, instead of
+        passing their placeholders to the serializer.
+        """
+
+        return handler(self._loaded_metadatablocks())
 
-        return dataset_type
+    def _available_dataset_types(self) -> AbstractSet[str]:
+        """Returns the names of the dataset types available in the Dataverse installation."""
+
+        if self._dataverse is not None:
+            return self._dataverse.dataset_types.keys()
+
+        if self._dataset_type_names is None:
+            if self.DATAVERSE_URL is None:
+                raise ValueError(
+                    "No Dataverse URL has been provided. Please provide a Dataverse URL to validate the dataset type.",
+                    "This error should not happen and is likely a bug in the code.",
+                    "Please report this issue https://github.com/gdcc/easyDataverse/issues",
+                )
+
+            self._dataset_type_names = {
+                dataset_type.name
+                for dataset_type in DatasetType.from_instance(self.DATAVERSE_URL)
+            }
+
+        return self._dataset_type_names
+
+    # ! Factories
+    @classmethod
+    def from_registry(
+        cls,
+        registry: MetadatablockRegistry,
+        lazy: bool = False,
+        **kwargs,
+    ) -> "Dataset":
+        """Creates a blank dataset with fresh instances of all registered metadatablocks.
+
+        Args:
+            registry (MetadatablockRegistry): Registry holding the metadatablock classes.
+            lazy (bool, optional): Whether to create metadatablocks only once they are accessed. Defaults to False.
+            **kwargs: Additional fields of the dataset.
+
+        Returns:
+            Dataset: The blank dataset.
+        """
+
+        dataset = cls(**kwargs)
+
+        for name in registry.names:
+            if lazy:
+                dataset._defer_metadatablock(name, partial(registry.instantiate, name))
+            else:
+                dataset.add_metadatablock(registry.instantiate(name))
+
+        return dataset
 
     # ! Adders
     def add_metadatablock(self, metadatablock: DataverseBase) -> None:
@@ -122,6 +225,36 @@ class Dataset(BaseModel):
         # ... and to the __dict__
         setattr(self, block_name, metadatablock)
 
+    def _defer_metadatablock(
+        self,
+        name: str,
+        factory: Callable[[], DataverseBase],
+    ) -> None:
+        """Adds a metadatablock that is only created once it is accessed.
+
+        Args:
+            name (str): Name of the metadatablock.
+            factory (Callable[[], DataverseBase]): Function that creates the metadatablock.
+        """
+
+        if not isinstance(self.metadatablocks, LazyMetadatablocks):
+            # Bypass validation, which would turn the mapping into a plain dict
+            self.__dict__["metadatablocks"] = LazyMetadatablocks(self.metadatablocks)
+
+        self.metadatablocks.defer(name, factory)  # type: ignore
+
+    def _loaded_metadatablocks(self) -> Dict[str, DataverseBase]:
+        """Returns all metadatablocks that have been created so far.
+
+        Metadatablocks that have not been accessed yet are empty
+        by definition and thus do not need to be created for exports.
+        """
+
+        if isinstance(self.metadatablocks, LazyMetadatablocks):
+            return self.metadatablocks.materialized()
+
+        return self.metadatablocks
+
     def add_file(
         self,
         local_path: str,
@@ -223,7 +356,7 @@ class Dataset(BaseModel):
 
         # Convert all blocks to the appropriate format
         blocks = {}
-        for block in self.metadatablocks.values():
+        for block in self._loaded_metadatablocks().values():
             blocks.update(block.dataverse_dict())
 
         if isinstance(self.license, License):
@@ -264,7 +397,7 @@ class Dataset(BaseModel):
         if self.p_id:
             data["dataset_id"] = self.p_id  # type: ignore
 
-        for name, block in self.metadatablocks.items():
+        for name, block in self._loaded_metadatablocks().items():
             block = block.dict(exclude_none=exclude_none)
 
             if block != {}:
@@ -290,133 +423,236 @@ class Dataset(BaseModel):
         self,
         dataverse_name: str,
         n_parallel: int = 1,
+        journal: Optional[UploadJournal] = None,
     ) -> str:
         """Uploads a given dataset to a Dataverse installation specified in the environment variable.
 
         Args:
             dataverse_name (str): Name of the target dataverse.
             n_parallel (int, optional): Number of parallel uploads to perform. Defaults to 1.
+            journal (Optional[UploadJournal], optional): Journal to resume an interrupted upload from. Defaults to None.
 
         Returns:
             str: The identifier of the uploaded dataset.
         """
 
-        self._validate_required_fields()
+        json_data = self._validated_json()
 
         self.p_id = upload_to_dataverse(
-            json_data=self.dataverse_json(),
+            json_data=json_data,
             dataverse_name=dataverse_name,
             files=self.files,
             p_id=self.p_id,
             DATAVERSE_URL=str(self.DATAVERSE_URL),
             API_TOKEN=str(self.API_TOKEN),
             n_parallel=n_parallel,
+            client=self._client(),
+            journal=journal.dataset(json_data, dataverse_name) if journal else None,
         )
 
+        self._mark_uploaded()
+
+        return self.p_id
+
+    async def upload_async(
+        self,
+        dataverse_name: str,
+        n_parallel: int = 1,
+        journal: Optional[UploadJournal] = None,
+    ) -> str:
+        """Uploads a given dataset without blocking the running event loop.
+
+        Args:
+            dataverse_name (str): Name of the target dataverse.
+            n_parallel (int, optional): Number of parallel uploads to perform. Defaults to 1.
+            journal (Optional[UploadJournal], optional): Journal to resume an interrupted upload from. Defaults to None.
+
+        Returns:
+            str: The identifier of the uploaded dataset.
+        """
+
+        json_data = self._validated_json()
+
+        self.p_id = await upload_to_dataverse_async(
+            json_data=json_data,
+            dataverse_name=dataverse_name,
+            files=self.files,
+            p_id=self.p_id,
+            DATAVERSE_URL=str(self.DATAVERSE_URL),
+            API_TOKEN=str(self.API_TOKEN),
+            n_parallel=n_parallel,
+            client=self._async_client(),
+            journal=journal.dataset(json_data, dataverse_name) if journal else None,
+        )
+
+        self._mark_uploaded()
+
         return self.p_id
 
     def update(self):
         """Updates a dataset if a p_id has been given.
 
         Use this function to update a dataset that has already been uploaded to Dataverse.
+        Only files that are new or have been modified since the dataset was loaded or
+        uploaded are sent. The planned file operations are printed beforehand.
         """
 
         if not self.p_id:
             raise ValueError("No dataset identifier has been given.")
 
+        plan = self.plan_update()
+        plan.print()
+        changes = self._extract_changes()
+
         update_dataset(
-            to_change=self._extract_changes(),
+            to_change={"fields": changes.replace},
+            to_add={"fields": changes.add},
+            to_delete={"fields": changes.delete},
             p_id=self.p_id,  # type: ignore
-            files=self.files,
+            files=plan.to_upload,
             DATAVERSE_URL=str(self.DATAVERSE_URL),  # type: ignore
             API_TOKEN=str(self.API_TOKEN),
+            client=self._client(),
         )
 
-    def _extract_changes(self) -> Dict:
-        """Extracts the changes that have been made to the dataset."""
+        self._record_file_states(plan.to_upload, with_checksum=False)
+        self._take_metadata_snapshot()
 
-        changes = []
-        for block in self.metadatablocks.values():
-            changes += block.extract_changed()
+    def plan_update(self) -> FilePlan:
+        """Plans which files 'update' uploads, without executing it.
 
-        return {"fields": changes}
+        Files that were downloaded or uploaded before are compared to their state
+        at that time. Unchanged files are skipped, modified files replace their
+        remote version and all other files are uploaded as new files.
 
-    # ! Validation
-    def _validate_required_fields(self):
-        """Validates whether all required fields are present and not empty.
+        Returns:
+            FilePlan: The planned file operations.
+        """
 
-        Raises:
-            ValueError: If a required field is not present or empty.
+        return plan_file_updates(self.files, self._file_states)
+
+    def _mark_uploaded(self) -> None:
+        """Records the files and metadata as present in the remote dataset after an upload."""
+
+        self._record_file_states(self.files, with_checksum=False)
+        self._take_metadata_snapshot()
+
+    def _track_files(self, files: List[File]) -> None:
+        """Adds files that are present in the remote dataset and records their state."""
+
+        self.files += files
+        self._record_file_states(files)
+
+    def _record_file_states(self, files: List[File], with_checksum: bool = True) -> None:
+        """Records the current state of local files, which are in sync with the remote dataset.
+
+        Checksums of downloaded files refer to the remote files. After an upload,
+        checksums of the file objects may be outdated and are hence not kept.
         """
 
-        results = []
+        for file in files:
+            if os.path.isfile(file.filepath):
+                self._file_states[dataset_path(file)] = FileState.from_file(
+                    file, with_checksum=with_checksum
+                )
 
-        for field in REQUIRED_FIELDS:
-            results.append(self._validate_required_field(field))
+    def _client(self) -> Optional[httpx.Client]:
+        """Returns the client of the owning Dataverse session, if there is one."""
 
-        assert all(result for result in results), (
-            "Required fields are missing or empty. Please provide a value for these fields."
-        )
+        if self._dataverse is None or self._dataverse.session is None:
+            return None
+
+        return self._dataverse.session.client
+
+    def _async_client(self) -> Optional[httpx.AsyncClient]:
+        """Returns the async client of the owning Dataverse session for the running loop, if there is one."""
 
-    def _validate_required_field(self, path: str) -> bool:
+        if self._dataverse is None or self._dataverse.session is None:
+            return None
+
+        return self._dataverse.session.async_client()
+
+    def _extract_changes(self) -> MetadataDiff:
+        """Extracts the changes that have been made to the dataset.
+
+        If the dataset has been loaded or uploaded, its metadata is compared to
+        the snapshot taken at that time. Otherwise, all fields that have been
+        assigned are replaced.
         """
-        Validates if a required field in the dataset is present and not empty.
 
-        Args:
-            path (str): The path of the field to validate.
+        if self._metadata_snapshot is not None:
+            return diff_metadata(self._metadata_snapshot, self.dataverse_dict())
+
+        changes = []
+        for block in self._loaded_metadatablocks().values():
+            changes += block.extract_changed()
+
+        return MetadataDiff(replace=changes)
+
+    def _take_metadata_snapshot(self) -> None:
+        """Records the metadata as present in the remote dataset."""
+
+        self._metadata_snapshot = MetadataSnapshot.from_dataverse_dict(
+            self.dataverse_dict()
+        )
+
+    # ! Validation
+    def validate(self) -> List[FieldError]:
+        """Validates the metadata of the dataset without uploading it.
+
+        Checks required fields, controlled vocabularies and the types of all
+        values in a single pass over 'dataverse_dict'.
 
         Raises:
-            ValueError: If the metadatablock specified in the path is not present in the dataset.
+            ValueError: If the metadatablock of a required field is not present in the dataset.
 
         Returns:
-            List[bool]: True if the field is present and not empty, False otherwise.
+            List[FieldError]: The errors by field path, empty if the metadata is valid.
         """
 
-        metadatablock, *field = path.split("/")
-        field_path = "/" + "/".join(field)
+        return self._metadata_errors(self.dataverse_dict())
 
-        if metadatablock not in self.metadatablocks:
-            raise ValueError(
-                f"Metadatablock '{metadatablock}' is not present in the dataset. Please use 'list_metadatablocks' to see which metadatablocks are registered."
-            )
+    def _validated_json(self) -> str:
+        """Validates the metadata and returns its JSON representation for upload.
 
-        metadatablock = nob.Nob(self.metadatablocks[metadatablock].dict())
-        results = []
-        field_exists = False
+        Raises:
+            MetadataValidationError: If the metadata is invalid.
+        """
 
-        for dspath in metadatablock.paths:
-            meta_path = "/".join(
-                [part for part in str(dspath).split("/") if not part.isdigit()]
-            )
+        dataverse_dict = self.dataverse_dict()
+        errors = self._metadata_errors(dataverse_dict)
 
-            if meta_path != field_path:
-                continue
-            else:
-                field_exists = True
+        if errors:
+            raise MetadataValidationError(errors)
 
-            if metadatablock[dspath].val is None:
-                print(
-                    f"⚠️ Field '{path}' is empty yet required. Please provide a value for this field."
-                )
+        return dumps(dataverse_dict, indent=2, default=str)
 
-                results.append(False)
+    def _metadata_errors(self, dataverse_dict: Dict) -> List[FieldError]:
+        """Validates the given metadata against the rules of the metadatablocks."""
 
-        if not field_exists:
-            print(
-                f"⚠️ Field '{path}' is not present in the dataset. Please provide a value for this field."
-            )
+        for name in {path.split("/")[0] for path in REQUIRED_FIELDS}:
+            if name not in self.metadatablocks:
+                raise ValueError(
+                    f"Metadatablock '{name}' is not present in the dataset. Please use 'list_metadatablocks' to see which metadatablocks are registered."
+                )
+
+            # Creates lazy metadatablocks, such that their rules are known
+            self.metadatablocks[name]
 
-            results.append(False)
+        rules = {
+            name: compile_rules(type(block))
+            for name, block in self._loaded_metadatablocks().items()
+        }
 
-        return len(results) == 0
+        return validate_metadata(dataverse_dict, rules, REQUIRED_FIELDS)
 
     # ! Utilities
     def list_metadatablocks(self, detailed: bool = False):
         """Lists all metadatablocks present in this dataset instance"""
 
-        for name, block in self.metadatablocks.items():
+        for name in self.metadatablocks.keys():
             if detailed:
-                block.info()
+                self.metadatablocks[name].info()
             else:
                 print(name)
 
@@ -463,6 +699,23 @@ class Dataset(BaseModel):
         return nu_dict
 
     # ! Overloads
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return super().__getattr__(name)  # type: ignore
+        except AttributeError:
+            metadatablocks = self.__dict__.get("metadatablocks")
+
+            if not isinstance(metadatablocks, LazyMetadatablocks):
+                raise
+            elif name not in metadatablocks:
+                raise
+
+        # Create deferred metadatablocks on first access
+        block = metadatablocks[name]
+        setattr(self, name, block)
+
+        return block
+
     def __str__(self):
         return self.yaml()
 
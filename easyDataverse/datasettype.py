@@ -1,8 +1,7 @@
-from typing import List
+from typing import List, Optional
 from urllib.parse import urljoin
 from pydantic import BaseModel, Field
 import httpx
-from pyDataverse.api import NativeApi
 from easyDataverse.utils import extract_major_minor
 
 
@@ -22,12 +21,17 @@ class DatasetType(BaseModel):
     )
 
     @classmethod
-    def from_instance(cls, base_url: str) -> List["DatasetType"]:
+    def from_instance(
+        cls,
+        base_url: str,
+        client: Optional[httpx.Client] = None,
+    ) -> List["DatasetType"]:
         """
         Retrieve all dataset types from a Dataverse instance.
 
         Args:
             base_url: The base URL of the Dataverse instance
+            client: Client to use for the requests. If not provided, a new client is created.
 
         Returns:
             A list of DatasetType objects representing all dataset types
@@ -37,15 +41,19 @@ class DatasetType(BaseModel):
             httpx.HTTPStatusError: If the API request fails
             ValueError: If the Dataverse instance is not at least version 6.4
         """
-        native_api = NativeApi(base_url=base_url)
+        if client is None:
+            with httpx.Client() as client:
+                return cls.from_instance(base_url, client)
 
-        if cls._get_version(native_api) < (6, 4):
+        base_url = str(base_url).rstrip("/")
+
+        if cls._get_version(client, base_url) < (6, 4):
             raise ValueError(
                 "Dataset types are only supported in Dataverse 6.4 and above"
             )
 
-        url = urljoin(native_api.base_url, "api/datasets/datasetTypes")
-        response = httpx.get(url)
+        url = urljoin(base_url, "api/datasets/datasetTypes")
+        response = client.get(url)
 
         if not response.is_success:
             # If there are no dataset types, the response is a 200 with an empty list
@@ -54,11 +62,11 @@ class DatasetType(BaseModel):
         return [cls.model_validate(item) for item in response.json()["data"]]
 
     @staticmethod
-    def _get_version(native_api: NativeApi) -> tuple[int, int]:
+    def _get_version(client: httpx.Client, base_url: str) -> tuple[int, int]:
         """
         Get the version of the Dataverse instance.
         """
-        response = native_api.get_info_version()
+        response = client.get(urljoin(base_url, "api/info/version"))
         response.raise_for_status()
         version = response.json()["data"]["version"]
         return extract_major_minor(version)
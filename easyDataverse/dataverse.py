@@ -1,18 +1,22 @@
 import asyncio
-from copy import deepcopy
-from functools import cached_property
+from functools import cached_property, partial
+import io
 import json
+import os
+import re
+import time
 from uuid import UUID
-from typing import Callable, Dict, List, Optional, Tuple, IO
+from typing import AsyncIterator, Callable, Dict, List, Optional, Tuple, IO, Union
 from urllib import parse
 
 import httpx
+from easyDataverse.cache import SchemaCache
 from easyDataverse.datasettype import DatasetType
 from easyDataverse.license import CustomLicense, License
+from easyDataverse.base import FieldIndexEntry
 from easyDataverse.utils import extract_major_minor
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
-from anytree import Node, findall_by_attr
 from dotted_dict import DottedDict
 from pydantic import (
     UUID4,
@@ -25,12 +29,24 @@ from pydantic import (
     field_validator,
 )
 from pyDataverse.api import DataAccessApi, NativeApi
+from dvuploader import File
 import rich
 
-from .classgen import create_dataverse_class, remove_child_fields_from_global
-from .connect import fetch_metadatablocks, gather_metadatablock_names
+from .connect import (
+    fetch_all_metadatablocks,
+    fetch_dataset_types,
+    fetch_licenses,
+    fetch_version,
+)
 from .dataset import Dataset
-from .downloader import download_files
+from .downloader import CHUNK_SIZE, MAX_RETRIES, SEGMENT_THRESHOLD, download_files
+from .journal import UploadJournal
+from .progress import ProgressCallback
+from .registry import MetadatablockRegistry
+from .results import LoadResult, UploadResult
+from .session import Session
+from .streaming import BUFFER_SIZE, find_file_id, iter_remote_file, open_remote_file
+from .uploader import upload_to_dataverse_async
 
 
 class Dataverse(BaseModel):
@@ -60,13 +76,43 @@ class Dataverse(BaseModel):
         description="The API token to use for authentication. If not provided, only public data can be accessed.",
     )
 
+    session: Optional[Session] = Field(
+        default=None,
+        exclude=True,
+        description="The HTTP session shared by all requests to the Dataverse installation. If not provided, a session with default settings is created.",
+    )
+
     native_api: Optional[NativeApi] = Field(
         default=None,
         description="The native API provided by PyDataverse to use for interacting with the Dataverse installation beyond EasyDataverse.",
     )
 
+    schema_cache: Optional[SchemaCache] = Field(
+        default=None,
+        description="On-disk cache for metadatablocks. If provided, metadatablocks are only fetched if there is no valid cache entry.",
+    )
+
+    lazy: bool = Field(
+        default=False,
+        description="Whether to generate metadatablock classes only once they are accessed on a dataset.",
+    )
+
+    license_ttl: Optional[float] = Field(
+        default=None,
+        description="Time in seconds after which the cached licenses are fetched again. If not provided, licenses are fetched once.",
+    )
+
+    _licenses: Optional[Dict[str, License]] = PrivateAttr(default=None)
+    _licenses_by_id: Dict[int, License] = PrivateAttr(default_factory=dict)
+    _licenses_fetched_at: float = PrivateAttr(default=0.0)
+    _dataset_types: Optional[Dict[str, DatasetType]] = PrivateAttr(default=None)
+    _registry: MetadatablockRegistry = PrivateAttr(
+        default_factory=MetadatablockRegistry
+    )
     _dataset_gen: Callable = PrivateAttr()
     _connected: bool = PrivateAttr(default=False)
+    _version: Optional[str] = PrivateAttr(default=None)
+    _versions: Dict[str, Dict[str, Dict]] = PrivateAttr(default_factory=dict)
 
     @field_validator("server_url")
     def validate_url(cls, v):
@@ -91,12 +137,26 @@ class Dataverse(BaseModel):
         self,
         server_url: HttpUrl,
         api_token: Optional[UUID4] = None,
+        schema_cache: Optional[SchemaCache] = None,
+        lazy: bool = False,
+        license_ttl: Optional[float] = None,
+        session: Optional[Session] = None,
     ):
         super().__init__(
             server_url=server_url,
             api_token=api_token,
+            schema_cache=schema_cache,
+            lazy=lazy,
+            license_ttl=license_ttl,
+            session=session,
         )
 
+        if self.session is None:
+            self.session = Session(
+                base_url=str(self.server_url),
+                api_token=str(self.api_token) if self.api_token else None,
+            )
+
         self._connect()
         self.native_api = NativeApi(
             base_url=str(self.server_url),
@@ -107,7 +167,11 @@ class Dataverse(BaseModel):
     @property
     def licenses(self) -> Dict[str, License]:
         """The licenses available in the Dataverse installation."""
-        return self._fetch_licenses()
+
+        if self._licenses is None or self._licenses_expired():
+            return self.refresh_licenses()
+
+        return self._licenses
 
     @computed_field(description="The default license of the Dataverse installation.")
     @property
@@ -115,12 +179,58 @@ class Dataverse(BaseModel):
         """The default license of the Dataverse installation."""
         return next(filter(lambda x: x.is_default, self.licenses.values()))
 
+    def refresh_licenses(self) -> Dict[str, License]:
+        """Fetches the licenses from the Dataverse installation and replaces the cached ones.
+
+        Returns:
+            Dict[str, License]: The licenses mapped by their name.
+        """
+
+        return self._cache_licenses(self._fetch_licenses())
+
+    def _cache_licenses(self, licenses: Dict[str, License]) -> Dict[str, License]:
+        """Replaces the cached licenses and indexes them by ID."""
+
+        self._licenses = licenses
+        self._licenses_by_id = {license.id: license for license in licenses.values()}
+        self._licenses_fetched_at = time.monotonic()
+
+        return licenses
+
+    def get_license(self, key: Union[str, int]) -> Optional[License]:
+        """Returns a license of the Dataverse installation by its name or ID.
+
+        Args:
+            key (Union[str, int]): The name or ID of the license.
+
+        Returns:
+            Optional[License]: The license or None, if there is no such license.
+        """
+
+        licenses = self.licenses
+
+        if isinstance(key, int):
+            return self._licenses_by_id.get(key)
+
+        return licenses.get(key)
+
+    def _licenses_expired(self) -> bool:
+        """Checks whether the cached licenses have exceeded the license TTL."""
+
+        if self.license_ttl is None:
+            return False
+
+        return time.monotonic() - self._licenses_fetched_at > self.license_ttl
+
     @computed_field(
         description="The dataset types available in the Dataverse installation."
     )
     @cached_property
     def dataset_types(self) -> Dict[str, DatasetType]:
         """The dataset types available in the Dataverse installation."""
+        if self._dataset_types is not None:
+            return self._dataset_types
+
         if self.native_api is None:
             raise ValueError(
                 "Native API is not available. Please connect to a Dataverse installation first."
@@ -129,7 +239,10 @@ class Dataverse(BaseModel):
         try:
             return {
                 dataset_type.name: dataset_type
-                for dataset_type in DatasetType.from_instance(self.native_api.base_url)
+                for dataset_type in DatasetType.from_instance(
+                    self.native_api.base_url,
+                    client=self.session.client,  # type: ignore
+                )
             }
         except ValueError:
             return {}
@@ -149,6 +262,9 @@ class Dataverse(BaseModel):
 
         dataset.citation.add_ds_description(value="Description") -> Adds a description
 
+        If 'lazy' is set, the classes of the metadatablocks are only generated
+        once a metadatablock is accessed on a dataset for the first time.
+
         Args:
             url (AnyHttpUrl): URL to the Dataverse installation
 
@@ -159,11 +275,6 @@ class Dataverse(BaseModel):
             Dataset: Object that contains all metadatablocks
         """
 
-        if not self._version_is_compliant():
-            raise ValueError(
-                "The Dataverse installation is not compatible with easyDataverse. Please use a Dataverse installation >= 5.13.x"
-            )
-
         progress = Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
@@ -173,27 +284,8 @@ class Dataverse(BaseModel):
         task = progress.add_task(f"Connecting to {str(self.server_url)}...", total=1)
 
         with progress:
-            dataset = Dataset(
-                API_TOKEN=str(self.api_token),
-                DATAVERSE_URL=self.server_url,
-                license=self.default_license,
-            )
-
-            block_names = gather_metadatablock_names(str(self.server_url))
-            all_blocks = asyncio.run(
-                fetch_metadatablocks(
-                    block_names,
-                    base_url=str(self.server_url),
-                )
-            )
-
-            tasks = [
-                self._process_metadatablock(dataset, block) for block in all_blocks
-            ]
-            asyncio.run(asyncio.gather(*tasks))  # type: ignore
-
-            self._dataset_gen = lambda: deepcopy(dataset)
-            self._connected = True
+            self.session.run(self._handshake())  # type: ignore
+            self._setup_dataset_generation()
 
             progress.update(
                 task,
@@ -203,34 +295,119 @@ class Dataverse(BaseModel):
 
             rich.print(f"🎉 [bold]Connected to '{self.server_url}'[/bold]")
 
-    async def _process_metadatablock(
-        self,
-        dataset: Dataset,
-        block: Dict,
-    ):
-        """
-        Process a metadata block for a dataset.
+    def _setup_dataset_generation(self) -> None:
+        """Prepares the creation of datasets once the handshake has been completed."""
+
+        if not self.lazy:
+            self._registry.build_all()
+
+        self._dataset_gen = partial(self._blank_dataset, self.default_license)
+        self._connected = True
+
+    def _blank_dataset(self, license: License) -> Dataset:
+        """Creates a blank dataset from the generated metadatablock classes.
 
         Args:
-            dataset (Dataset): The dataset object to which the metadata block belongs.
-            block (Dict): The metadata block to process.
+            license (License): The license to assign to the dataset.
 
+        Returns:
+            Dataset: The blank dataset.
         """
-        metadatablock = deepcopy(block)
-        fields = remove_child_fields_from_global(metadatablock.data.fields)  # type: ignore
-        primitives = list(
-            filter(lambda field: "childFields" not in field, fields.values())
-        )
-        compounds = list(filter(lambda field: "childFields" in field, fields.values()))
 
-        block_cls = create_dataverse_class(
-            metadatablock.data.name,  # type: ignore
-            primitives,
-            compounds,  # type: ignore
+        return Dataset.from_registry(
+            self._registry,
+            lazy=self.lazy,
+            API_TOKEN=str(self.api_token),
+            DATAVERSE_URL=self.server_url,
+            license=license.model_copy(),
         )
-        block_cls._metadatablock_name = metadatablock.data.name  # type: ignore
 
-        dataset.add_metadatablock(block_cls())
+    async def _handshake(self) -> None:
+        """Fetches everything needed to work with the Dataverse installation.
+
+        All requests are sent concurrently on the pooled client of the session.
+        The metadatablocks are fetched as soon as their names arrive, such that connecting takes
+        roughly two round trips. If a schema cache is given, the version is
+        awaited first to look up the cached metadatablocks.
+
+        Raises:
+            ValueError: If the installation is not compatible with easyDataverse.
+        """
+
+        base_url = str(self.server_url)
+
+        client = self.session.async_client()  # type: ignore
+
+        version = asyncio.ensure_future(fetch_version(client, base_url))
+        licenses = asyncio.ensure_future(fetch_licenses(client, base_url))
+        dataset_types = asyncio.ensure_future(fetch_dataset_types(client, base_url))
+        blocks = None
+
+        if self.schema_cache is None:
+            blocks = asyncio.ensure_future(fetch_all_metadatablocks(client, base_url))
+
+        pending = [task for task in (version, licenses, dataset_types, blocks) if task]
+
+        try:
+            self._version = await version
+
+            if not self._version_is_compliant():
+                raise ValueError(
+                    "The Dataverse installation is not compatible with easyDataverse. Please use a Dataverse installation >= 5.13.x"
+                )
+
+            if blocks is None:
+                all_blocks = await self._fetch_metadatablocks(client)
+            else:
+                all_blocks = await blocks
+
+            self._registry = MetadatablockRegistry.from_payloads(all_blocks)
+            self._cache_licenses(
+                {
+                    license["name"]: License(**license)
+                    for license in await licenses
+                }
+            )
+            self._dataset_types = self._parse_dataset_types(await dataset_types)
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _fetch_metadatablocks(self, client: httpx.AsyncClient) -> List[Dict]:
+        """Fetches all metadatablocks, either from the schema cache or the installation."""
+
+        base_url = str(self.server_url)
+        version = str(self._version)
+
+        if self.schema_cache is not None:
+            cached = self.schema_cache.load(base_url, version)
+
+            if cached is not None:
+                return cached
+
+        all_blocks = await fetch_all_metadatablocks(client, base_url)
+
+        if self.schema_cache is not None:
+            self.schema_cache.store(base_url, version, all_blocks)
+
+        return all_blocks
+
+    def _parse_dataset_types(self, dataset_types: List[Dict]) -> Dict[str, DatasetType]:
+        """Parses the dataset types, which are only supported as of Dataverse 6.4."""
+
+        if extract_major_minor(str(self._version)) < (6, 4):
+            return {}
+
+        return {
+            dataset_type.name: dataset_type
+            for dataset_type in map(DatasetType.model_validate, dataset_types)
+        }
+
+    def invalidate_schema_cache(self) -> None:
+        """Removes all cached metadatablocks of this Dataverse installation."""
+
+        if self.schema_cache is not None:
+            self.schema_cache.invalidate(str(self.server_url))
 
     def _version_is_compliant(self) -> bool:
         """Checks whether the Dataverse version is 5.13 or above.
@@ -239,24 +416,11 @@ class Dataverse(BaseModel):
             bool: True if the version is compliant, False otherwise.
 
         Raises:
-            ValueError: If the server URL is not a valid Dataverse installation or version info is not found.
+            ValueError: If the version info is not a valid Dataverse version.
         """
-        response = httpx.get(parse.urljoin(str(self.server_url), "/api/info/version"))
-
-        if response.status_code != 200:
-            raise ValueError(
-                f"URL '{self.server_url}' is not a valid Dataverse installation. Couldn't find version info."
-            )
-
-        version = response.json()["data"]["version"]
-        major, minor = extract_major_minor(version)
+        major, minor = extract_major_minor(str(self._version))
 
-        if int(major) >= 6:
-            return True
-        elif int(major) >= 5 and int(minor) >= 13:
-            return True
-
-        return False
+        return self._check_version(major, minor)
 
     @staticmethod
     def _check_version(major: int, minor: int) -> bool:
@@ -269,7 +433,9 @@ class Dataverse(BaseModel):
 
     def _fetch_licenses(self) -> Dict[str, License]:
         """Fetches the licenses from the Dataverse installation."""
-        response = httpx.get(parse.urljoin(str(self.server_url), "/api/licenses"))
+        response = self.session.client.get(  # type: ignore
+            parse.urljoin(str(self.server_url), "/api/licenses")
+        )
 
         if response.status_code != 200:
             raise Exception(f"Error getting licenses: {response.text}")
@@ -278,6 +444,31 @@ class Dataverse(BaseModel):
             license["name"]: License(**license) for license in response.json()["data"]
         }
 
+    async def _ensure_licenses_async(self) -> None:
+        """Fetches the licenses using the async client, if they are missing or expired.
+
+        Async code paths call this before accessing 'licenses', which would
+        otherwise fetch expired licenses with a blocking request.
+        """
+
+        if self._licenses is not None and not self._licenses_expired():
+            return
+
+        licenses = await fetch_licenses(
+            self.session.async_client(),  # type: ignore
+            str(self.server_url),
+        )
+
+        self._cache_licenses(
+            {license["name"]: License(**license) for license in licenses}
+        )
+
+    def close(self) -> None:
+        """Closes the HTTP session of this Dataverse installation."""
+
+        if self.session is not None:
+            self.session.close()
+
     # ! Printers
     def list_metadatablocks(self, detailed: bool = False):
         """
@@ -344,6 +535,8 @@ class Dataverse(BaseModel):
         filenames: List[str] = [],
         n_parallel_downloads: int = 10,
         version: Optional[str] = None,
+        schema_cache: Optional[SchemaCache] = None,
+        lazy: bool = False,
     ) -> Tuple[Dataset, "Dataverse"]:
         """Fetches a dataset and Dataverse specific information from an URL.
 
@@ -358,6 +551,8 @@ class Dataverse(BaseModel):
             download_files (bool, optional): Whether to download the files or not. Defaults to True.
             filenames (Optional[List[str]], optional): List of filenames to download. Defaults to None.
             n_parallel_downloads (int, optional): Number of parallel downloads. Defaults to 10.
+            schema_cache (Optional[SchemaCache], optional): On-disk cache for metadatablocks. Defaults to None.
+            lazy (bool, optional): Whether to generate metadatablock classes on first access. Defaults to False.
 
         Returns:
             Tuple[Dataset, Dataverse]: The dataset and the Dataverse installation.
@@ -378,7 +573,12 @@ class Dataverse(BaseModel):
         )
 
         # Instantiate and load the dataset
-        dataverse = cls(server_url, api_token)  # type: ignore
+        dataverse = cls(
+            server_url,  # type: ignore
+            api_token,  # type: ignore
+            schema_cache=schema_cache,
+            lazy=lazy,
+        )
         dataset = dataverse.load_dataset(
             pid=p_id,
             version=version,
@@ -398,6 +598,14 @@ class Dataverse(BaseModel):
         filenames: List[str] = [],
         download_files: bool = True,
         n_parallel_downloads: int = 10,
+        sync: bool = False,
+        bundle: bool = False,
+        policy: str = "largest-first",
+        max_bytes_in_flight: Optional[int] = None,
+        segment_threshold: Optional[int] = SEGMENT_THRESHOLD,
+        max_retries: int = MAX_RETRIES,
+        progress: str = "auto",
+        progress_callback: Optional[ProgressCallback] = None,
     ) -> Dataset:
         """Retrieves dataset from DOI if connected to an installation as a Dataset object.
 
@@ -407,38 +615,52 @@ class Dataverse(BaseModel):
             filedir (str, optional): Directory to store the files in. Defaults to ".".
             filenames (Optional[List[str]], optional): List of filenames to download. Defaults to None.
             download_files (bool, optional): Whether to download the files or not. Defaults to True.
+            sync (bool, optional): Whether to skip files whose local copy matches in size and checksum. Defaults to False.
+            bundle (bool, optional): Whether to download small files together as zip archives. Defaults to False.
+            policy (str, optional): Order in which files are downloaded, one of 'largest-first', 'smallest-first' or 'lpt'. Defaults to "largest-first".
+            max_bytes_in_flight (Optional[int], optional): Maximum total size in bytes of files downloaded at once. Defaults to None.
+            segment_threshold (Optional[int], optional): Minimum size in bytes to download a file in parallel segments. Pass None to disable segmented downloads. Defaults to 1 GB.
+            max_retries (int, optional): Maximum number of retries of a failed download, which resumes from the bytes already written. Defaults to 5.
+            progress (str, optional): How download progress is displayed, one of 'auto', 'files', 'aggregate' or 'silent'. Defaults to "auto".
+            progress_callback (Optional[ProgressCallback], optional): Called with a 'ProgressUpdate' as files download. Defaults to None.
 
         Returns:
             Dataset: The dataset.
         """
 
-        rich.print(f"[bold]Fetching dataset '{pid}' from '{self.server_url}'[/bold]\n")
-
-        # Create a blank dataset
-        dataset = self.create_dataset()
+        if progress != "silent":
+            rich.print(f"[bold]Fetching dataset '{pid}' from '{self.server_url}'[/bold]\n")
 
         # Fetch and extract data
         remote_ds = self._fetch_dataset(pid, version)
+        dataset = self._build_dataset(remote_ds)
+        files = remote_ds.data.latestVersion.files  # type: ignore
 
-        # Get the latest version data
-        latest_version = remote_ds.data.latestVersion  # type: ignore
+        if progress != "silent":
+            self._print_dataset_info(dataset, version, files)
 
-        # Handle license information
-        if hasattr(latest_version, "license") and latest_version.license:
-            dataset.license = self.licenses.get(latest_version.license.name)
-        else:
-            # Try to create a custom license from available fields
-            custom_license = CustomLicense(**latest_version)
-            if custom_license.model_dump(exclude_none=True):
-                dataset.license = custom_license
+        if download_files:
+            self._fetch_files(
+                dataset=dataset,
+                files_list=files,  # type: ignore
+                filedir=filedir,
+                filenames=filenames,
+                n_parallel_downloads=n_parallel_downloads,
+                sync=sync,
+                bundle=bundle,
+                policy=policy,
+                max_bytes_in_flight=max_bytes_in_flight,
+                segment_threshold=segment_threshold,
+                max_retries=max_retries,
+                progress=progress,
+                progress_callback=progress_callback,
+            )
 
-        dataset.p_id = latest_version.datasetPersistentId  # type: ignore
-        dataset.dataset_type = remote_ds.data.get("datasetType", None)  # type: ignore
-        blocks = latest_version.metadataBlocks  # type: ignore
-        files = latest_version.files  # type: ignore
+        return dataset
 
-        # Process metadatablocks and files
-        self._construct_block_classes(blocks, dataset)
+    @staticmethod
+    def _print_dataset_info(dataset: Dataset, version: str, files: List) -> None:
+        """Prints a summary of a loaded dataset."""
 
         info = "\n".join(
             [
@@ -456,21 +678,356 @@ class Dataverse(BaseModel):
 
         rich.print(panel)
 
-        if download_files:
-            self._fetch_files(
-                dataset=dataset,
-                files_list=files,  # type: ignore
+    def load_datasets(
+        self,
+        pids: List[str],
+        version: str = "latest",
+        concurrency: int = 10,
+        download_files: bool = False,
+        filedir: str = ".",
+        n_parallel_downloads: int = 10,
+        sync: bool = False,
+        bundle: bool = False,
+        policy: str = "largest-first",
+        max_bytes_in_flight: Optional[int] = None,
+        segment_threshold: Optional[int] = SEGMENT_THRESHOLD,
+        max_retries: int = MAX_RETRIES,
+        progress: str = "auto",
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> List[LoadResult]:
+        """Retrieves multiple datasets concurrently from their persistent identifiers.
+
+        Datasets are fetched over the pooled connections of the session and
+        built as soon as their metadata arrives. Failures are reported per
+        persistent identifier instead of aborting the whole batch.
+
+        Args:
+            pids (List[str]): Persistent identifiers of the datasets.
+            version (str, optional): Version of the datasets. Defaults to "latest".
+            concurrency (int, optional): Maximum number of concurrently loaded datasets. Defaults to 10.
+            download_files (bool, optional): Whether to download the files or not. Defaults to False.
+            filedir (str, optional): Directory to store the files in. Files of each dataset are stored in a subdirectory named after its persistent identifier. Defaults to ".".
+            n_parallel_downloads (int, optional): Maximum number of parallel downloads per dataset. Defaults to 10.
+            sync (bool, optional): Whether to skip files whose local copy matches in size and checksum. Defaults to False.
+            bundle (bool, optional): Whether to download small files together as zip archives. Defaults to False.
+            policy (str, optional): Order in which files are downloaded, one of 'largest-first', 'smallest-first' or 'lpt'. Defaults to "largest-first".
+            max_bytes_in_flight (Optional[int], optional): Maximum total size in bytes of files downloaded at once. Defaults to None.
+            segment_threshold (Optional[int], optional): Minimum size in bytes to download a file in parallel segments. Pass None to disable segmented downloads. Defaults to 1 GB.
+            max_retries (int, optional): Maximum number of retries of a failed download, which resumes from the bytes already written. Defaults to 5.
+            progress (str, optional): How download progress is displayed, one of 'auto', 'files', 'aggregate' or 'silent'. Defaults to "auto".
+            progress_callback (Optional[ProgressCallback], optional): Called with a 'ProgressUpdate' as files download. Defaults to None.
+
+        Returns:
+            List[LoadResult]: One result per persistent identifier, in the given order.
+        """
+
+        return self.session.run(  # type: ignore
+            self._load_datasets(
+                pids=pids,
+                version=version,
+                concurrency=concurrency,
+                download_files=download_files,
                 filedir=filedir,
-                filenames=filenames,
                 n_parallel_downloads=n_parallel_downloads,
+                sync=sync,
+                bundle=bundle,
+                policy=policy,
+                max_bytes_in_flight=max_bytes_in_flight,
+                segment_threshold=segment_threshold,
+                max_retries=max_retries,
+                progress=progress,
+                progress_callback=progress_callback,
             )
+        )
+
+    async def _load_datasets(
+        self,
+        pids: List[str],
+        version: str,
+        concurrency: int,
+        download_files: bool,
+        filedir: str,
+        n_parallel_downloads: int,
+        sync: bool = False,
+        bundle: bool = False,
+        policy: str = "largest-first",
+        max_bytes_in_flight: Optional[int] = None,
+        segment_threshold: Optional[int] = SEGMENT_THRESHOLD,
+        max_retries: int = MAX_RETRIES,
+        progress: str = "auto",
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> List[LoadResult]:
+        """Loads all datasets concurrently, limited by 'concurrency'."""
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        # Downloads of one dataset already run in parallel and display their
+        # own progress, hence datasets download their files one at a time
+        # unless nothing is displayed.
+        download_slots = asyncio.Semaphore(concurrency if progress == "silent" else 1)
+
+        async def load(pid: str) -> LoadResult:
+            try:
+                async with semaphore:
+                    remote_ds = await self._fetch_dataset_async(pid, version)
+                    await self._ensure_licenses_async()
+                    dataset = self._build_dataset(remote_ds)
+
+                if download_files:
+                    async with download_slots:
+                        downloaded = await self._download_files(
+                            data_api=self._data_api(),
+                            files_list=remote_ds.data.latestVersion.files,  # type: ignore
+                            filedir=os.path.join(filedir, _pid_to_dirname(pid)),
+                            filenames=[],
+                            n_parallel_downloads=n_parallel_downloads,
+                            sync=sync,
+                            bundle=bundle,
+                            policy=policy,
+                            max_bytes_in_flight=max_bytes_in_flight,
+                            segment_threshold=segment_threshold,
+                            max_retries=max_retries,
+                            progress=progress,
+                            progress_callback=progress_callback,
+                        )
+                        dataset._track_files(downloaded)
+
+                return LoadResult(pid=pid, dataset=dataset)
+            except Exception as e:
+                return LoadResult(pid=pid, error=f"{e.__class__.__name__}: {e}")
+
+        return await asyncio.gather(*(load(pid) for pid in pids))
+
+    def upload_many(
+        self,
+        datasets: List[Dataset],
+        collection: str,
+        concurrency: int = 10,
+        n_parallel: int = 1,
+        journal: Optional[UploadJournal] = None,
+    ) -> List[UploadResult]:
+        """Uploads multiple datasets concurrently to a collection.
+
+        Datasets are created over the pooled connections of the session, while
+        files of already created datasets are uploaded at the same time. Failures
+        are reported per dataset instead of aborting the whole batch.
+
+        Args:
+            datasets (List[Dataset]): The datasets to upload.
+            collection (str): Name of the collection the datasets are created in.
+            concurrency (int, optional): Maximum number of concurrent dataset creations and of concurrent file uploads. Defaults to 10.
+            n_parallel (int, optional): Number of parallel file uploads per dataset. Defaults to 1.
+            journal (Optional[UploadJournal], optional): Journal to resume an interrupted batch from. Datasets and files recorded in it are not sent again. Datasets are recognized by their metadata and position in 'datasets'. Defaults to None.
+
+        Returns:
+            List[UploadResult]: One result per dataset, in the given order.
+        """
+
+        return self.session.run(  # type: ignore
+            self._upload_many(
+                datasets=datasets,
+                collection=collection,
+                concurrency=concurrency,
+                n_parallel=n_parallel,
+                journal=journal,
+            )
+        )
+
+    async def _upload_many(
+        self,
+        datasets: List[Dataset],
+        collection: str,
+        concurrency: int,
+        n_parallel: int,
+        journal: Optional[UploadJournal] = None,
+    ) -> List[UploadResult]:
+        """Uploads all datasets concurrently, limited by 'concurrency'."""
+
+        create_slots = asyncio.Semaphore(concurrency)
+        upload_slots = asyncio.Semaphore(concurrency)
+
+        async def upload(position: int, dataset: Dataset) -> UploadResult:
+            try:
+                json_data = dataset._validated_json()
+                await upload_to_dataverse_async(
+                    json_data=json_data,
+                    dataverse_name=collection,
+                    files=dataset.files,
+                    p_id=dataset.p_id,
+                    n_parallel=n_parallel,
+                    DATAVERSE_URL=str(self.server_url),
+                    API_TOKEN=str(self.api_token),
+                    client=self.session.async_client(),  # type: ignore
+                    create_slots=create_slots,
+                    upload_slots=upload_slots,
+                    on_created=partial(setattr, dataset, "p_id"),
+                    journal=(
+                        journal.dataset(json_data, collection, position)
+                        if journal
+                        else None
+                    ),
+                    verbose=False,
+                )
+                dataset._mark_uploaded()
+
+                return UploadResult(dataset=dataset, pid=dataset.p_id)
+            except Exception as e:
+                return UploadResult(
+                    dataset=dataset,
+                    pid=dataset.p_id,
+                    error=f"{e.__class__.__name__}: {e}",
+                )
+
+        return await asyncio.gather(*map(upload, range(len(datasets)), datasets))
+
+    def open_file(
+        self,
+        file: Union[int, str],
+        pid: Optional[str] = None,
+        version: str = "latest",
+        buffer_size: int = BUFFER_SIZE,
+    ) -> io.BufferedReader:
+        """Opens a file of a dataset for reading without downloading it to disk.
+
+        The returned file object is seekable and fetches the bytes it reads via
+        range requests, such that parsers can read CSV or Parquet files directly.
+
+            with dataverse.open_file("data/table.csv", pid="doi:10.5072/FK2/ABCDEF") as f:
+                df = pd.read_csv(f)
+
+        Args:
+            file (Union[int, str]): Identifier of the file, or its path within the dataset if 'pid' is given.
+            pid (Optional[str], optional): Persistent identifier of the dataset to look up the path in. Defaults to None.
+            version (str, optional): Version of the dataset to look up the path in. Defaults to "latest".
+            buffer_size (int, optional): Minimum number of bytes fetched per request. Defaults to 4 MB.
+
+        Raises:
+            ValueError: If the dataset has no file at the given path.
+
+        Returns:
+            io.BufferedReader: The binary file object.
+        """
+
+        if pid is not None:
+            remote_ds = self._fetch_dataset(pid, version, include_files=True)
+            file = find_file_id(remote_ds.data.latestVersion.files, str(file))  # type: ignore
+
+        return open_remote_file(
+            client=self.session.client,  # type: ignore
+            file_id=file,
+            headers=self.session.headers,  # type: ignore
+            buffer_size=buffer_size,
+        )
+
+    async def stream_file(
+        self,
+        file: Union[int, str],
+        pid: Optional[str] = None,
+        version: str = "latest",
+        chunk_size: int = CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """Streams the bytes of a file of a dataset without writing it to disk.
+
+            async for chunk in dataverse.stream_file(42):
+                parser.feed(chunk)
+
+        Args:
+            file (Union[int, str]): Identifier of the file, or its path within the dataset if 'pid' is given.
+            pid (Optional[str], optional): Persistent identifier of the dataset to look up the path in. Defaults to None.
+            version (str, optional): Version of the dataset to look up the path in. Defaults to "latest".
+            chunk_size (int, optional): Size of the yielded chunks. Defaults to 10 MB.
+
+        Raises:
+            ValueError: If the dataset has no file at the given path.
+
+        Yields:
+            bytes: The chunks of the file.
+        """
+
+        if pid is not None:
+            remote_ds = await self._fetch_dataset_async(pid, version, include_files=True)
+            file = find_file_id(remote_ds.data.latestVersion.files, str(file))  # type: ignore
+
+        async for chunk in iter_remote_file(
+            client=self.session.async_client(),  # type: ignore
+            file_id=file,
+            headers=self.session.headers,  # type: ignore
+            chunk_size=chunk_size,
+        ):
+            yield chunk
+
+    def _build_dataset(self, remote_ds: Dict) -> Dataset:
+        """Builds a dataset from the response of the dataset endpoint."""
+
+        # Create a blank dataset
+        dataset = self.create_dataset()
+
+        # Get the latest version data
+        latest_version = remote_ds.data.latestVersion  # type: ignore
+
+        # Handle license information
+        if hasattr(latest_version, "license") and latest_version.license:
+            dataset.license = self.get_license(latest_version.license.name)
+        else:
+            # Try to create a custom license from available fields
+            custom_license = CustomLicense(**latest_version)
+            if custom_license.model_dump(exclude_none=True):
+                dataset.license = custom_license
+
+        dataset.p_id = latest_version.datasetPersistentId  # type: ignore
+        dataset.dataset_type = remote_ds.data.get("datasetType", None)  # type: ignore
+
+        # Process metadatablocks
+        self._construct_block_classes(latest_version.metadataBlocks, dataset)  # type: ignore
+        dataset._take_metadata_snapshot()
 
         return dataset
 
+    async def _fetch_dataset_async(
+        self,
+        pid: str,
+        version: str,
+        include_files: bool = True,
+    ) -> Dict:
+        """Fetches a specific dataset version using the async client of the session."""
+
+        if version == "DRAFT":
+            version = "latest"
+
+        client = self.session.async_client()  # type: ignore
+
+        if version != "latest":
+            url, params = self._version_request(pid, str(version), include_files)
+            response = await client.get(
+                url,
+                params=params,
+                headers=self.session.headers,  # type: ignore
+            )
+
+            if response.status_code == 404:
+                versions = await self._available_versions_async(pid, refresh=True)
+                self._raise_version_not_found(version, versions)
+
+            return self._process_version_response(pid, response)
+
+        response = await client.get(
+            "/api/datasets/:persistentId/",
+            params={"persistentId": pid},
+            headers=self.session.headers,  # type: ignore
+        )
+
+        if not response.is_success:
+            raise ValueError(
+                f"Could not fetch dataset '{pid}': {response.status_code} {response.text}"
+            )
+
+        return DottedDict(response.json())
+
     def _fetch_dataset(
         self,
         pid: str,
         version: str,
+        include_files: bool = True,
     ) -> Dict:
         """Fetches a specific dataset version by its persistent identifier."""
 
@@ -488,9 +1045,9 @@ class Dataverse(BaseModel):
             header["X-Dataverse-key"] = str(self.api_token)
 
         if version != "latest":
-            return self._fetch_dataset_version(pid, str(version))
+            return self._fetch_dataset_version(pid, str(version), include_files)
 
-        response = httpx.get(url, headers=header)
+        response = self.session.client.get(url, headers=header)  # type: ignore
         return DottedDict(response.json())
 
     def _fetch_files(
@@ -500,31 +1057,60 @@ class Dataverse(BaseModel):
         filedir: str,
         filenames: List[str],
         n_parallel_downloads: int,
+        sync: bool = False,
+        bundle: bool = False,
+        policy: str = "largest-first",
+        max_bytes_in_flight: Optional[int] = None,
+        segment_threshold: Optional[int] = SEGMENT_THRESHOLD,
+        max_retries: int = MAX_RETRIES,
+        progress: str = "auto",
+        progress_callback: Optional[ProgressCallback] = None,
     ):
         """Fetches all files of a dataset."""
 
-        if self.api_token:
-            data_api = DataAccessApi(
-                str(self.server_url),
-                str(self.api_token),
-            )
-        else:
-            data_api = DataAccessApi(str(self.server_url))
+        data_api = self._data_api()
 
         if len(files_list) == 0:
             return
 
-        files = asyncio.run(
-            download_files(
+        files = self.session.run(  # type: ignore
+            self._download_files(
                 data_api=data_api,
                 files_list=files_list,
                 filedir=filedir,
                 filenames=filenames,
                 n_parallel_downloads=n_parallel_downloads,
+                sync=sync,
+                bundle=bundle,
+                policy=policy,
+                max_bytes_in_flight=max_bytes_in_flight,
+                segment_threshold=segment_threshold,
+                max_retries=max_retries,
+                progress=progress,
+                progress_callback=progress_callback,
             )
         )
 
-        dataset.files += files
+        dataset._track_files(files)
+
+    def _data_api(self) -> DataAccessApi:
+        """Returns the data access API of this installation."""
+
+        if self.api_token:
+            return DataAccessApi(
+                str(self.server_url),
+                str(self.api_token),
+            )
+
+        return DataAccessApi(str(self.server_url))
+
+    async def _download_files(self, **kwargs) -> List[File]:
+        """Downloads files using the pooled client of the session."""
+
+        return await download_files(
+            client=self.session.async_client(),  # type: ignore
+            **kwargs,
+        )
 
     def _construct_block_classes(
         self,
@@ -536,8 +1122,10 @@ class Dataverse(BaseModel):
         for name, block in blocks.items():
             metadatablock = dataset.metadatablocks[name]
 
-            tree = metadatablock._create_tree()
-            content = self._extract_data(block.fields, tree)
+            content = self._extract_data(
+                block.fields,
+                metadatablock._field_index(),
+            )
 
             if content:
                 dataset.metadatablocks[name] = metadatablock.__class__.model_validate(
@@ -549,52 +1137,135 @@ class Dataverse(BaseModel):
         self,
         dataset_pid: str,
         version: str,
+        include_files: bool = True,
     ) -> Dict:
         """
-        Fetches a specific dataset version by first fetching all versions
-        and then extracting the desired one. Given it exists.
+        Fetches a specific published version of a dataset. Only the requested
+        version is transferred. If it does not exist, the available versions
+        are looked up to report these instead.
         """
 
-        # Fetch all versions
-        versions = self._available_versions(dataset_pid)
+        url, params = self._version_request(dataset_pid, version, include_files)
+        response = self.session.client.get(  # type: ignore
+            url,
+            params=params,
+            headers=self.session.headers,  # type: ignore
+        )
+
+        if response.status_code == 404:
+            versions = self._available_versions(dataset_pid, refresh=True)
+            self._raise_version_not_found(version, versions)
+
+        return self._process_version_response(dataset_pid, response)
+
+    @staticmethod
+    def _version_request(
+        dataset_pid: str,
+        version: str,
+        include_files: bool,
+    ) -> Tuple[str, Dict[str, str]]:
+        """Returns the endpoint and query parameters to fetch a single dataset version."""
 
-        if version not in versions:
+        params = {"persistentId": dataset_pid}
+
+        if not include_files:
+            params["excludeFiles"] = "true"
+
+        return f"/api/datasets/:persistentId/versions/{version}", params
+
+    @staticmethod
+    def _process_version_response(dataset_pid: str, response: httpx.Response) -> Dict:
+        """Wraps a fetched dataset version like the response of the dataset endpoint."""
+
+        if not response.is_success:
             raise ValueError(
-                f"Version {version} not found. These are the available versions: {list(versions.keys())}"
+                f"Could not fetch dataset '{dataset_pid}': {response.status_code} {response.text}"
             )
 
-        return DottedDict({"data": {"latestVersion": versions[version]}})
+        data = response.json()["data"]
+        data.setdefault("files", [])
+
+        return DottedDict({"data": {"latestVersion": data}})
+
+    @staticmethod
+    def _raise_version_not_found(version: str, versions: Dict[str, Dict]) -> None:
+        """Raises an error listing the available versions of a dataset."""
+
+        raise ValueError(
+            f"Version {version} not found. These are the available versions: {list(versions.keys())}"
+        )
 
     def _available_versions(
         self,
         dataset_pid: str,
+        refresh: bool = False,
     ) -> Dict[str, Dict]:
-        """Fetches all available versions of a dataset.
+        """Fetches all available published versions of a dataset.
+
+        Only the version metadata is requested, without files and metadatablocks.
+        The result is cached per persistent identifier.
 
         Args:
             dataset_pid (str): Persistent identifier of the dataset.
-            api (NativeApi): API object to use for the request.
+            refresh (bool, optional): Whether to bypass the cache. Defaults to False.
 
         Returns:
-            Dict[str, Dict]: Mapping of version number to dataset metadata.
+            Dict[str, Dict]: Mapping of version number to version metadata.
         """
 
-        assert self.native_api is not None, (
-            "Native API is not available. Please connect to a Dataverse installation first."
-        )
+        if refresh or dataset_pid not in self._versions:
+            response = self.session.client.get(  # type: ignore
+                **self._versions_request(dataset_pid)
+            )
+            self._versions[dataset_pid] = self._process_versions_response(response)
 
-        response = self.native_api.get_dataset_versions(dataset_pid)
+        return self._versions[dataset_pid]
 
-        if response.status_code != 200:  # type: ignore
-            raise Exception(f"Error getting dataset versions: {response.text}")  # type: ignore
+    async def _available_versions_async(
+        self,
+        dataset_pid: str,
+        refresh: bool = False,
+    ) -> Dict[str, Dict]:
+        """Fetches all available published versions of a dataset using the async client.
+
+        See '_available_versions' for details.
+        """
+
+        if refresh or dataset_pid not in self._versions:
+            response = await self.session.async_client().get(  # type: ignore
+                **self._versions_request(dataset_pid)
+            )
+            self._versions[dataset_pid] = self._process_versions_response(response)
+
+        return self._versions[dataset_pid]
+
+    def _versions_request(self, dataset_pid: str) -> Dict:
+        """Returns the arguments to request the metadata of all versions of a dataset."""
+
+        return {
+            "url": "/api/datasets/:persistentId/versions",
+            "params": {
+                "persistentId": dataset_pid,
+                "excludeFiles": "true",
+                "excludeMetadataBlocks": "true",
+            },
+            "headers": self.session.headers,  # type: ignore
+        }
+
+    @staticmethod
+    def _process_versions_response(response: httpx.Response) -> Dict[str, Dict]:
+        """Maps the published versions of a dataset to their version number."""
+
+        if response.status_code != 200:
+            raise Exception(f"Error getting dataset versions: {response.text}")
 
         return {
-            str(dataset["versionNumber"]): dataset
-            for dataset in response.json()["data"]  # type: ignore
-            if dataset["versionState"] != "DRAFT"
+            f"{version['versionNumber']}.{version.get('versionMinorNumber', 0)}": version
+            for version in response.json()["data"]
+            if version["versionState"] != "DRAFT"
         }
 
-    def _extract_data(self, fields: List, tree: Node):
+    def _extract_data(self, fields: List, index: Dict[str, FieldIndexEntry]):
         """
         Extracts data from a metadatablock that has been fetched as a
         dataset from a Dataverse installation.
@@ -606,32 +1277,29 @@ class Dataverse(BaseModel):
         data = {}
 
         for field in fields:
-            result = findall_by_attr(tree, field.typeName, "typeName")
-
-            if len(result) > 0:
-                node = result[0]
-                name = node.name
-                dvtype = node.typeClass
-
-                if dvtype.lower() == "compound":
-                    data[name] = self._process_compound(field.value, node)
-                else:
-                    data[name] = field.value
+            entry = index.get(field.typeName)
+
+            if entry is None:
+                data[field.typeName] = field.value
+            elif entry.type_class.lower() == "compound":
+                data[entry.name] = self._process_compound(
+                    field.value,
+                    entry.children or {},
+                )
             else:
-                name = field.typeName
-                data[name] = field.value
+                data[entry.name] = field.value
 
         return data
 
-    def _process_compound(self, compound, tree):
+    def _process_compound(self, compound, index: Dict[str, FieldIndexEntry]):
         """Processes given field value according to its 'multiple' state"""
 
         if isinstance(compound, list):
             return [
-                self._extract_data(list(entry.values()), tree) for entry in compound
+                self._extract_data(list(entry.values()), index) for entry in compound
             ]
 
-        return self._extract_data(compound.values(), tree)
+        return self._extract_data(compound.values(), index)
 
     # ! Importers
     def dataset_from_json(self, handler: IO) -> Dataset:
@@ -709,3 +1377,13 @@ class Dataverse(BaseModel):
                 name,
                 dataset.metadatablocks[name],
             )
+
+
+def _pid_to_dirname(pid: str) -> str:
+    """Turns a persistent identifier into a directory name.
+
+    Example:
+        'doi:10.18419/DARUS-1234' -> 'doi_10.18419_DARUS-1234'
+    """
+
+    return re.sub(r"[^\w.\-]", "_", pid)
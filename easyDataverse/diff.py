@@ -0,0 +1,191 @@
+import hashlib
+import json
+from collections import Counter
+from typing import Any, Dict, List
+
+from pydantic import BaseModel, Field
+
+
+class FieldSnapshot(BaseModel):
+    """Structural hashes of a metadata field and of each of its values."""
+
+    multiple: bool = Field(
+        ...,
+        description="Whether the field allows multiple values.",
+    )
+
+    hash: str = Field(
+        ...,
+        description="The structural hash of the value of the field.",
+    )
+
+    entry_hashes: List[str] = Field(
+        default_factory=list,
+        description="The structural hashes of the values of a field allowing multiple values.",
+    )
+
+    value: Any = Field(
+        default=None,
+        description="The value of the field, kept to delete removed values.",
+    )
+
+
+class MetadataSnapshot(BaseModel):
+    """Snapshot of the metadata fields of a dataset, keyed by their type name."""
+
+    fields: Dict[str, FieldSnapshot] = Field(
+        default_factory=dict,
+        description="The snapshots of all fields by their type name.",
+    )
+
+    @classmethod
+    def from_dataverse_dict(cls, dataverse_dict: Dict) -> "MetadataSnapshot":
+        """Takes a snapshot of the metadata of a dataset.
+
+        Args:
+            dataverse_dict (Dict): The result of 'Dataset.dataverse_dict'.
+
+        Returns:
+            MetadataSnapshot: The snapshot.
+        """
+
+        snapshot = {}
+
+        for name, field in _fields(dataverse_dict).items():
+            # Lists may be shared with the dataset, hence the value is copied
+            value = json.loads(json.dumps(field["value"], default=str))
+            snapshot[name] = FieldSnapshot(
+                multiple=field["multiple"],
+                hash=structural_hash(value),
+                entry_hashes=(
+                    [structural_hash(entry) for entry in value]
+                    if field["multiple"]
+                    else []
+                ),
+                value=value,
+            )
+
+        return cls(fields=snapshot)
+
+
+class MetadataDiff(BaseModel):
+    """Minimal changes to turn the remote metadata of a dataset into the local one."""
+
+    replace: List[Dict] = Field(
+        default_factory=list,
+        description="Fields whose value is replaced as a whole.",
+    )
+
+    add: List[Dict] = Field(
+        default_factory=list,
+        description="Values added to fields. Fields allowing multiple values keep their other values.",
+    )
+
+    delete: List[Dict] = Field(
+        default_factory=list,
+        description="Values removed from fields.",
+    )
+
+    @property
+    def is_empty(self) -> bool:
+        """Whether there are no changes."""
+
+        return not (self.replace or self.add or self.delete)
+
+
+def structural_hash(value: Any) -> str:
+    """Hashes a JSON compatible value independently of the order of dictionary keys."""
+
+    data = json.dumps(value, sort_keys=True, default=str, separators=(",", ":"))
+
+    return hashlib.sha1(data.encode()).hexdigest()
+
+
+def diff_metadata(snapshot: MetadataSnapshot, dataverse_dict: Dict) -> MetadataDiff:
+    """Compares the metadata of a dataset with a snapshot taken earlier.
+
+    Unchanged fields are recognized by their hash. Fields allowing multiple
+    values are compared per value, such that only added values are sent and
+    only removed values are deleted. Changing a single value of a large list
+    of compounds thus results in one deletion and one addition. If none of the
+    previous values is kept, the field is replaced as a whole instead, such
+    that required fields are never left empty. The order of values within a
+    field is not considered.
+
+    Args:
+        snapshot (MetadataSnapshot): Snapshot of the remote metadata.
+        dataverse_dict (Dict): The result of 'Dataset.dataverse_dict'.
+
+    Returns:
+        MetadataDiff: The changes to apply via the 'editMetadata' and 'deleteMetadata' endpoints.
+    """
+
+    diff = MetadataDiff()
+    current = _fields(dataverse_dict)
+
+    for name, field in current.items():
+        value = field["value"]
+        previous = snapshot.fields.get(name)
+
+        if previous is None:
+            diff.add.append(_wrap(name, value))
+            continue
+        elif previous.hash == structural_hash(value):
+            continue
+        elif not field["multiple"]:
+            diff.replace.append(_wrap(name, value))
+            continue
+
+        remaining = Counter(structural_hash(entry) for entry in value)
+        removed = []
+
+        for key, entry in zip(previous.entry_hashes, previous.value):
+            if remaining[key] > 0:
+                remaining[key] -= 1
+            else:
+                removed.append(entry)
+
+        if len(removed) == len(previous.value):
+            diff.replace.append(_wrap(name, value))
+            continue
+
+        added = [entry for entry in value if _take(remaining, structural_hash(entry))]
+
+        if removed:
+            diff.delete.append(_wrap(name, removed))
+        if added:
+            diff.add.append(_wrap(name, added))
+
+    for name, previous in snapshot.fields.items():
+        if name in current:
+            continue
+
+        diff.delete.append(_wrap(name, previous.value))
+
+    return diff
+
+
+def _fields(dataverse_dict: Dict) -> Dict[str, Dict]:
+    """Returns all metadata fields of a dataset by their type name."""
+
+    blocks = dataverse_dict["datasetVersion"]["metadataBlocks"]
+
+    return {
+        field["typeName"]: field
+        for block in blocks.values()
+        for field in block["fields"]
+    }
+
+
+def _take(counter: Counter, key: str) -> bool:
+    """Decrements the count of a key, if it is positive."""
+
+    if counter[key] > 0:
+        counter[key] -= 1
+        return True
+
+    return False
+
+
+def _wrap(name: str, value: Any) -> Dict:
+    return {"typeName": name, "value": value}
@@ -1,17 +1,52 @@
 import asyncio
+import heapq
+import json
 import os
 import re
-from typing import Dict, List
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
 
 import aiofiles
 import httpx
-import rich
 from dvuploader import File
+from dvuploader.checksum import Checksum
 from pyDataverse.api import DataAccessApi
-from rich.progress import Progress, TaskID
+
+from easyDataverse.bundle import (
+    BUNDLE_SIZE_LIMIT,
+    BundleError,
+    plan_bundles,
+    stream_bundle,
+)
+from easyDataverse.checksum import ALGORITHMS, new_hash
+from easyDataverse.fileindex import FileIndex
+from easyDataverse.progress import DownloadProgress, ProgressCallback
 
 CHUNK_SIZE = 10 * 1024**2  # 10 MB
-MAXIMUM_DISPLAYED_FILES = 40
+PART_SUFFIX = ".part"
+SEGMENTS_SUFFIX = ".segments"
+MAX_RETRIES = 5
+BACKOFF_BASE = 1.0  # seconds
+BACKOFF_MAX = 60.0  # seconds
+SEGMENT_THRESHOLD = 1024**3  # 1 GB
+SEGMENT_SIZE = 128 * 1024**2  # 128 MB
+
+# Orders in which files are downloaded:
+#   largest-first:  Workers take the largest remaining file from a shared queue
+#   smallest-first: Workers take the smallest remaining file from a shared queue
+#   lpt:            Files are assigned to workers upfront by longest-processing-time bin packing
+SCHEDULING_POLICIES = ("largest-first", "smallest-first", "lpt")
+
+
+class IncompleteDownloadError(Exception):
+    """Raised when a downloaded file does not have the expected size."""
+
+
+class ChecksumMismatchError(Exception):
+    """Raised when a downloaded file does not match its checksum."""
+
+
+class RangeNotSupportedError(Exception):
+    """Raised when the server does not answer a range request with partial content."""
 
 
 async def download_files(
@@ -20,159 +55,1086 @@ async def download_files(
     filedir: str,
     filenames: List[str],
     n_parallel_downloads: int,
+    client: Optional[httpx.AsyncClient] = None,
+    max_retries: int = MAX_RETRIES,
+    sync: bool = False,
+    segment_threshold: Optional[int] = SEGMENT_THRESHOLD,
+    segment_size: int = SEGMENT_SIZE,
+    policy: str = "largest-first",
+    max_bytes_in_flight: Optional[int] = None,
+    bundle: bool = False,
+    bundle_size_limit: int = BUNDLE_SIZE_LIMIT,
+    progress: str = "auto",
+    progress_callback: Optional[ProgressCallback] = None,
 ) -> List[File]:
-    """Downloads and adds all files given in the dataset to the Dataset-Object"""
+    """Downloads and adds all files given in the dataset to the Dataset-Object
+
+    If a client is given, its connection pool is reused and the number
+    of concurrent downloads is limited to 'n_parallel_downloads'. Failed
+    downloads are resumed up to 'max_retries' times.
+
+    If 'sync' is set, files that already exist in 'filedir' with the same size
+    and checksum as in the dataset are not downloaded again. Checksums of local
+    files are kept in a sidecar index to avoid hashing unchanged files again.
+
+    Files of at least 'segment_threshold' bytes are downloaded in segments of
+    'segment_size' bytes in parallel. Segments share the 'n_parallel_downloads'
+    budget with all other downloads. Pass None to disable segmented downloads.
+
+    Files are processed by 'n_parallel_downloads' workers in the order given by
+    'policy' (see 'SCHEDULING_POLICIES'). If 'max_bytes_in_flight' is set, a file
+    only starts once the sizes of all running downloads allow it, except when no
+    other download is running.
+
+    If 'bundle' is set, small files are fetched together as zip archives of at
+    most 'bundle_size_limit' bytes, which are extracted while they stream. Files
+    exceeding the limit, or missing from or corrupt in an archive, are downloaded
+    one by one instead.
+
+    Progress is displayed according to 'progress' (see 'PROGRESS_MODES'). If a
+    'progress_callback' is given, it receives a 'ProgressUpdate' whenever bytes
+    are written or a file completes.
+    """
+
+    if policy not in SCHEDULING_POLICIES:
+        raise ValueError(
+            f"Unknown scheduling policy '{policy}'. Choose one of {list(SCHEDULING_POLICIES)}."
+        )
+
+    if client is None:
+        limits = httpx.Limits(max_connections=n_parallel_downloads)
+        async with httpx.AsyncClient(
+            base_url=data_api.base_url,
+            limits=limits,
+        ) as client:
+            return await download_files(
+                data_api=data_api,
+                files_list=files_list,
+                filedir=filedir,
+                filenames=filenames,
+                n_parallel_downloads=n_parallel_downloads,
+                client=client,
+                max_retries=max_retries,
+                sync=sync,
+                segment_threshold=segment_threshold,
+                segment_size=segment_size,
+                policy=policy,
+                max_bytes_in_flight=max_bytes_in_flight,
+                bundle=bundle,
+                bundle_size_limit=bundle_size_limit,
+                progress=progress,
+                progress_callback=progress_callback,
+            )
 
     files_list = _filter_files(files_list, filenames)
-    progress, task_ids = setup_progress_bars(files=files_list)
-    over_threshold = len(files_list) > MAXIMUM_DISPLAYED_FILES
+    index = FileIndex.load(filedir) if sync else None
+
+    try:
+        return await _download_all(
+            data_api=data_api,
+            files_list=files_list,
+            filedir=filedir,
+            n_parallel_downloads=n_parallel_downloads,
+            client=client,
+            index=index,
+            max_retries=max_retries,
+            segment_threshold=segment_threshold,
+            segment_size=segment_size,
+            policy=policy,
+            max_bytes_in_flight=max_bytes_in_flight,
+            bundle=bundle,
+            bundle_size_limit=bundle_size_limit,
+            progress=progress,
+            progress_callback=progress_callback,
+        )
+    finally:
+        # Checksums computed while comparing local files are kept, even if
+        # nothing has been downloaded or a download failed
+        if index is not None and index.dirty:
+            index.save()
+
+
+async def _download_all(
+    data_api: DataAccessApi,
+    files_list: List[Dict],
+    filedir: str,
+    n_parallel_downloads: int,
+    client: httpx.AsyncClient,
+    index: Optional[FileIndex],
+    max_retries: int,
+    segment_threshold: Optional[int],
+    segment_size: int,
+    policy: str,
+    max_bytes_in_flight: Optional[int],
+    bundle: bool,
+    bundle_size_limit: int,
+    progress: str,
+    progress_callback: Optional[ProgressCallback],
+) -> List[File]:
+    """Downloads the given files, skipping unchanged local files if an index is given.
+
+    See 'download_files' for details on the arguments.
+    """
+
+    unchanged = []
+
+    if index is not None:
+        # Hashing local files must not block the event loop
+        files_list, unchanged = await asyncio.to_thread(
+            _partition_unchanged, files_list, filedir, index
+        )
+
+    tracker = DownloadProgress(files_list, mode=progress, callback=progress_callback)
 
     if len(files_list) == 0:
-        return []
+        return unchanged
 
     if data_api.api_token:
         headers = {"X-Dataverse-key": data_api.api_token}
     else:
         headers = {}
 
-    limits = httpx.Limits(max_connections=n_parallel_downloads)
-    timeout = httpx.Timeout(None)
-    async with httpx.AsyncClient(
-        base_url=data_api.base_url,
-        headers=headers,
-        timeout=timeout,
-        limits=limits,
-    ) as client:
-        with progress:
-            rich.print("\n[bold]Downloading files[/bold]\n")
-
-            tasks = [
-                _download_file(
-                    client=client,
-                    file=file,
-                    filedir=filedir,
-                    progress=progress,
-                    task_id=task_id,
-                    over_threshold=over_threshold,
-                )
-                for file, task_id in zip(files_list, task_ids)
-            ]
+    semaphore = asyncio.Semaphore(n_parallel_downloads)
+    results: Dict[int, File] = {}
+    remaining = list(range(len(files_list)))
+
+    async def download(index: int) -> File:
+        index = remaining[index]
+
+        return await _download_file(
+            client=client,
+            file=files_list[index],
+            filedir=filedir,
+            progress=tracker,
+            index=index,
+            headers=headers,
+            semaphore=semaphore,
+            max_retries=max_retries,
+            segment_threshold=segment_threshold,
+            segment_size=segment_size,
+        )
+
+    with tracker:
+        if bundle:
+            results = await _download_bundles(
+                client=client,
+                files=files_list,
+                filedir=filedir,
+                headers=headers,
+                semaphore=semaphore,
+                progress=tracker,
+                size_limit=bundle_size_limit,
+            )
+            remaining = [i for i in remaining if i not in results]
+
+        if remaining:
+            downloaded = await _run_scheduled(
+                files=[files_list[i] for i in remaining],
+                download=download,
+                n_workers=n_parallel_downloads,
+                policy=policy,
+                max_bytes_in_flight=max_bytes_in_flight,
+            )
+            results.update(zip(remaining, downloaded))
 
-            files = await asyncio.gather(*tasks)
+        files = [results[i] for i in range(len(files_list))]
 
-    rich.print("╰── [bold]✅ Done [/bold]\n")
+    if index is not None:
+        _record_downloaded(files_list, filedir, index)
 
-    return files
+    return unchanged + files
 
 
-def setup_progress_bars(
+async def _run_scheduled(
     files: List[Dict],
-):
+    download: Callable[[int], Awaitable[File]],
+    n_workers: int,
+    policy: str,
+    max_bytes_in_flight: Optional[int],
+) -> List[File]:
+    """Downloads files using a fixed number of workers.
+
+    Workers pull files from a bounded queue, such that the number of pending
+    coroutines does not grow with the number of files. With the 'lpt' policy,
+    each worker processes its own precomputed bin instead.
+
+    Args:
+        files (List[Dict]): The file metadata.
+        download (Callable[[int], Awaitable[File]]): Downloads the file at the given index.
+        n_workers (int): Number of workers.
+        policy (str): The scheduling policy.
+        max_bytes_in_flight (Optional[int]): Maximum number of bytes of files downloaded at once.
+
+    Returns:
+        List[File]: The downloaded files in the order of 'files'.
     """
-    Sets up progress bars for each file.
+
+    results: Dict[int, File] = {}
+    budget = _ByteBudget(max_bytes_in_flight)
+    n_workers = max(1, min(n_workers, len(files)))
+
+    async def run(index: int) -> None:
+        size = _filesize(files[index])
+
+        await budget.acquire(size)
+
+        try:
+            results[index] = await download(index)
+        finally:
+            await budget.release(size)
+
+    if policy == "lpt":
+
+        async def bin_worker(indices: List[int]) -> None:
+            for index in indices:
+                await run(index)
+
+        workers = [bin_worker(indices) for indices in _lpt_bins(files, n_workers)]
+    else:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=n_workers)
+
+        async def producer() -> None:
+            for index in _order_files(files, policy):
+                await queue.put(index)
+
+            for _ in range(n_workers):
+                await queue.put(None)
+
+        async def queue_worker() -> None:
+            while True:
+                index = await queue.get()
+
+                if index is None:
+                    return
+
+                await run(index)
+
+        workers = [producer()] + [queue_worker() for _ in range(n_workers)]
+
+    await _gather_or_cancel(workers)
+
+    return [results[index] for index in range(len(files))]
+
+
+async def _gather_or_cancel(coroutines: List[Awaitable]) -> None:
+    """Runs all coroutines and cancels the remaining ones if one fails."""
+
+    tasks = [asyncio.ensure_future(coroutine) for coroutine in coroutines]
+
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+def _order_files(files: List[Dict], policy: str) -> List[int]:
+    """Returns the indices of the files in the order given by the policy."""
+
+    return sorted(
+        range(len(files)),
+        key=lambda index: _filesize(files[index]),
+        reverse=policy == "largest-first",
+    )
+
+
+def _lpt_bins(files: List[Dict], n_bins: int) -> List[List[int]]:
+    """Assigns files to bins using longest-processing-time bin packing.
+
+    Files are taken by descending size and added to the bin with the smallest
+    total size, which approximately minimizes the size of the largest bin.
 
     Returns:
-        A list of progress bars, one for each file.
+        List[List[int]]: The indices of the files per bin.
     """
 
-    tasks = []
-    progress = Progress()
+    bins: List[List[int]] = [[] for _ in range(n_bins)]
+    loads = [(0, index) for index in range(n_bins)]
 
-    for file in files:
-        filename = file["dataFile"]["filename"]
-        filesize = file["dataFile"]["filesize"]
-        directory_label = file.get("directoryLabel", "")
-        filepath = os.path.join(directory_label, filename)
-
-        tasks.append(
-            setup_pbar(
-                fpath=filepath,
-                filesize=filesize,
-                progress=progress,
+    for index in _order_files(files, "largest-first"):
+        load, bin_index = heapq.heappop(loads)
+        bins[bin_index].append(index)
+        heapq.heappush(loads, (load + _filesize(files[index]), bin_index))
+
+    return bins
+
+
+def _filesize(file: Dict) -> int:
+    """Returns the size of a file as reported by Dataverse."""
+
+    return int(file["dataFile"].get("filesize") or 0)
+
+
+class _ByteBudget:
+    """Limits the total size of files that are downloaded at the same time."""
+
+    def __init__(self, limit: Optional[int]):
+        self.limit = limit
+        self.in_flight = 0
+        self._condition = asyncio.Condition()
+
+    async def acquire(self, size: int) -> None:
+        """Waits until a file of the given size fits into the budget.
+
+        A file that exceeds the limit on its own is started once nothing else
+        is in flight, such that it does not block the queue forever.
+        """
+
+        if self.limit is None:
+            return
+
+        async with self._condition:
+            await self._condition.wait_for(
+                lambda: self.in_flight == 0 or self.in_flight + size <= self.limit  # type: ignore
             )
-        )
+            self.in_flight += size
 
-    return progress, tasks
+    async def release(self, size: int) -> None:
+        """Returns the size of a finished file to the budget."""
 
+        if self.limit is None:
+            return
 
-def setup_pbar(
-    fpath: str,
-    filesize: int,
-    progress: Progress,
-) -> int:
+        async with self._condition:
+            self.in_flight -= size
+            self._condition.notify_all()
+
+
+async def _download_bundles(
+    client: httpx.AsyncClient,
+    files: List[Dict],
+    filedir: str,
+    headers: Dict[str, str],
+    semaphore: asyncio.Semaphore,
+    progress: DownloadProgress,
+    size_limit: int,
+) -> Dict[int, File]:
+    """Downloads files in zip bundles via the multi-file access endpoint.
+
+    Bundles are requested concurrently, each holding a slot of the semaphore.
+    Files whose checksum does not match are removed again. A failing bundle
+    only affects the files it has not extracted yet.
+
+    Returns:
+        Dict[int, File]: The extracted files by their index in 'files'.
     """
-    Set up a progress bar for a file.
 
-    Args:
-        fpath (str): The path to the file.
-        progress (Progress): The progress bar object.
+    results: Dict[int, File] = {}
+    index_of = {file["dataFile"]["id"]: i for i, file in enumerate(files)}
+    bundles, _ = plan_bundles(files, size_limit=size_limit)
+
+    async def fetch(members: List[Dict]) -> None:
+        by_name: Dict[str, int] = {}
+        targets: Dict[str, str] = {}
+        checksum_types: Dict[str, str] = {}
+
+        for file in members:
+            name = _zip_entry_name(file)
+            by_name[name] = index_of[file["dataFile"]["id"]]
+            targets[name] = _local_paths(file, filedir)[1]
+            checksum = _expected_checksum(file)
+
+            if checksum:
+                checksum_types[name] = checksum["type"]
+
+        def on_extracted(name: str, path: str, size: int, digest: Optional[str]):
+            index = by_name[name]
+            file = files[index]
+            checksum = _expected_checksum(file)
+
+            if checksum and digest.lower() != str(checksum["value"]).lower():  # type: ignore
+                os.remove(path)
+                return
+
+            progress.finish(index)
+            results[index] = File(
+                filepath=path,
+                file_id=str(file["dataFile"]["id"]),  # type: ignore
+                checksum=(
+                    Checksum(type=checksum["type"], value=digest) if checksum else None
+                ),
+                **file,
+            )
+
+        try:
+            async with semaphore:
+                await stream_bundle(
+                    client=client,
+                    files=members,
+                    targets=targets,
+                    headers=headers,
+                    checksum_types=checksum_types,
+                    on_extracted=on_extracted,
+                )
+        except (httpx.HTTPError, BundleError):
+            # Files not extracted so far are downloaded one by one
+            pass
+
+    # Zipping a single file has no benefit over downloading it directly
+    await _gather_or_cancel([fetch(members) for members in bundles if len(members) > 1])
+
+    return results
+
+
+def _zip_entry_name(file: Dict) -> str:
+    """Returns the name of a file within a zip bundle created by Dataverse."""
+
+    directory_label = file.get("directoryLabel", "")
+
+    if directory_label:
+        return f"{directory_label}/{file['dataFile']['filename']}"
+
+    return file["dataFile"]["filename"]
+
+
+def _partition_unchanged(
+    files: List[Dict],
+    filedir: str,
+    index: FileIndex,
+) -> Tuple[List[Dict], List[File]]:
+    """Splits files into those that need to be downloaded and unchanged local copies.
+
+    A local file is unchanged if its size and checksum match the dataset. Sizes
+    are compared first, such that only files of the same size are hashed. Files
+    without a usable checksum, e.g. ingested tabular files, are unchanged if
+    their size matches and they have not been modified since they were
+    downloaded and recorded in the index. Such files are thus downloaded once
+    before they are trusted.
 
     Returns:
-        int: The task ID of the progress bar.
+        Tuple[List[Dict], List[File]]: The files to download and the unchanged files.
     """
 
-    return progress.add_task(
-        f"[pink]  {fpath}",
-        total=filesize,
+    to_download = []
+    unchanged = []
+
+    for file in files:
+        rel_path, local_path = _local_paths(file, filedir)
+        checksum = _expected_checksum(file)
+        filesize = file["dataFile"].get("filesize")
+
+        if (
+            filesize is None
+            or not os.path.isfile(local_path)
+            or os.path.getsize(local_path) != int(filesize)
+        ):
+            to_download.append(file)
+        elif checksum:
+            digest = index.checksum(rel_path, checksum["type"]) or ""
+
+            if digest.lower() == str(checksum["value"]).lower():
+                unchanged.append(
+                    _local_file(file, local_path, checksum["type"], checksum["value"])
+                )
+            else:
+                to_download.append(file)
+        elif index.is_unchanged(rel_path):
+            unchanged.append(_local_file(file, local_path))
+        else:
+            to_download.append(file)
+
+    return to_download, unchanged
+
+
+def _local_file(
+    file: Dict,
+    local_path: str,
+    checksum_type: Optional[str] = None,
+    checksum: Optional[str] = None,
+) -> File:
+    """Creates the file object of an unchanged local file."""
+
+    return File(
+        filepath=local_path,
+        file_id=str(file["dataFile"]["id"]),  # type: ignore
+        checksum=(
+            Checksum(type=checksum_type, value=checksum) if checksum_type else None
+        ),
+        **file,
     )
 
 
+def _record_downloaded(files: List[Dict], filedir: str, index: FileIndex) -> None:
+    """Records the checksums reported by Dataverse for downloaded files in the index.
+
+    Files without a usable checksum are recorded by their size and modification time.
+    """
+
+    for file in files:
+        checksum = _expected_checksum(file)
+        rel_path, _ = _local_paths(file, filedir)
+
+        if checksum:
+            index.record(rel_path, checksum["type"], checksum["value"])
+        else:
+            index.record(rel_path)
+
+
+def _expected_checksum(file: Dict) -> Optional[Dict]:
+    """Returns the checksum the downloaded bytes of a file are expected to match.
+
+    Ingested tabular files are served in their archival format, whereas their
+    checksum refers to the original upload. Hence, these are not verified.
+    """
+
+    data_file = file["dataFile"]
+    checksum = data_file.get("checksum")
+
+    if not checksum or "originalFileFormat" in data_file:
+        return None
+    elif str(checksum.get("type", "")).upper() not in ALGORITHMS:
+        return None
+
+    return checksum
+
+
+def _local_paths(file: Dict, filedir: str) -> Tuple[str, str]:
+    """Returns the path of a file relative to 'filedir' and its local path."""
+
+    dv_path = os.path.join(file.get("directoryLabel", ""), file["dataFile"]["filename"])
+
+    if filedir:
+        return dv_path, os.path.join(filedir, dv_path)
+
+    return dv_path, dv_path
+
+
 async def _download_file(
     client: httpx.AsyncClient,
     file: Dict,
     filedir: str,
-    progress: Progress,
-    task_id: TaskID,
-    over_threshold: bool,
+    progress: DownloadProgress,
+    index: int,
+    headers: Optional[Dict[str, str]] = None,
+    semaphore: Optional[asyncio.Semaphore] = None,
+    max_retries: int = MAX_RETRIES,
+    segment_threshold: Optional[int] = None,
+    segment_size: int = SEGMENT_SIZE,
 ):
     """
     Downloads a file from a given URL using the provided client and saves it to the specified directory.
 
+    The file is written to a temporary '.part' file first, which is renamed once
+    the download is complete. If the download fails due to a connection error,
+    a server error or an incomplete transfer, it is retried with exponential
+    backoff and resumed from the bytes already written.
+
     Args:
         client (httpx.AsyncClient): The httpx async client to use for the download.
         file (Dict): The file metadata dictionary.
         filedir (str): The directory to save the downloaded file.
-        progress (Progress): The progress object to track the download progress.
-        task_id (TaskID): The ID of the task associated with the download.
-        over_threshold (bool): Indicates whether the download progress is over the threshold.
+        progress (DownloadProgress): Tracks the progress of all files of the download.
+        index (int): The index of the file within the progress.
+        headers (Optional[Dict[str, str]]): Headers to send with the request, e.g. for authentication.
+        semaphore (Optional[asyncio.Semaphore]): Semaphore limiting the number of concurrent downloads.
+        max_retries (int): Maximum number of retries after a failed attempt.
+        segment_threshold (Optional[int]): Minimum size in bytes to download a file in segments.
+        segment_size (int): Size in bytes of each segment.
+
+    Raises:
+        httpx.HTTPError: If the download fails and cannot be retried.
+        IncompleteDownloadError: If the file is incomplete after all retries.
+        ChecksumMismatchError: If the file does not match its checksum after all retries.
 
     Returns:
         File: The downloaded file object with the file path, file ID, and other metadata.
     """
 
     # Get file metadata
-    filename = file["dataFile"]["filename"]
     file_id = file["dataFile"]["id"]
-    directory_label = file.get("directoryLabel", "")
-    dv_path = os.path.join(directory_label, filename)
+    filesize = file["dataFile"].get("filesize")
+    _, local_path = _local_paths(file, filedir)
+    part_path = local_path + PART_SUFFIX
+    url = f"/api/access/datafile/{file_id}"
 
-    if filedir:
-        local_path = os.path.join(filedir, dv_path)
-    else:
-        local_path = dv_path
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(1)
 
-    url = f"/api/access/datafile/{file_id}"
+    os.makedirs(os.path.dirname(local_path) or ".", exist_ok=True)
 
-    async with client.stream("GET", url, follow_redirects=True) as response:
-        response.raise_for_status()
-        os.makedirs(os.path.dirname(local_path), exist_ok=True)
+    checksum = _expected_checksum(file)
 
-        async with aiofiles.open(local_path, "wb") as f:
-            async for chunk in response.aiter_bytes(chunk_size=CHUNK_SIZE):
-                progress.advance(task_id, advance=len(chunk))
+    kwargs = dict(
+        client=client,
+        url=url,
+        part_path=part_path,
+        filesize=filesize,
+        checksum=checksum,
+        headers=headers,
+        progress=progress,
+        index=index,
+        semaphore=semaphore,
+        max_retries=max_retries,
+    )
 
-                if over_threshold:
-                    progress.update(task_id, visible=False)
+    segmented = (
+        segment_threshold is not None
+        and filesize is not None
+        and int(filesize) >= segment_threshold
+    )
 
-                await f.write(chunk)
+    if segmented:
+        try:
+            digest = await _download_segmented(segment_size=segment_size, **kwargs)
+        except RangeNotSupportedError:
+            _SegmentState.discard(part_path)
+            digest = await _download_single(**kwargs)
+    else:
+        # A segmented '.part' file has gaps and cannot be resumed as a stream
+        if os.path.exists(part_path + SEGMENTS_SUFFIX):
+            _SegmentState.discard(part_path)
+
+        digest = await _download_single(**kwargs)
+
+    os.replace(part_path, local_path)
+    progress.finish(index)
+
+    if checksum:
+        file_checksum = Checksum(type=checksum["type"], value=digest)
+    else:
+        file_checksum = None
 
     return File(
         filepath=local_path,
         file_id=str(file_id),  # type: ignore
+        checksum=file_checksum,
         **file,
     )
 
 
+async def _download_single(
+    semaphore: asyncio.Semaphore,
+    max_retries: int,
+    **kwargs,
+) -> Optional[str]:
+    """Downloads a file in a single stream, resuming it on retries.
+
+    Returns:
+        Optional[str]: The hex digest of the file, if a checksum is given.
+    """
+
+    for attempt in range(max_retries + 1):
+        try:
+            async with semaphore:
+                return await _stream_to_part(**kwargs)
+        except Exception as e:
+            if attempt == max_retries or not _is_retryable(e):
+                raise
+
+            await asyncio.sleep(_backoff(attempt))
+
+
+async def _download_segmented(
+    client: httpx.AsyncClient,
+    url: str,
+    part_path: str,
+    filesize: int,
+    checksum: Optional[Dict],
+    headers: Optional[Dict[str, str]],
+    progress: DownloadProgress,
+    index: int,
+    semaphore: asyncio.Semaphore,
+    max_retries: int,
+    segment_size: int,
+) -> Optional[str]:
+    """Downloads a file in parallel segments into a preallocated '.part' file.
+
+    Each segment is written at its offset and retried on its own. Completed
+    segments are recorded in a sidecar file next to the '.part' file, such that
+    an interrupted download only fetches the missing segments when it is
+    started again. Since segments complete out of order, the checksum is
+    verified once the file is assembled.
+
+    Raises:
+        RangeNotSupportedError: If the server does not support range requests.
+        ChecksumMismatchError: If the file does not match its checksum after all retries.
+
+    Returns:
+        Optional[str]: The hex digest of the file, if a checksum is given.
+    """
+
+    filesize = int(filesize)
+    segments = [
+        (start, min(start + segment_size, filesize))
+        for start in range(0, filesize, segment_size)
+    ]
+
+    for attempt in range(max_retries + 1):
+        state = _SegmentState.open(part_path, filesize, segment_size)
+        progress.reset(
+            index,
+            sum(end - start for start, end in segments if start in state.done),
+        )
+
+        tasks = [
+            asyncio.ensure_future(
+                _download_segment(
+                    client=client,
+                    url=url,
+                    part_path=part_path,
+                    start=start,
+                    end=end,
+                    headers=headers,
+                    progress=progress,
+                    index=index,
+                    semaphore=semaphore,
+                    max_retries=max_retries,
+                    on_complete=state.complete,
+                )
+            )
+            for start, end in segments
+            if start not in state.done
+        ]
+
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            # The '.part' file and its completed segments are kept for resuming
+            for task in tasks:
+                task.cancel()
+
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+        if checksum is None:
+            state.remove()
+            return None
+
+        hasher = new_hash(checksum["type"])
+        await asyncio.to_thread(_hash_file, hasher, part_path)
+
+        try:
+            digest = _verify_checksum(part_path, hasher, checksum)
+        except ChecksumMismatchError:
+            state.remove()
+
+            if attempt == max_retries:
+                raise
+
+            await asyncio.sleep(_backoff(attempt))
+        else:
+            state.remove()
+            return digest
+
+
+class _SegmentState:
+    """Tracks the completed segments of a '.part' file in a sidecar file."""
+
+    def __init__(
+        self,
+        part_path: str,
+        filesize: int,
+        segment_size: int,
+        done: Set[int],
+    ):
+        self.part_path = part_path
+        self.filesize = filesize
+        self.segment_size = segment_size
+        self.done = done
+
+    @property
+    def path(self) -> str:
+        return self.part_path + SEGMENTS_SUFFIX
+
+    @classmethod
+    def open(
+        cls,
+        part_path: str,
+        filesize: int,
+        segment_size: int,
+    ) -> "_SegmentState":
+        """Loads the completed segments and prepares the '.part' file for writing.
+
+        A '.part' file without a sidecar has been written as a single stream,
+        hence all segments within its size are complete. If the sidecar refers
+        to a different size or segmentation, the download starts over.
+        """
+
+        done: Set[int] = set()
+        part_size = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+        recorded = cls._load(part_path + SEGMENTS_SUFFIX)
+
+        if recorded is not None:
+            if (
+                recorded.get("filesize") == filesize
+                and recorded.get("segment_size") == segment_size
+                and part_size == filesize
+            ):
+                done = set(recorded.get("done", []))
+            else:
+                part_size = 0
+        elif part_size > filesize:
+            part_size = 0
+        else:
+            done = {
+                start
+                for start in range(0, filesize, segment_size)
+                if min(start + segment_size, filesize) <= part_size
+            }
+
+        state = cls(part_path, filesize, segment_size, done)
+        state._save()
+
+        with open(part_path, "r+b" if part_size > 0 else "wb") as f:
+            f.truncate(filesize)
+
+        return state
+
+    def complete(self, start: int) -> None:
+        """Records a segment as complete."""
+
+        self.done.add(start)
+        self._save()
+
+    def remove(self) -> None:
+        """Removes the sidecar file."""
+
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    @staticmethod
+    def discard(part_path: str) -> None:
+        """Removes a '.part' file and its sidecar file."""
+
+        for path in (part_path, part_path + SEGMENTS_SUFFIX):
+            if os.path.exists(path):
+                os.remove(path)
+
+    @staticmethod
+    def _load(path: str) -> Optional[Dict]:
+        if not os.path.isfile(path):
+            return None
+
+        try:
+            with open(path, "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save(self) -> None:
+        """Writes the sidecar file atomically."""
+
+        tmp_path = self.path + ".tmp"
+
+        with open(tmp_path, "w") as f:
+            json.dump(
+                {
+                    "filesize": self.filesize,
+                    "segment_size": self.segment_size,
+                    "done": sorted(self.done),
+                },
+                f,
+            )
+
+        os.replace(tmp_path, self.path)
+
+
+async def _download_segment(
+    client: httpx.AsyncClient,
+    url: str,
+    part_path: str,
+    start: int,
+    end: int,
+    headers: Optional[Dict[str, str]],
+    progress: DownloadProgress,
+    index: int,
+    semaphore: asyncio.Semaphore,
+    max_retries: int,
+    on_complete: Optional[Callable[[int], None]] = None,
+) -> None:
+    """Downloads the bytes from 'start' up to 'end' (exclusive) of a file.
+
+    Once the segment is written, 'on_complete' is called with its start.
+
+    Raises:
+        RangeNotSupportedError: If the server does not support range requests.
+        IncompleteDownloadError: If the segment is incomplete after all retries.
+    """
+
+    position = start
+
+    for attempt in range(max_retries + 1):
+        try:
+            async with semaphore, client.stream(
+                "GET",
+                url,
+                headers={**(headers or {}), "Range": f"bytes={position}-{end - 1}"},
+                timeout=httpx.Timeout(None),
+                follow_redirects=True,
+            ) as response:
+                response.raise_for_status()
+
+                if response.status_code != 206:
+                    raise RangeNotSupportedError(
+                        f"Server does not support range requests for '{url}'."
+                    )
+
+                async with aiofiles.open(part_path, "r+b") as f:
+                    await f.seek(position)
+
+                    async for chunk in response.aiter_bytes(chunk_size=CHUNK_SIZE):
+                        chunk = chunk[: end - position]
+
+                        await f.write(chunk)
+                        position += len(chunk)
+                        progress.advance(index, len(chunk))
+
+            if position != end:
+                raise IncompleteDownloadError(
+                    f"Expected bytes {start}-{end - 1} of '{part_path}', but received up to {position - 1}."
+                )
+
+            if on_complete is not None:
+                on_complete(start)
+
+            return
+        except Exception as e:
+            if attempt == max_retries or not _is_retryable(e):
+                raise
+
+            await asyncio.sleep(_backoff(attempt))
+
+
+async def _stream_to_part(
+    client: httpx.AsyncClient,
+    url: str,
+    part_path: str,
+    filesize: Optional[int],
+    headers: Optional[Dict[str, str]],
+    progress: DownloadProgress,
+    index: int,
+    checksum: Optional[Dict] = None,
+) -> Optional[str]:
+    """
+    Streams a file into its '.part' file, resuming from the bytes already written.
+
+    If a checksum is given, the digest is computed while the bytes stream.
+    When resuming, the bytes already written are hashed first.
+
+    Raises:
+        IncompleteDownloadError: If the size of the written file does not match 'filesize'.
+        ChecksumMismatchError: If the digest does not match the checksum.
+
+    Returns:
+        Optional[str]: The hex digest of the file, if a checksum is given.
+    """
+
+    offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+    hasher = new_hash(checksum["type"]) if checksum else None
+
+    if offset > 0 and hasher is not None:
+        await asyncio.to_thread(_hash_file, hasher, part_path)
+
+    if filesize is not None and offset == int(filesize):
+        return _verify_checksum(part_path, hasher, checksum)
+
+    request_headers = dict(headers or {})
+
+    if offset > 0:
+        request_headers["Range"] = f"bytes={offset}-"
+
+    async with client.stream(
+        "GET",
+        url,
+        headers=request_headers,
+        timeout=httpx.Timeout(None),
+        follow_redirects=True,
+    ) as response:
+        if response.status_code == 416:
+            # The partial file does not fit the remote file, start over
+            os.remove(part_path)
+            raise IncompleteDownloadError(f"Cannot resume '{part_path}'.")
+
+        response.raise_for_status()
+
+        if response.status_code != 206 and offset > 0:
+            # Server ignored the range, hence the file is sent from the start
+            offset = 0
+            hasher = new_hash(checksum["type"]) if checksum else None
+
+        progress.reset(index, offset)
+
+        async with aiofiles.open(part_path, "ab" if offset else "wb") as f:
+            async for chunk in response.aiter_bytes(chunk_size=CHUNK_SIZE):
+                progress.advance(index, len(chunk))
+
+                if hasher is not None:
+                    hasher.update(chunk)
+
+                await f.write(chunk)
+
+    written = os.path.getsize(part_path)
+
+    if filesize is not None and written != int(filesize):
+        raise IncompleteDownloadError(
+            f"Expected {filesize} bytes for '{part_path}', but received {written} bytes."
+        )
+
+    return _verify_checksum(part_path, hasher, checksum)
+
+
+def _hash_file(hasher: Any, path: str) -> None:
+    """Feeds the content of a file into a hasher."""
+
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            hasher.update(chunk)
+
+
+def _verify_checksum(
+    part_path: str,
+    hasher: Any,
+    checksum: Optional[Dict],
+) -> Optional[str]:
+    """Compares the digest of a downloaded file with its expected checksum.
+
+    A corrupt file is removed, such that a retry starts from the beginning.
+
+    Raises:
+        ChecksumMismatchError: If the digest does not match the checksum.
+
+    Returns:
+        Optional[str]: The hex digest, if a checksum is given.
+    """
+
+    if hasher is None or checksum is None:
+        return None
+
+    digest = hasher.hexdigest()
+
+    if digest.lower() != str(checksum["value"]).lower():
+        os.remove(part_path)
+        raise ChecksumMismatchError(
+            f"{checksum['type']} checksum of '{part_path}' is {digest}, expected {checksum['value']}."
+        )
+
+    return digest
+
+
+def _is_retryable(error: Exception) -> bool:
+    """Checks whether a failed download should be retried."""
+
+    if isinstance(
+        error,
+        (httpx.TransportError, IncompleteDownloadError, ChecksumMismatchError),
+    ):
+        return True
+    elif isinstance(error, httpx.HTTPStatusError):
+        status = error.response.status_code
+        return status == 429 or status >= 500
+
+    return False
+
+
+def _backoff(attempt: int) -> float:
+    """Returns the delay in seconds before the next attempt."""
+
+    return min(BACKOFF_MAX, BACKOFF_BASE * 2**attempt)
+
+
 def _filter_files(files: List[Dict], filenames: List[str]) -> List[Dict]:
     """Filters a list of files by filenames
 
@@ -184,9 +1146,6 @@ def _filter_files(files: List[Dict], filenames: List[str]) -> List[Dict]:
         List[Dict]: The filtered list of files.
     """
 
-    # Sort files by size
-    files = sorted(files, key=lambda x: int(x["dataFile"]["filesize"]))
-
     if len(filenames) == 0:
         return files
 
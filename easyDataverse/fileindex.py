@@ -0,0 +1,178 @@
+import json
+import os
+from typing import Dict, Optional
+
+from pydantic import BaseModel, Field, PrivateAttr
+
+from easyDataverse.checksum import file_checksum
+
+INDEX_FILENAME = ".easydataverse-index.json"
+
+
+class IndexEntry(BaseModel):
+    """State of a local file at the time its checksum was computed.
+
+    Files without a usable remote checksum are recorded without a checksum.
+    """
+
+    size: int
+    mtime_ns: int
+    checksum_type: Optional[str] = None
+    checksum: Optional[str] = None
+
+
+class FileIndex(BaseModel):
+    """
+    Sidecar index of the checksums of downloaded files.
+
+    The index is stored next to the files and maps their path relative to
+    the download directory to their size, modification time and checksum.
+    As long as size and modification time are unchanged, the stored checksum
+    is reused instead of hashing the file again.
+    """
+
+    directory: str = Field(
+        ...,
+        description="The directory containing the files and the index.",
+    )
+
+    entries: Dict[str, IndexEntry] = Field(
+        default_factory=dict,
+        description="Mapping of relative file paths to their index entries.",
+    )
+
+    _dirty: bool = PrivateAttr(default=False)
+
+    @property
+    def dirty(self) -> bool:
+        """Whether the index has entries that have not been saved yet."""
+
+        return self._dirty
+
+    @classmethod
+    def load(cls, directory: str) -> "FileIndex":
+        """Loads the index of a directory or creates an empty one.
+
+        Args:
+            directory (str): The download directory.
+
+        Returns:
+            FileIndex: The index of the directory.
+        """
+
+        path = os.path.join(directory, INDEX_FILENAME)
+
+        try:
+            with open(path, "r") as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            entries = {}
+
+        try:
+            return cls(directory=directory, entries=entries)
+        except ValueError:
+            return cls(directory=directory)
+
+    def save(self) -> str:
+        """Writes the index atomically to its directory.
+
+        Returns:
+            str: The path to the index file.
+        """
+
+        os.makedirs(self.directory, exist_ok=True)
+
+        path = os.path.join(self.directory, INDEX_FILENAME)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+
+        with open(tmp_path, "w") as f:
+            json.dump(
+                {key: entry.model_dump() for key, entry in self.entries.items()},
+                f,
+                indent=2,
+            )
+
+        os.replace(tmp_path, path)
+        self._dirty = False
+
+        return path
+
+    def checksum(self, rel_path: str, checksum_type: str) -> Optional[str]:
+        """Returns the checksum of a local file, using the index if possible.
+
+        Args:
+            rel_path (str): Path of the file relative to the directory.
+            checksum_type (str): The checksum type, e.g. 'MD5' or 'SHA-256'.
+
+        Returns:
+            Optional[str]: The checksum or None, if the file does not exist.
+        """
+
+        path = os.path.join(self.directory, rel_path)
+
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+
+        entry = self.entries.get(rel_path)
+
+        if (
+            entry is not None
+            and entry.size == stat.st_size
+            and entry.mtime_ns == stat.st_mtime_ns
+            and entry.checksum_type == checksum_type
+        ):
+            return entry.checksum  # type: ignore
+
+        checksum = file_checksum(path, checksum_type)
+        self.record(rel_path, checksum_type, checksum)
+
+        return checksum
+
+    def is_unchanged(self, rel_path: str) -> bool:
+        """Checks whether a local file still has the size and modification time it was recorded with.
+
+        Args:
+            rel_path (str): Path of the file relative to the directory.
+
+        Returns:
+            bool: True if the file is recorded and unchanged, False otherwise.
+        """
+
+        entry = self.entries.get(rel_path)
+
+        try:
+            stat = os.stat(os.path.join(self.directory, rel_path))
+        except OSError:
+            return False
+
+        return (
+            entry is not None
+            and entry.size == stat.st_size
+            and entry.mtime_ns == stat.st_mtime_ns
+        )
+
+    def record(
+        self,
+        rel_path: str,
+        checksum_type: Optional[str] = None,
+        checksum: Optional[str] = None,
+    ) -> None:
+        """Records the checksum of a local file in its current state.
+
+        Args:
+            rel_path (str): Path of the file relative to the directory.
+            checksum_type (Optional[str]): The checksum type, e.g. 'MD5' or 'SHA-256'.
+            checksum (Optional[str]): The checksum of the file, if known.
+        """
+
+        stat = os.stat(os.path.join(self.directory, rel_path))
+
+        self.entries[rel_path] = IndexEntry(
+            size=stat.st_size,
+            mtime_ns=stat.st_mtime_ns,
+            checksum_type=checksum_type,
+            checksum=checksum,
+        )
+        self._dirty = True
@@ -0,0 +1,199 @@
+import os
+from typing import Dict, List, Literal, Optional
+
+from dvuploader import File
+from pydantic import BaseModel, ConfigDict, Field
+from rich.console import Console
+from rich.table import Table
+
+from easyDataverse.checksum import ALGORITHMS, file_checksum
+
+MAXIMUM_DISPLAYED_OPERATIONS = 50
+
+
+class FileState(BaseModel):
+    """State of a file of a dataset at the time it was loaded or uploaded."""
+
+    filepath: str = Field(
+        ...,
+        description="The absolute local path of the file.",
+    )
+
+    size: int = Field(
+        ...,
+        description="The size of the local file in bytes.",
+    )
+
+    mtime_ns: int = Field(
+        ...,
+        description="The modification time of the local file in nanoseconds.",
+    )
+
+    checksum_type: Optional[str] = Field(
+        default=None,
+        description="The type of the checksum of the remote file.",
+    )
+
+    checksum: Optional[str] = Field(
+        default=None,
+        description="The checksum of the remote file.",
+    )
+
+    @classmethod
+    def from_file(cls, file: File, with_checksum: bool = True) -> "FileState":
+        """Captures the state of a local file.
+
+        Args:
+            file (File): The file.
+            with_checksum (bool, optional): Whether to keep the checksum of the file, which must
+                refer to the remote file. Defaults to True.
+
+        Returns:
+            FileState: The state of the file.
+        """
+
+        filepath = os.path.abspath(file.filepath)
+        stat = os.stat(filepath)
+        checksum = file.checksum if with_checksum else None
+
+        return cls(
+            filepath=filepath,
+            size=stat.st_size,
+            mtime_ns=stat.st_mtime_ns,
+            checksum_type=checksum.type if checksum and checksum.value else None,
+            checksum=checksum.value if checksum and checksum.value else None,
+        )
+
+
+class FileOperation(BaseModel):
+    """A planned operation on a file of a dataset."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    action: Literal["upload", "replace", "skip"] = Field(
+        ...,
+        description="Whether the file is uploaded, replaces its remote version or is skipped.",
+    )
+
+    path: str = Field(
+        ...,
+        description="The path of the file within the dataset.",
+    )
+
+    file: File = Field(
+        ...,
+        description="The file the operation refers to.",
+    )
+
+
+class FilePlan(BaseModel):
+    """The file operations required to synchronize a dataset with its remote version."""
+
+    operations: List[FileOperation] = Field(
+        default_factory=list,
+        description="The planned operations, one per file of the dataset.",
+    )
+
+    @property
+    def to_upload(self) -> List[File]:
+        """The files that are uploaded, either as new files or as replacements."""
+
+        return [op.file for op in self.operations if op.action != "skip"]
+
+    def count(self, action: str) -> int:
+        """Returns the number of operations of the given action."""
+
+        return sum(op.action == action for op in self.operations)
+
+    def print(self) -> None:
+        """Prints the planned operations, summarized for many files."""
+
+        table = Table(
+            title="[bold white]🔎 Planned file operations",
+            title_justify="left",
+        )
+
+        if len(self.operations) > MAXIMUM_DISPLAYED_OPERATIONS:
+            for action in ("upload", "replace", "skip"):
+                table.add_column(action.capitalize(), no_wrap=True)
+
+            table.add_row(*(str(self.count(a)) for a in ("upload", "replace", "skip")))
+        else:
+            table.add_column("File", style="cyan", no_wrap=True)
+            table.add_column("Action")
+
+            for op in self.operations:
+                table.add_row(op.path, _ACTION_STYLES[op.action])
+
+        Console().print(table)
+
+
+_ACTION_STYLES = {
+    "upload": "[spring_green3]Upload",
+    "replace": "[bright_cyan]Replace",
+    "skip": "[bright_black]Unchanged",
+}
+
+
+def dataset_path(file: File) -> str:
+    """Returns the path of a file within the dataset."""
+
+    filename = file.file_name or os.path.basename(file.filepath)
+
+    return os.path.join(file.directory_label or "", filename)
+
+
+def plan_file_updates(files: List[File], states: Dict[str, FileState]) -> FilePlan:
+    """Plans which files need to be uploaded to update a dataset.
+
+    Files without a recorded state are new. Files with a recorded state are
+    unchanged if their local size and modification time are unchanged. Otherwise,
+    files of the same size are hashed and compared to the remote checksum, such
+    that only modified files replace their remote version.
+
+    Args:
+        files (List[File]): The files of the dataset.
+        states (Dict[str, FileState]): The recorded states by path within the dataset.
+
+    Returns:
+        FilePlan: The planned operations.
+    """
+
+    operations = []
+
+    for file in files:
+        path = dataset_path(file)
+        state = states.get(path)
+
+        if state is None:
+            action = "upload"
+        elif _is_unchanged(file, state):
+            action = "skip"
+        else:
+            action = "replace"
+
+        operations.append(FileOperation(action=action, path=path, file=file))
+
+    return FilePlan(operations=operations)
+
+
+def _is_unchanged(file: File, state: FileState) -> bool:
+    """Checks whether a local file still matches its recorded state."""
+
+    filepath = os.path.abspath(file.filepath)
+
+    if not os.path.isfile(filepath):
+        return False
+
+    stat = os.stat(filepath)
+
+    if stat.st_size != state.size:
+        return False
+    elif filepath == state.filepath and stat.st_mtime_ns == state.mtime_ns:
+        return True
+    elif state.checksum is None or str(state.checksum_type).upper() not in ALGORITHMS:
+        return False
+
+    digest = file_checksum(filepath, state.checksum_type)  # type: ignore
+
+    return digest.lower() == state.checksum.lower()
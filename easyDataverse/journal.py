@@ -0,0 +1,188 @@
+import json
+import os
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from dvuploader import File
+from pydantic import BaseModel, Field, PrivateAttr
+
+from easyDataverse.diff import structural_hash
+from easyDataverse.filestate import dataset_path
+
+
+class UploadJournal(BaseModel):
+    """
+    Append-only journal of dataset creations and completed file uploads.
+
+    Each event is appended as a single JSON line and flushed to disk, such that
+    an interrupted upload leaves a journal of everything that has completed.
+    Uploading the same datasets again with the same journal skips datasets that
+    have been created and files that have been uploaded before. Files are
+    recorded once their upload batch has completed, hence the files of an
+    interrupted batch are uploaded again. Datasets are recognized by their
+    metadata and target collection, and by their position when uploaded as a
+    batch, hence the metadata and the order of the batch must not change
+    between the interrupted and the resumed upload.
+    """
+
+    path: str = Field(
+        ...,
+        description="The path of the JSONL file the journal is written to.",
+    )
+
+    _pids: Dict[str, str] = PrivateAttr(default_factory=dict)
+    _uploaded: Dict[str, Dict[str, Tuple[int, int]]] = PrivateAttr(
+        default_factory=dict
+    )
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _needs_newline: bool = PrivateAttr(default=False)
+
+    def model_post_init(self, __context) -> None:
+        if os.path.isfile(self.path):
+            self._load()
+
+    def dataset(
+        self,
+        json_data: str,
+        collection: str,
+        position: Optional[int] = None,
+    ) -> "DatasetJournal":
+        """Returns the journal of a single dataset.
+
+        Args:
+            json_data (str): JSON representation of the dataset.
+            collection (str): Name of the collection the dataset is created in.
+            position (Optional[int], optional): Position of the dataset within a batch, such that datasets with identical metadata are kept apart. Defaults to None.
+
+        Returns:
+            DatasetJournal: The journal of the dataset.
+        """
+
+        identity = [collection, json.loads(json_data)]
+
+        if position is not None:
+            identity.append(position)
+
+        key = structural_hash(identity)
+
+        return DatasetJournal(journal=self, key=key)
+
+    def pid(self, key: str) -> Optional[str]:
+        """Returns the identifier of a created dataset, if it has been recorded."""
+
+        return self._pids.get(key)
+
+    def is_uploaded(self, key: str, file: File) -> bool:
+        """Checks whether a file has been uploaded and not been modified since."""
+
+        state = self._uploaded.get(key, {}).get(dataset_path(file))
+
+        return state is not None and state == _file_state(file)
+
+    def record_created(self, key: str, pid: str) -> None:
+        """Records the creation of a dataset."""
+
+        self._append([{"event": "created", "key": key, "pid": pid}])
+        self._pids[key] = pid
+
+    def record_uploaded(self, key: str, files: List[File]) -> None:
+        """Records the completed upload of files."""
+
+        events = []
+
+        for file in files:
+            size, mtime_ns = _file_state(file)
+            events.append(
+                {
+                    "event": "uploaded",
+                    "key": key,
+                    "path": dataset_path(file),
+                    "size": size,
+                    "mtime_ns": mtime_ns,
+                }
+            )
+
+        self._append(events)
+
+        for event in events:
+            self._apply(event)
+
+    def _load(self) -> None:
+        """Replays the events of an existing journal."""
+
+        with open(self.path, "r") as f:
+            content = f.read()
+
+        for line in content.splitlines():
+            try:
+                self._apply(json.loads(line))
+            except (ValueError, KeyError):
+                # Partially written line of an interrupted upload
+                continue
+
+        self._needs_newline = bool(content) and not content.endswith("\n")
+
+    def _apply(self, event: Dict) -> None:
+        if event["event"] == "created":
+            self._pids[event["key"]] = event["pid"]
+        elif event["event"] == "uploaded":
+            uploaded = self._uploaded.setdefault(event["key"], {})
+            uploaded[event["path"]] = (event["size"], event["mtime_ns"])
+
+    def _append(self, events: List[Dict]) -> None:
+        """Appends events to the journal and flushes them to disk."""
+
+        lines = "".join(json.dumps(event) + "\n" for event in events)
+
+        with self._lock:
+            if self._needs_newline:
+                lines = "\n" + lines
+                self._needs_newline = False
+
+            with open(self.path, "a") as f:
+                f.write(lines)
+                f.flush()
+                os.fsync(f.fileno())
+
+
+class DatasetJournal(BaseModel):
+    """The part of an 'UploadJournal' that refers to a single dataset."""
+
+    journal: UploadJournal = Field(
+        ...,
+        description="The journal events are recorded in.",
+    )
+
+    key: str = Field(
+        ...,
+        description="The key identifying the dataset within the journal.",
+    )
+
+    @property
+    def pid(self) -> Optional[str]:
+        """The identifier of the dataset, if its creation has been recorded."""
+
+        return self.journal.pid(self.key)
+
+    def pending(self, files: List[File]) -> List[File]:
+        """Returns the files that have not been uploaded yet."""
+
+        return [file for file in files if not self.journal.is_uploaded(self.key, file)]
+
+    def record_created(self, pid: str) -> None:
+        """Records the creation of the dataset."""
+
+        self.journal.record_created(self.key, pid)
+
+    def record_uploaded(self, files: List[File]) -> None:
+        """Records the completed upload of files of the dataset."""
+
+        self.journal.record_uploaded(self.key, files)
+
+
+def _file_state(file: File) -> Tuple[int, int]:
+    """Returns the size and modification time of a local file."""
+
+    stat = os.stat(file.filepath)
+
+    return stat.st_size, stat.st_mtime_ns
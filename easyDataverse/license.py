@@ -44,13 +44,19 @@ class License(BaseModel):
     )
 
     @classmethod
-    def fetch_by_name(cls, name: str, server_url: str) -> "License":
+    def fetch_by_name(
+        cls,
+        name: str,
+        server_url: str,
+        client: Optional[httpx.Client] = None,
+    ) -> "License":
         """
         Fetch a license by name from a Dataverse server.
 
         Args:
             name (str): The name of the license to fetch
             server_url (str): The base URL of the Dataverse server
+            client (Optional[httpx.Client]): Client to use for the request. If not provided, a new client is created.
 
         Returns:
             License: A License object with the requested license information
@@ -58,7 +64,11 @@ class License(BaseModel):
         Raises:
             Exception: If the license cannot be found or if there's an error communicating with the server
         """
-        response = httpx.get(parse.urljoin(server_url, "/api/licenses"))
+        if client is None:
+            with httpx.Client() as client:
+                return cls.fetch_by_name(name, server_url, client)
+
+        response = client.get(parse.urljoin(server_url, "/api/licenses"))
 
         if response.status_code != 200:
             raise Exception(f"Error getting licenses: {response.text}")
@@ -0,0 +1,162 @@
+import os
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+import rich
+from rich.progress import (
+    BarColumn,
+    DownloadColumn,
+    Progress,
+    TaskID,
+    TextColumn,
+    TimeRemainingColumn,
+    TransferSpeedColumn,
+)
+
+MAXIMUM_DISPLAYED_FILES = 40
+
+# How the progress of downloads is displayed:
+#   auto:      Bars per file for up to 'MAXIMUM_DISPLAYED_FILES' files, else aggregate
+#   files:     One bar per file
+#   aggregate: A single bar with total bytes, files done and throughput
+#   silent:    Nothing is displayed
+PROGRESS_MODES = ("auto", "files", "aggregate", "silent")
+
+
+class ProgressUpdate(NamedTuple):
+    """Snapshot of the progress of a download, passed to progress callbacks."""
+
+    path: str
+    advance: int
+    bytes_done: int
+    total_bytes: int
+    files_done: int
+    total_files: int
+
+
+ProgressCallback = Callable[[ProgressUpdate], None]
+
+
+class DownloadProgress:
+    """
+    Tracks the progress of the files of a download.
+
+    Downloads report written bytes and finished files by the index of the file.
+    Counters are kept for all modes, whereas rich only renders a single task in
+    the aggregate mode, such that the display cost does not grow with the number
+    of files. If a callback is given, it receives a 'ProgressUpdate' on every
+    report.
+    """
+
+    def __init__(
+        self,
+        files: List[Dict],
+        mode: str = "auto",
+        callback: Optional[ProgressCallback] = None,
+    ):
+        if mode not in PROGRESS_MODES:
+            raise ValueError(
+                f"Unknown progress mode '{mode}'. Choose one of {list(PROGRESS_MODES)}."
+            )
+
+        if mode == "auto":
+            mode = "files" if len(files) <= MAXIMUM_DISPLAYED_FILES else "aggregate"
+
+        self.mode = mode
+        self.callback = callback
+        self.paths = [
+            os.path.join(file.get("directoryLabel", ""), file["dataFile"]["filename"])
+            for file in files
+        ]
+        self.sizes = [int(file["dataFile"].get("filesize") or 0) for file in files]
+        self.completed = [0] * len(files)
+        self.bytes_done = 0
+        self.files_done = 0
+        self.total_bytes = sum(self.sizes)
+
+        self._display: Optional[Progress] = None
+        self._task_ids: List[TaskID] = []
+
+        if mode == "files":
+            self._display = Progress()
+            self._task_ids = [
+                self._display.add_task(f"[pink]  {path}", total=size)
+                for path, size in zip(self.paths, self.sizes)
+            ]
+        elif mode == "aggregate":
+            self._display = Progress(
+                TextColumn("[pink]  {task.fields[files]}"),
+                BarColumn(),
+                DownloadColumn(),
+                TransferSpeedColumn(),
+                TimeRemainingColumn(),
+            )
+            self._task_ids = [
+                self._display.add_task(
+                    "",
+                    total=self.total_bytes,
+                    files=self._files_text(),
+                )
+            ]
+
+    def __enter__(self) -> "DownloadProgress":
+        if self._display is not None:
+            rich.print("\n[bold]Downloading files[/bold]\n")
+            self._display.start()
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if self._display is not None:
+            self._display.stop()
+
+            if exc_type is None:
+                rich.print("╰── [bold]✅ Done [/bold]\n")
+
+    def advance(self, index: int, n_bytes: int) -> None:
+        """Reports bytes written for the file at the given index."""
+
+        self.completed[index] += n_bytes
+        self.bytes_done += n_bytes
+
+        if self.mode == "files":
+            self._display.advance(self._task_ids[index], advance=n_bytes)  # type: ignore
+        elif self.mode == "aggregate":
+            self._display.advance(self._task_ids[0], advance=n_bytes)  # type: ignore
+
+        self._notify(index, n_bytes)
+
+    def reset(self, index: int, completed: int = 0) -> None:
+        """Sets the bytes written for a file, e.g. when a download restarts or resumes."""
+
+        self.advance(index, completed - self.completed[index])
+
+    def finish(self, index: int) -> None:
+        """Reports that the file at the given index is complete."""
+
+        if self.completed[index] != self.sizes[index]:
+            self.reset(index, self.sizes[index])
+
+        self.files_done += 1
+
+        if self.mode == "aggregate":
+            self._display.update(self._task_ids[0], files=self._files_text())  # type: ignore
+
+        self._notify(index, 0)
+
+    def _files_text(self) -> str:
+        return f"{self.files_done}/{len(self.paths)} files"
+
+    def _notify(self, index: int, n_bytes: int) -> None:
+        if self.callback is None:
+            return
+
+        self.callback(
+            ProgressUpdate(
+                path=self.paths[index],
+                advance=n_bytes,
+                bytes_done=self.bytes_done,
+                total_bytes=self.total_bytes,
+                files_done=self.files_done,
+                total_files=len(self.paths),
+            )
+        )
@@ -0,0 +1,170 @@
+from copy import deepcopy
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Type
+
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
+
+from easyDataverse.base import DataverseBase
+from easyDataverse.classgen import create_dataverse_class, remove_child_fields_from_global
+
+
+class MetadatablockRegistry(BaseModel):
+    """
+    Holds the metadatablock definitions of a Dataverse installation and
+    generates the corresponding classes on demand.
+
+    Each class is generated at most once per registry, such that datasets
+    created from the same registry share their metadatablock classes.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    blocks: Dict[str, Any] = Field(
+        default_factory=dict,
+        description="The metadatablock definitions as returned by the API, mapped by their name.",
+    )
+
+    _classes: Dict[str, Type[DataverseBase]] = PrivateAttr(default_factory=dict)
+
+    @classmethod
+    def from_payloads(cls, payloads: List[Dict]) -> "MetadatablockRegistry":
+        """Creates a registry from the responses of the metadatablock endpoint.
+
+        Args:
+            payloads (List[Dict]): Responses of '/api/metadatablocks/{name}'.
+
+        Returns:
+            MetadatablockRegistry: The registry holding all given metadatablocks.
+        """
+
+        return cls(blocks={payload["data"]["name"]: payload for payload in payloads})
+
+    @property
+    def names(self) -> List[str]:
+        """The names of all registered metadatablocks."""
+        return list(self.blocks.keys())
+
+    def get_class(self, name: str) -> Type[DataverseBase]:
+        """Returns the class of a metadatablock and generates it, if necessary.
+
+        Args:
+            name (str): Name of the metadatablock.
+
+        Raises:
+            KeyError: If the metadatablock is not registered.
+
+        Returns:
+            Type[DataverseBase]: The metadatablock class.
+        """
+
+        if name not in self._classes:
+            self._classes[name] = self._create_class(name)
+
+        return self._classes[name]
+
+    def instantiate(self, name: str) -> DataverseBase:
+        """Returns a blank instance of the given metadatablock."""
+        return self.get_class(name)()
+
+    def build_all(self) -> None:
+        """Generates the classes of all registered metadatablocks."""
+
+        for name in self.names:
+            self.get_class(name)
+
+    def is_built(self, name: str) -> bool:
+        """Checks whether the class of a metadatablock has been generated."""
+        return name in self._classes
+
+    def _create_class(self, name: str) -> Type[DataverseBase]:
+        """Generates the class of a metadatablock from its definition."""
+
+        metadatablock = deepcopy(self.blocks[name]["data"])
+        fields = remove_child_fields_from_global(metadatablock["fields"])
+        primitives = list(
+            filter(lambda field: "childFields" not in field, fields.values())
+        )
+        compounds = list(filter(lambda field: "childFields" in field, fields.values()))
+
+        block_cls = create_dataverse_class(
+            metadatablock["name"],
+            primitives,
+            compounds,  # type: ignore
+        )
+        block_cls._metadatablock_name = metadatablock["name"]  # type: ignore
+
+        return block_cls  # type: ignore
+
+
+class PendingMetadatablock:
+    """Placeholder for a metadatablock that has not been accessed yet."""
+
+    __slots__ = ("name", "factory")
+
+    def __init__(self, name: str, factory: Callable[[], DataverseBase]):
+        self.name = name
+        self.factory = factory
+
+    def __deepcopy__(self, memo: Dict) -> "PendingMetadatablock":
+        # The factory is shared, there is nothing to copy until materialized
+        return PendingMetadatablock(self.name, self.factory)
+
+    def __repr__(self) -> str:
+        return f"PendingMetadatablock({self.name!r})"
+
+
+class LazyMetadatablocks(dict):
+    """
+    Mapping of metadatablocks, in which blocks are only created once they
+    are accessed. Until then, the mapping holds a 'PendingMetadatablock'.
+    """
+
+    def defer(self, name: str, factory: Callable[[], DataverseBase]) -> None:
+        """Registers a metadatablock that is created on first access."""
+        super().__setitem__(name, PendingMetadatablock(name, factory))
+
+    def is_pending(self, name: str) -> bool:
+        """Checks whether a metadatablock has not been created yet."""
+        return isinstance(super().get(name), PendingMetadatablock)
+
+    def materialized(self) -> Dict[str, DataverseBase]:
+        """Returns all metadatablocks that have been created so far."""
+
+        return {
+            name: block
+            for name, block in super().items()
+            if not isinstance(block, PendingMetadatablock)
+        }
+
+    def __deepcopy__(self, memo: Dict) -> "LazyMetadatablocks":
+        copied = LazyMetadatablocks()
+
+        for name, block in super().items():
+            dict.__setitem__(copied, name, deepcopy(block, memo))
+
+        return copied
+
+    def __getitem__(self, name: str) -> DataverseBase:
+        block = super().__getitem__(name)
+
+        if isinstance(block, PendingMetadatablock):
+            block = block.factory()
+            super().__setitem__(name, block)
+
+        return block
+
+    def get(self, name: str, default: Optional[Any] = None) -> Any:
+        if name not in self:
+            return default
+
+        return self[name]
+
+    def values(self) -> List[DataverseBase]:  # type: ignore
+        return [self[name] for name in self.keys()]
+
+    def items(self) -> List[Tuple[str, DataverseBase]]:  # type: ignore
+        return [(name, self[name]) for name in self.keys()]
+
+    def __iter__(self) -> Iterator[str]:
+        # Overriding iteration makes 'dict(...)' go through '__getitem__'
+        # and thus never copies placeholders into plain dictionaries.
+        return iter(self.keys())
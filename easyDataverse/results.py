@@ -0,0 +1,67 @@
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from easyDataverse.dataset import Dataset
+
+
+class LoadResult(BaseModel):
+    """
+    Outcome of loading a single dataset within a batch.
+
+    Either 'dataset' or 'error' is set, depending on whether the
+    dataset could be loaded.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    pid: str = Field(
+        ...,
+        description="The persistent identifier of the dataset.",
+    )
+
+    dataset: Optional[Dataset] = Field(
+        default=None,
+        description="The loaded dataset, if successful.",
+    )
+
+    error: Optional[str] = Field(
+        default=None,
+        description="The error that occurred while loading the dataset, if any.",
+    )
+
+    @property
+    def ok(self) -> bool:
+        """Whether the dataset has been loaded successfully."""
+        return self.error is None
+
+
+class UploadResult(BaseModel):
+    """
+    Outcome of uploading a single dataset within a batch.
+
+    'pid' is set once the dataset has been created, hence it is also set
+    if only the upload of its files failed.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    dataset: Dataset = Field(
+        ...,
+        description="The dataset that has been uploaded.",
+    )
+
+    pid: Optional[str] = Field(
+        default=None,
+        description="The persistent identifier of the dataset, if it has been created.",
+    )
+
+    error: Optional[str] = Field(
+        default=None,
+        description="The error that occurred while uploading the dataset, if any.",
+    )
+
+    @property
+    def ok(self) -> bool:
+        """Whether the dataset has been uploaded successfully."""
+        return self.error is None
@@ -0,0 +1,227 @@
+import asyncio
+import threading
+import weakref
+from typing import Any, Coroutine, Dict, Optional, TypeVar
+
+import httpx
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
+
+T = TypeVar("T")
+
+
+class Session(BaseModel):
+    """
+    Shared HTTP connection pool for all requests to a Dataverse installation.
+
+    The session lazily creates a synchronous and an asynchronous httpx client,
+    such that connections and TLS sessions are reused across the library.
+    Asynchronous clients are bound to an event loop, hence one client is kept
+    for the loop it is used on. Synchronous code runs coroutines through
+    'Session.run', which uses a background event loop owned by the session to
+    keep the asynchronous connection pool alive between calls. The background
+    loop is stopped by 'Session.close' or once the session is garbage collected.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    base_url: str = Field(
+        ...,
+        description="The URL of the Dataverse installation.",
+    )
+
+    api_token: Optional[str] = Field(
+        default=None,
+        description="The API token to use for authentication.",
+    )
+
+    max_connections: Optional[int] = Field(
+        default=100,
+        description="Maximum number of concurrent connections per client.",
+    )
+
+    max_keepalive_connections: Optional[int] = Field(
+        default=20,
+        description="Maximum number of idle connections kept alive per client.",
+    )
+
+    keepalive_expiry: Optional[float] = Field(
+        default=5.0,
+        description="Time in seconds after which idle connections are closed.",
+    )
+
+    timeout: Optional[float] = Field(
+        default=5.0,
+        description="Timeout in seconds for API requests. Downloads and uploads are not subject to this timeout.",
+    )
+
+    http2: bool = Field(
+        default=False,
+        description="Whether to use HTTP/2. Requires the 'h2' package, which is installed via the 'http2' extra.",
+    )
+
+    transport: Optional[Any] = Field(
+        default=None,
+        exclude=True,
+        description="Custom httpx transport to use for both clients, e.g. for testing.",
+    )
+
+    _client: Optional[httpx.Client] = PrivateAttr(default=None)
+    _async_clients: Any = PrivateAttr(default_factory=weakref.WeakKeyDictionary)
+    _loop: Optional[asyncio.AbstractEventLoop] = PrivateAttr(default=None)
+    _thread: Optional[threading.Thread] = PrivateAttr(default=None)
+    _finalizer: Optional[weakref.finalize] = PrivateAttr(default=None)
+    _lock: Any = PrivateAttr(default_factory=threading.Lock)
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        """Headers to authenticate requests, if an API token is given."""
+
+        if self.api_token:
+            return {"X-Dataverse-key": str(self.api_token)}
+
+        return {}
+
+    @property
+    def client(self) -> httpx.Client:
+        """The synchronous client of this session."""
+
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.Client(**self._client_kwargs())
+
+        return self._client
+
+    def async_client(self) -> httpx.AsyncClient:
+        """Returns the asynchronous client for the running event loop.
+
+        Raises:
+            RuntimeError: If there is no running event loop.
+        """
+
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(**self._client_kwargs())
+            self._async_clients[loop] = client
+
+        return client
+
+    def run(self, coroutine: Coroutine[Any, Any, T]) -> T:
+        """Runs a coroutine on the event loop of this session and waits for its result.
+
+        Args:
+            coroutine (Coroutine): The coroutine to run.
+
+        Returns:
+            The result of the coroutine.
+        """
+
+        loop = self._ensure_loop()
+
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+
+        if running is loop:
+            raise RuntimeError(
+                "Session.run cannot be called from within the session's event loop."
+            )
+
+        future = asyncio.run_coroutine_threadsafe(coroutine, loop)
+
+        try:
+            return future.result()
+        except BaseException:
+            future.cancel()
+            raise
+
+    async def aclose(self) -> None:
+        """Closes the asynchronous client of the running event loop."""
+
+        client = self._async_clients.pop(asyncio.get_running_loop(), None)
+
+        if client is not None:
+            await client.aclose()
+
+    def close(self) -> None:
+        """Closes all clients and stops the event loop of this session."""
+
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+        if self._finalizer is not None:
+            self._finalizer()
+
+        self._loop = None
+        self._thread = None
+        self._finalizer = None
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """Starts the background event loop of this session, if necessary."""
+
+        with self._lock:
+            if self._loop is None or self._loop.is_closed():
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=_run_loop,
+                    args=(self._loop, self._async_clients),
+                    name="easyDataverse-session",
+                    daemon=True,
+                )
+                self._thread.start()
+
+                # The finalizer must not reference the session itself
+                self._finalizer = weakref.finalize(
+                    self, _stop_loop, self._loop, self._thread
+                )
+
+        return self._loop
+
+    def _client_kwargs(self) -> Dict[str, Any]:
+        """Returns the arguments shared by the synchronous and asynchronous client."""
+
+        kwargs = {
+            "base_url": self.base_url,
+            "timeout": httpx.Timeout(self.timeout),
+            "limits": httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+                keepalive_expiry=self.keepalive_expiry,
+            ),
+            "http2": self.http2,
+        }
+
+        if self.transport is not None:
+            kwargs["transport"] = self.transport
+
+        return kwargs
+
+
+def _run_loop(loop: asyncio.AbstractEventLoop, async_clients: Any) -> None:
+    """Runs the background event loop of a session until it is stopped.
+
+    Closes the asynchronous client bound to the loop and the loop itself
+    once the loop has been stopped.
+    """
+
+    try:
+        loop.run_forever()
+    finally:
+        client = async_clients.pop(loop, None)
+
+        if client is not None:
+            loop.run_until_complete(client.aclose())
+
+        loop.close()
+
+
+def _stop_loop(loop: asyncio.AbstractEventLoop, thread: threading.Thread) -> None:
+    """Stops the background event loop of a session and waits for its thread."""
+
+    if not loop.is_closed():
+        loop.call_soon_threadsafe(loop.stop)
+
+    if thread is not threading.current_thread():
+        thread.join()
@@ -0,0 +1,242 @@
+import io
+import os
+import re
+from typing import AsyncIterator, Dict, List, Optional, Union
+
+import httpx
+
+from easyDataverse.downloader import CHUNK_SIZE, RangeNotSupportedError
+
+BUFFER_SIZE = 4 * 1024**2  # 4 MB
+
+CONTENT_RANGE_PATTERN = re.compile(r"bytes (?:\d+-\d+|\*)/(\d+)")
+
+
+class RemoteFile(io.RawIOBase):
+    """
+    Read-only, seekable file backed by range requests to the data access API.
+
+    Every read fetches the requested bytes from the server, hence it should be
+    wrapped in an 'io.BufferedReader' to combine small reads into larger ranges.
+    The size of the file is taken from the 'Content-Range' header of the first
+    response, such that no additional request is needed.
+    """
+
+    def __init__(
+        self,
+        client: httpx.Client,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        size: Optional[int] = None,
+    ):
+        super().__init__()
+
+        self.client = client
+        self.url = url
+        self.headers = dict(headers or {})
+        self._size = size
+        self._position = 0
+
+    @property
+    def size(self) -> int:
+        """The size of the file in bytes."""
+
+        if self._size is None:
+            self._request(0, 1)
+
+        return self._size  # type: ignore
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = self.size + offset
+        else:
+            raise ValueError(f"Invalid whence ({whence}).")
+
+        if position < 0:
+            raise ValueError(f"Negative seek position {position}.")
+
+        self._position = position
+
+        return position
+
+    def readinto(self, buffer) -> int:
+        """Reads up to 'len(buffer)' bytes at the current position into the buffer."""
+
+        if self.closed:
+            raise ValueError("I/O operation on closed file.")
+
+        if len(buffer) == 0 or self._at_end():
+            return 0
+
+        data = self._request(self._position, len(buffer))
+        buffer[: len(data)] = data
+        self._position += len(data)
+
+        return len(data)
+
+    def readall(self) -> bytes:
+        """Reads all bytes from the current position in a single request."""
+
+        if self.closed:
+            raise ValueError("I/O operation on closed file.")
+
+        if self._at_end():
+            return b""
+
+        data = self._request(self._position, None)
+        self._position += len(data)
+
+        return data
+
+    def _at_end(self) -> bool:
+        return self._size is not None and self._position >= self._size
+
+    def _request(self, start: int, length: Optional[int]) -> bytes:
+        """Requests the given range of the file.
+
+        Raises:
+            RangeNotSupportedError: If the server does not answer with partial content.
+            httpx.HTTPStatusError: If the request fails.
+
+        Returns:
+            bytes: The requested bytes, fewer at the end of the file.
+        """
+
+        end = "" if length is None else str(start + length - 1)
+        response = self.client.get(
+            self.url,
+            headers={**self.headers, "Range": f"bytes={start}-{end}"},
+            timeout=httpx.Timeout(None),
+            follow_redirects=True,
+        )
+
+        if response.status_code == 416:
+            # Range starts beyond the end of the file
+            self._size = _total_size(response) or start
+            return b""
+
+        response.raise_for_status()
+
+        if response.status_code != 206:
+            raise RangeNotSupportedError(
+                f"Server does not support range requests for '{self.url}'."
+            )
+
+        self._size = _total_size(response)
+
+        return response.content
+
+
+def _total_size(response: httpx.Response) -> Optional[int]:
+    """Extracts the total size of a file from the 'Content-Range' header."""
+
+    match = CONTENT_RANGE_PATTERN.match(response.headers.get("Content-Range", ""))
+
+    if match is None:
+        return None
+
+    return int(match.group(1))
+
+
+def datafile_url(file_id: Union[int, str]) -> str:
+    """Returns the data access endpoint of a file."""
+
+    return f"/api/access/datafile/{file_id}"
+
+
+def find_file_id(files: List[Dict], path: str) -> int:
+    """Finds the identifier of a file by its path within a dataset.
+
+    Args:
+        files (List[Dict]): The file metadata of the dataset.
+        path (str): The path of the file, including its directory label.
+
+    Raises:
+        ValueError: If the dataset has no file at the given path.
+
+    Returns:
+        int: The identifier of the file.
+    """
+
+    path = path.strip("/")
+
+    for file in files:
+        dv_path = os.path.join(
+            file.get("directoryLabel", ""),
+            file["dataFile"]["filename"],
+        )
+
+        if dv_path == path:
+            return file["dataFile"]["id"]
+
+    raise ValueError(f"Dataset has no file at '{path}'.")
+
+
+def open_remote_file(
+    client: httpx.Client,
+    file_id: Union[int, str],
+    headers: Optional[Dict[str, str]] = None,
+    buffer_size: int = BUFFER_SIZE,
+) -> io.BufferedReader:
+    """Opens a remote file as a buffered, seekable binary stream.
+
+    Args:
+        client (httpx.Client): The httpx client.
+        file_id (Union[int, str]): The identifier of the file.
+        headers (Optional[Dict[str, str]]): Headers to send, e.g. for authentication.
+        buffer_size (int): Minimum number of bytes fetched per request.
+
+    Returns:
+        io.BufferedReader: The file object.
+    """
+
+    raw = RemoteFile(client=client, url=datafile_url(file_id), headers=headers)
+
+    return io.BufferedReader(raw, buffer_size=buffer_size)  # type: ignore
+
+
+async def iter_remote_file(
+    client: httpx.AsyncClient,
+    file_id: Union[int, str],
+    headers: Optional[Dict[str, str]] = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> AsyncIterator[bytes]:
+    """Streams the bytes of a remote file.
+
+    Args:
+        client (httpx.AsyncClient): The httpx async client.
+        file_id (Union[int, str]): The identifier of the file.
+        headers (Optional[Dict[str, str]]): Headers to send, e.g. for authentication.
+        chunk_size (int): Size of the yielded chunks.
+
+    Raises:
+        httpx.HTTPStatusError: If the request fails.
+
+    Yields:
+        bytes: The chunks of the file.
+    """
+
+    async with client.stream(
+        "GET",
+        datafile_url(file_id),
+        headers=headers,
+        timeout=httpx.Timeout(None),
+        follow_redirects=True,
+    ) as response:
+        response.raise_for_status()
+
+        async for chunk in response.aiter_bytes(chunk_size=chunk_size):
+            yield chunk
@@ -1,13 +1,20 @@
+import asyncio
+import math
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from urllib.parse import urljoin
 import httpx
+import nest_asyncio
 
 from rich.panel import Panel
 from rich.console import Console
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 from dvuploader import File, DVUploader
 
 from pyDataverse.api import NativeApi, DataAccessApi
-from pyDataverse.models import Dataset
+
+from easyDataverse.journal import DatasetJournal
+
+UPLOAD_BATCH_SIZE = 20
 
 
 def upload_to_dataverse(
@@ -18,6 +25,8 @@ def upload_to_dataverse(
     n_parallel: int = 1,
     DATAVERSE_URL: Optional[str] = None,
     API_TOKEN: Optional[str] = None,
+    client: Optional[httpx.Client] = None,
+    journal: Optional[DatasetJournal] = None,
 ) -> str:
     """Uploads a given Dataset to the dataverse installation found in the environment variables.
 
@@ -26,6 +35,8 @@ def upload_to_dataverse(
         dataverse_name (str): Name of the Dataverse where the data will be uploaded to.
         files (List[str], optional): List of files that should be uploaded. Can also include directory names. Defaults to None.
         p_id (Optional[str], optional): Persistent Identifier of the dataset. Defaults to None.
+        client (Optional[httpx.Client], optional): Client to use for API requests. Defaults to None.
+        journal (Optional[DatasetJournal], optional): Journal to resume from and record progress in. Defaults to None.
 
 
     Raises:
@@ -35,36 +46,125 @@ def upload_to_dataverse(
     """
 
     api, _ = _initialize_pydataverse(DATAVERSE_URL, API_TOKEN)  # type: ignore
-    ds = Dataset()
-    ds.from_json(json_data)
-
-    # Finally, validate the JSON
-    if not ds.validate_json():
-        raise ValueError("JSON is not valid")
-
-    create_params = {
-        "dataverse": dataverse_name,
-        "metadata": json_data,
-    }
-
-    if p_id:
-        create_params["pid"] = p_id
-
-    response = api.create_dataset(**create_params)  # type: ignore
-    response.raise_for_status()
 
-    # Get response data
-    p_id = response.json()["data"]["persistentId"]
+    if journal is not None and journal.pid is not None:
+        p_id = journal.pid
+    else:
+        p_id = _create_dataset(
+            json_data=json_data,
+            dataverse_name=dataverse_name,
+            p_id=p_id,
+            base_url=DATAVERSE_URL,  # type: ignore
+            api_token=API_TOKEN,  # type: ignore
+            client=client,
+        )
+
+        if journal is not None:
+            journal.record_created(p_id)
 
     _uploadFiles(
-        files=files,
+        files=journal.pending(files) if journal is not None else files,
         p_id=p_id,  # type: ignore
         api=api,  # type: ignore
         n_parallel=n_parallel,
+        on_uploaded=journal.record_uploaded if journal is not None else None,
     )  # type: ignore
 
+    _print_dataset_url(DATAVERSE_URL, p_id)  # type: ignore
+
+    return p_id  # type: ignore
+
+
+async def upload_to_dataverse_async(
+    json_data: str,
+    dataverse_name: str,
+    files: List[File] = [],
+    p_id: Optional[str] = None,
+    n_parallel: int = 1,
+    DATAVERSE_URL: Optional[str] = None,
+    API_TOKEN: Optional[str] = None,
+    client: Optional[httpx.AsyncClient] = None,
+    create_slots: Optional[asyncio.Semaphore] = None,
+    upload_slots: Optional[asyncio.Semaphore] = None,
+    on_created: Optional[Callable[[str], None]] = None,
+    journal: Optional[DatasetJournal] = None,
+    verbose: bool = True,
+) -> str:
+    """Uploads a given Dataset without blocking the running event loop.
+
+    The dataset is created using the given async client, whereas files are
+    uploaded by DVUploader in a worker thread, since it manages its own loop.
+    The JSON is expected to be validated beforehand, see 'Dataset.validate'.
+    When uploading many datasets, the given semaphores limit the number of
+    concurrent creations and file uploads separately, such that datasets are
+    created while files of other datasets are uploaded.
+
+    Args:
+        json_data (str): JSON representation of the Dataverse dataset.
+        dataverse_name (str): Name of the Dataverse where the data will be uploaded to.
+        files (List[str], optional): List of files that should be uploaded. Can also include directory names. Defaults to None.
+        p_id (Optional[str], optional): Persistent Identifier of the dataset. Defaults to None.
+        client (Optional[httpx.AsyncClient], optional): Client to use for API requests. Defaults to None.
+        create_slots (Optional[asyncio.Semaphore], optional): Limits concurrent dataset creations. Defaults to None.
+        upload_slots (Optional[asyncio.Semaphore], optional): Limits concurrent file uploads. Defaults to None.
+        on_created (Optional[Callable[[str], None]], optional): Called with the identifier once the dataset exists. Defaults to None.
+        journal (Optional[DatasetJournal], optional): Journal to resume from and record progress in. Defaults to None.
+        verbose (bool, optional): Whether to print the upload progress and the dataset URL. Defaults to True.
+
+    Raises:
+        httpx.HTTPError: If a request fails.
+
+    Returns:
+        str: The resulting DOI of the dataset, if successful.
+    """
+
+    api, _ = _initialize_pydataverse(DATAVERSE_URL, API_TOKEN)  # type: ignore
+
+    if journal is not None and journal.pid is not None:
+        p_id = journal.pid
+    else:
+        async with create_slots or asyncio.Semaphore(1):
+            p_id = await _create_dataset_async(
+                json_data=json_data,
+                dataverse_name=dataverse_name,
+                p_id=p_id,
+                base_url=DATAVERSE_URL,  # type: ignore
+                api_token=API_TOKEN,  # type: ignore
+                client=client,
+            )
+
+        if journal is not None:
+            journal.record_created(p_id)
+
+    if on_created is not None:
+        on_created(p_id)  # type: ignore
+
+    if journal is not None:
+        files = journal.pending(files)
+
+    if files:
+        async with upload_slots or asyncio.Semaphore(1):
+            await asyncio.to_thread(
+                _uploadFiles,
+                files=files,
+                p_id=p_id,  # type: ignore
+                api=api,  # type: ignore
+                n_parallel=n_parallel,
+                verbose=verbose,
+                on_uploaded=journal.record_uploaded if journal is not None else None,
+            )
+
+    if verbose:
+        _print_dataset_url(DATAVERSE_URL, p_id)  # type: ignore
+
+    return p_id  # type: ignore
+
+
+def _print_dataset_url(base_url: str, p_id: str) -> None:
+    """Prints the URL of an uploaded dataset."""
+
     console = Console()
-    url = urljoin(DATAVERSE_URL, f"dataset.xhtml?persistentId={p_id}")  # type: ignore
+    url = urljoin(base_url, f"dataset.xhtml?persistentId={p_id}")
     panel = Panel(
         f"🎉 {url}",
         title="Dataset URL",
@@ -76,7 +176,96 @@ def upload_to_dataverse(
     print("\n")
     console.print(panel)
 
-    return p_id  # type: ignore
+
+def _create_dataset(
+    json_data: str,
+    dataverse_name: str,
+    p_id: Optional[str],
+    base_url: str,
+    api_token: str,
+    client: Optional[httpx.Client] = None,
+) -> str:
+    """Creates a dataset in a Dataverse collection.
+
+    Args:
+        json_data (str): JSON representation of the Dataverse dataset.
+        dataverse_name (str): Name of the Dataverse where the dataset will be created.
+        p_id (Optional[str]): Persistent identifier to import the dataset with.
+        base_url (str): URL of the dataverse instance.
+        api_token (str): API token of the user.
+        client (Optional[httpx.Client], optional): Client to use for the request. Defaults to None.
+
+    Raises:
+        httpx.HTTPError: If the request fails.
+
+    Returns:
+        str: The persistent identifier of the created dataset.
+    """
+
+    if client is None:
+        with httpx.Client() as client:
+            return _create_dataset(
+                json_data, dataverse_name, p_id, base_url, api_token, client
+            )
+
+    endpoint, headers = _create_dataset_request(
+        dataverse_name, p_id, base_url, api_token
+    )
+
+    response = client.post(endpoint, content=json_data, headers=headers)
+    response.raise_for_status()
+
+    return response.json()["data"]["persistentId"]
+
+
+async def _create_dataset_async(
+    json_data: str,
+    dataverse_name: str,
+    p_id: Optional[str],
+    base_url: str,
+    api_token: str,
+    client: Optional[httpx.AsyncClient] = None,
+) -> str:
+    """Creates a dataset in a Dataverse collection using an async client.
+
+    See '_create_dataset' for details on the arguments.
+    """
+
+    if client is None:
+        async with httpx.AsyncClient() as client:
+            return await _create_dataset_async(
+                json_data, dataverse_name, p_id, base_url, api_token, client
+            )
+
+    endpoint, headers = _create_dataset_request(
+        dataverse_name, p_id, base_url, api_token
+    )
+
+    response = await client.post(endpoint, content=json_data, headers=headers)
+    response.raise_for_status()
+
+    return response.json()["data"]["persistentId"]
+
+
+def _create_dataset_request(
+    dataverse_name: str,
+    p_id: Optional[str],
+    base_url: str,
+    api_token: str,
+) -> Tuple[str, Dict[str, str]]:
+    """Returns the endpoint and headers to create or import a dataset."""
+
+    endpoint = f"{base_url.rstrip('/')}/api/dataverses/{dataverse_name}/datasets"
+
+    if p_id:
+        endpoint += f"/:import?pid={p_id}&release=no"
+
+    headers = {
+        "X-Dataverse-key": api_token,
+        "Content-Type": "application/json",
+    }
+
+    return endpoint, headers
 
 
 def _initialize_pydataverse(DATAVERSE_URL: str, API_TOKEN: str):
@@ -92,18 +281,72 @@ def _uploadFiles(
     p_id: str,
     api: DataAccessApi,
     n_parallel: int = 1,
+    verbose: bool = True,
+    on_uploaded: Optional[Callable[[List[File]], None]] = None,
 ) -> None:
     """Uploads any file to a dataverse dataset.
+
+    If 'on_uploaded' is given, files are uploaded in batches of at most
+    'UPLOAD_BATCH_SIZE' and the callback is invoked after each batch, since
+    DVUploader does not report the completion of single files. Up to
+    'n_parallel' batches are uploaded at once.
+
     Args:
         filename (String): Path to the file
         p_id (String): Dataset permanent ID to upload.
         api (API): API object which is used to upload the file
+        n_parallel (int): Number of parallel uploads
+        verbose (bool): Whether DVUploader prints status messages
+        on_uploaded (Callable): Called with the files of each completed batch
     """
 
     if not files:
         return
 
-    dvuploader = DVUploader(files=files)
+    if on_uploaded is None:
+        _allow_nested_event_loop()
+        _upload_batch(files, p_id, api, n_parallel, verbose)
+        return
+
+    # Spread the files across all parallel uploads, even for small datasets
+    batch_size = min(UPLOAD_BATCH_SIZE, math.ceil(len(files) / max(n_parallel, 1)))
+    batches = [
+        files[start : start + batch_size] for start in range(0, len(files), batch_size)
+    ]
+    error = None
+
+    with ThreadPoolExecutor(max_workers=max(n_parallel, 1)) as executor:
+        futures = {
+            executor.submit(_upload_batch, batch, p_id, api, 1, verbose): batch
+            for batch in batches
+        }
+
+        for future in as_completed(futures):
+            if future.cancelled():
+                continue
+            elif future.exception() is not None:
+                if error is None:
+                    error = future.exception()
+
+                    for pending in futures:
+                        pending.cancel()
+            else:
+                on_uploaded(futures[future])
+
+    if error is not None:
+        raise error
+
+
+def _upload_batch(
+    files: List[File],
+    p_id: str,
+    api: DataAccessApi,
+    n_parallel: int,
+    verbose: bool,
+) -> None:
+    """Uploads files to a dataset within a single DVUploader run."""
+
+    dvuploader = DVUploader(files=files, verbose=verbose)
     dvuploader.upload(
         persistent_id=p_id,
         dataverse_url=api.base_url,
@@ -112,21 +355,48 @@ def _uploadFiles(
     )
 
 
+def _allow_nested_event_loop() -> None:
+    """Allows DVUploader to run its own event loop within a running one.
+
+    DVUploader calls 'asyncio.run', which fails if an event loop is already
+    running in the current thread, e.g. within Jupyter notebooks. In this
+    case, nest_asyncio is applied. Worker threads used by async code paths
+    have no running loop and thus remain unpatched.
+    """
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return
+
+    nest_asyncio.apply()
+
+
 def update_dataset(
     p_id: str,
     to_change: Dict,
     files: List[File],
     DATAVERSE_URL: Optional[str] = None,
     API_TOKEN: Optional[str] = None,
+    client: Optional[httpx.Client] = None,
+    to_add: Optional[Dict] = None,
+    to_delete: Optional[Dict] = None,
 ) -> bool:
     """Uploads and updates the metadata of a draft dataset.
 
+    Fields are replaced first, then values are added and finally values are
+    deleted, such that fields with a single required value are never empty in
+    between. Requests without any fields are skipped.
+
     Args:
         p_id (str): Persistent ID of the dataset.
-        to_change (Dict): Dictionary of fields to change.
+        to_change (Dict): Dictionary of fields to replace.
         files (List[File]): List of files that should be uploaded. Can also include directory names.
         DATAVERSE_URL (Optional[str], optional): The URL of the Dataverse instance. Defaults to None.
         API_TOKEN (Optional[str], optional): The API token for authentication. Defaults to None.
+        client (Optional[httpx.Client], optional): Client to use for API requests. Defaults to None.
+        to_add (Optional[Dict], optional): Dictionary of field values to add. Defaults to None.
+        to_delete (Optional[Dict], optional): Dictionary of field values to delete. Defaults to None.
 
     Returns:
         bool: True if the dataset was successfully updated, False otherwise.
@@ -134,12 +404,33 @@ def update_dataset(
 
     api, _ = _initialize_pydataverse(DATAVERSE_URL, API_TOKEN)  # type: ignore
 
-    _update_metadata(
-        p_id=p_id,
-        to_change=to_change,
-        base_url=DATAVERSE_URL,  # type: ignore
-        api_token=API_TOKEN,  # type: ignore
-    )
+    if to_change.get("fields"):
+        _update_metadata(
+            p_id=p_id,
+            to_change=to_change,
+            base_url=DATAVERSE_URL,  # type: ignore
+            api_token=API_TOKEN,  # type: ignore
+            client=client,
+        )
+
+    if to_add and to_add.get("fields"):
+        _update_metadata(
+            p_id=p_id,
+            to_change=to_add,
+            base_url=DATAVERSE_URL,  # type: ignore
+            api_token=API_TOKEN,  # type: ignore
+            client=client,
+            replace=False,
+        )
+
+    if to_delete and to_delete.get("fields"):
+        _delete_metadata(
+            p_id=p_id,
+            to_delete=to_delete,
+            base_url=DATAVERSE_URL,  # type: ignore
+            api_token=API_TOKEN,  # type: ignore
+            client=client,
+        )
 
     _uploadFiles(
         files=files,
@@ -155,6 +446,8 @@ def _update_metadata(
     to_change: Dict,
     base_url: str,
     api_token: str,
+    client: Optional[httpx.Client] = None,
+    replace: bool = True,
 ):
     """Updates the metadata of a dataset.
 
@@ -163,13 +456,54 @@ def _update_metadata(
         to_change (Dict): Dictionary of fields to change.
         base_url (str): URL of the dataverse instance.
         api_token (str): API token of the user.
+        client (Optional[httpx.Client], optional): Client to use for the request. Defaults to None.
+        replace (bool, optional): Whether to replace the values of the fields instead of adding to them. Defaults to True.
 
     Raises:
         httpx.HTTPError: If the request fails.
     """
 
-    EDIT_ENDPOINT = f"{base_url.rstrip('/')}/api/datasets/:persistentId/editMetadata?persistentId={p_id}&replace=true"
+    EDIT_ENDPOINT = f"{base_url.rstrip('/')}/api/datasets/:persistentId/editMetadata?persistentId={p_id}"
+
+    if replace:
+        EDIT_ENDPOINT += "&replace=true"
+
     headers = {"X-Dataverse-key": api_token}
 
-    response = httpx.put(EDIT_ENDPOINT, headers=headers, json=to_change)
+    if client is None:
+        response = httpx.put(EDIT_ENDPOINT, headers=headers, json=to_change)
+    else:
+        response = client.put(EDIT_ENDPOINT, headers=headers, json=to_change)
+
+    response.raise_for_status()
+
+
+def _delete_metadata(
+    p_id: str,
+    to_delete: Dict,
+    base_url: str,
+    api_token: str,
+    client: Optional[httpx.Client] = None,
+):
+    """Deletes values of metadata fields of a dataset.
+
+    Args:
+        p_id (str): Persistent ID of the dataset.
+        to_delete (Dict): Dictionary of field values to delete.
+        base_url (str): URL of the dataverse instance.
+        api_token (str): API token of the user.
+        client (Optional[httpx.Client], optional): Client to use for the request. Defaults to None.
+
+    Raises:
+        httpx.HTTPError: If the request fails.
+    """
+
+    DELETE_ENDPOINT = f"{base_url.rstrip('/')}/api/datasets/:persistentId/deleteMetadata?persistentId={p_id}"
+    headers = {"X-Dataverse-key": api_token}
+
+    if client is None:
+        response = httpx.put(DELETE_ENDPOINT, headers=headers, json=to_delete)
+    else:
+        response = client.put(DELETE_ENDPOINT, headers=headers, json=to_delete)
+
     response.raise_for_status()
@@ -0,0 +1,286 @@
+import re
+from enum import Enum
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Type,
+    get_args,
+)
+
+from pydantic import AnyHttpUrl, BaseModel, EmailStr
+
+INTEGER_PATTERN = re.compile(r"[+-]?\d+")
+URL_PATTERN = re.compile(r"https?://\S+", re.IGNORECASE)
+EMAIL_PATTERN = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
+
+
+class TypeCheck(NamedTuple):
+    """Checks the serialized value of a primitive field."""
+
+    name: str
+    check: Callable[[Any], bool]
+
+
+def _matches(pattern: re.Pattern, value: Any) -> bool:
+    return pattern.fullmatch(str(value)) is not None
+
+
+def _is_float(value: Any) -> bool:
+    try:
+        float(value)
+    except (TypeError, ValueError):
+        return False
+
+    return True
+
+
+# Values are serialized to strings by 'dataverse_dict', hence
+# the checks are applied to their string representation.
+TYPE_CHECKS: Dict[Any, TypeCheck] = {
+    str: TypeCheck("text", lambda v: isinstance(v, str)),
+    int: TypeCheck("integer", lambda v: _matches(INTEGER_PATTERN, v)),
+    float: TypeCheck("number", _is_float),
+    AnyHttpUrl: TypeCheck("URL", lambda v: _matches(URL_PATTERN, v)),
+    EmailStr: TypeCheck("email", lambda v: _matches(EMAIL_PATTERN, v)),
+}
+
+
+class FieldRule(NamedTuple):
+    """Precompiled constraints of a metadata field, keyed by its 'typeName'."""
+
+    multiple: bool
+    type_check: Optional[TypeCheck]
+    vocabulary: Optional[FrozenSet[str]]
+    children: Optional[Dict[str, "FieldRule"]]
+
+
+class FieldError(NamedTuple):
+    """A validation error of a single metadata field."""
+
+    path: str
+    message: str
+
+    def __str__(self) -> str:
+        return f"{self.path}: {self.message}"
+
+
+class MetadataValidationError(ValueError):
+    """Raised if the metadata of a dataset is invalid."""
+
+    def __init__(self, errors: List[FieldError]):
+        self.errors = errors
+
+        super().__init__(
+            "Metadata is invalid. Please fix the following fields:\n"
+            + "\n".join(f"  {error}" for error in errors)
+        )
+
+
+def compile_rules(cls: Type[BaseModel]) -> Dict[str, FieldRule]:
+    """Compiles the constraints of all fields of a metadatablock class.
+
+    The rules are built once per class and reused across all instances.
+    Compound fields carry the rules of their child fields.
+
+    Args:
+        cls (Type[BaseModel]): A generated metadatablock or compound class.
+
+    Returns:
+        Dict[str, FieldRule]: The rules by 'typeName' of the fields.
+    """
+
+    rules = cls.__dict__.get("_validation_rules_cache")
+
+    if rules is not None:
+        return rules
+
+    rules = {}
+
+    for field in cls.model_fields.values():
+        extra = field.json_schema_extra
+
+        if not isinstance(extra, dict) or "typeName" not in extra:
+            continue
+
+        dtype = next(
+            (arg for arg in get_args(field.annotation) if arg is not type(None)),
+            field.annotation,
+        )
+
+        if isinstance(dtype, type) and issubclass(dtype, Enum):
+            vocabulary = frozenset(str(member.value) for member in dtype)
+        else:
+            vocabulary = None
+
+        rules[extra["typeName"]] = FieldRule(
+            multiple=bool(extra["multiple"]),
+            type_check=TYPE_CHECKS.get(dtype),
+            vocabulary=vocabulary,
+            children=(
+                compile_rules(dtype) if hasattr(dtype, "model_fields") else None
+            ),
+        )
+
+    cls._validation_rules_cache = rules  # type: ignore
+
+    return rules
+
+
+def validate_metadata(
+    dataverse_dict: Dict,
+    rules: Dict[str, Dict[str, FieldRule]],
+    required: Iterable[str] = (),
+) -> List[FieldError]:
+    """Validates the metadata of a dataset in a single pass.
+
+    Checks that all required fields are present and not empty, that values of
+    controlled vocabularies are part of the vocabulary, and that values match
+    the type and multiplicity of their field. Errors are reported by the path
+    of the field, e.g. 'citation/author/0/authorName'.
+
+    Args:
+        dataverse_dict (Dict): The result of 'Dataset.dataverse_dict'.
+        rules (Dict[str, Dict[str, FieldRule]]): The compiled rules by metadatablock name.
+        required (Iterable[str]): Paths of required fields, e.g. 'citation/author/authorName'.
+
+    Returns:
+        List[FieldError]: The errors found, empty if the metadata is valid.
+    """
+
+    errors = []
+    required_paths = _group_required(required)
+    blocks = dataverse_dict.get("datasetVersion", {}).get("metadataBlocks", {})
+
+    for name in blocks:
+        if name not in rules:
+            errors.append(FieldError(name, "Unknown metadatablock."))
+
+    for name, block_rules in rules.items():
+        fields = {
+            field.get("typeName"): field
+            for field in blocks.get(name, {}).get("fields", [])
+        }
+
+        _check_fields(
+            fields=fields,
+            rules=block_rules,
+            path=name,
+            schema_path="",
+            required=required_paths.get(name, frozenset()),
+            errors=errors,
+        )
+
+    return errors
+
+
+def _group_required(required: Iterable[str]) -> Dict[str, FrozenSet[str]]:
+    """Groups required paths by their metadatablock.
+
+    A required child field implies that its compound is required as well.
+    """
+
+    grouped = {}
+
+    for path in required:
+        block, *parts = path.split("/")
+
+        for i in range(1, len(parts) + 1):
+            grouped.setdefault(block, set()).add("/".join(parts[:i]))
+
+    return {block: frozenset(fields) for block, fields in grouped.items()}
+
+
+def _check_fields(
+    fields: Dict[str, Dict],
+    rules: Dict[str, FieldRule],
+    path: str,
+    schema_path: str,
+    required: FrozenSet[str],
+    errors: List[FieldError],
+) -> None:
+    """Checks the fields of a metadatablock or of a compound value."""
+
+    for type_name, field in fields.items():
+        rule = rules.get(type_name)
+
+        if rule is None:
+            errors.append(FieldError(f"{path}/{type_name}", "Unknown field."))
+            continue
+
+        _check_field(
+            value=field.get("value") if isinstance(field, dict) else field,
+            rule=rule,
+            path=f"{path}/{type_name}",
+            schema_path=f"{schema_path}{type_name}",
+            required=required,
+            errors=errors,
+        )
+
+    for type_name in rules:
+        if f"{schema_path}{type_name}" not in required:
+            continue
+
+        field = fields.get(type_name)
+
+        if not isinstance(field, dict) or field.get("value") in (None, "", [], {}):
+            errors.append(
+                FieldError(
+                    f"{path}/{type_name}", "Required field is missing or empty."
+                )
+            )
+
+
+def _check_field(
+    value: Any,
+    rule: FieldRule,
+    path: str,
+    schema_path: str,
+    required: FrozenSet[str],
+    errors: List[FieldError],
+) -> None:
+    """Checks the value of a single field against its rule."""
+
+    if rule.multiple:
+        if not isinstance(value, list):
+            errors.append(FieldError(path, "Expected a list of values."))
+            return
+
+        entries = [(f"{path}/{i}", entry) for i, entry in enumerate(value)]
+    else:
+        if isinstance(value, list):
+            errors.append(FieldError(path, "Expected a single value."))
+            return
+
+        entries = [(path, value)]
+
+    for entry_path, entry in entries:
+        if rule.children is not None:
+            if not isinstance(entry, dict):
+                errors.append(FieldError(entry_path, "Expected a compound value."))
+                continue
+
+            _check_fields(
+                fields=entry,
+                rules=rule.children,
+                path=entry_path,
+                schema_path=f"{schema_path}/",
+                required=required,
+                errors=errors,
+            )
+        elif rule.vocabulary is not None:
+            if entry not in rule.vocabulary:
+                errors.append(
+                    FieldError(
+                        entry_path,
+                        f"'{entry}' is not part of the controlled vocabulary.",
+                    )
+                )
+        elif rule.type_check is not None and not rule.type_check.check(entry):
+            message = f"'{entry}' is not a valid {rule.type_check.name}."
+            errors.append(FieldError(entry_path, message))
@@ -2,6 +2,8 @@ import pytest
 import os
 import json
 
+from dotted_dict import DottedDict
+
 
 @pytest.fixture()
 def credentials():
@@ -34,3 +36,75 @@ def minimal_upload_other_license():
     Returns the contents of the 'minimal_upload.json' file as a dictionary.
     """
     return json.load(open("tests/fixtures/minimal_upload_other_license.json"))
+
+
+@pytest.fixture()
+def metadatablocks():
+    """
+    Returns the metadatablock definitions found in 'tests/fixtures/metadatablocks'
+    as they would be returned by the '/api/metadatablocks/{name}' endpoint.
+
+    Returns:
+        list: The metadatablock definitions.
+    """
+    return [
+        DottedDict(json.load(open(f"tests/fixtures/metadatablocks/{name}.json")))
+        for name in ["citation", "geospatial"]
+    ]
+
+
+@pytest.fixture()
+def mock_installation(metadatablocks):
+    """
+    Returns an 'httpx.MockTransport' that answers the requests sent when
+    connecting to a Dataverse installation. Requested paths are recorded
+    in the 'calls' attribute of the transport.
+
+    Returns:
+        httpx.MockTransport: The transport mocking the installation.
+    """
+    import httpx
+
+    blocks = {block.data.name: block for block in metadatablocks}
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        calls.append(path)
+
+        if path == "/api/info/version":
+            return httpx.Response(200, json={"data": {"version": "6.5"}})
+        elif path == "/api/licenses":
+            return httpx.Response(
+                200,
+                json={
+                    "data": [
+                        {
+                            "id": 1,
+                            "name": "CC0 1.0",
+                            "uri": "http://creativecommons.org/publicdomain/zero/1.0",
+                            "shortDescription": "Creative Commons CC0 1.0",
+                            "active": True,
+                            "isDefault": True,
+                            "sortOrder": 0,
+                        }
+                    ]
+                },
+            )
+        elif path == "/api/datasets/datasetTypes":
+            return httpx.Response(
+                200, json={"data": [{"id": 1, "name": "dataset"}]}
+            )
+        elif path == "/api/metadatablocks":
+            return httpx.Response(
+                200, json={"data": [{"name": name} for name in blocks]}
+            )
+        elif path.startswith("/api/metadatablocks/"):
+            return httpx.Response(200, json=blocks[path.rsplit("/", 1)[-1]])
+
+        return httpx.Response(404, json={"status": "ERROR"})
+
+    transport = httpx.MockTransport(handler)
+    transport.calls = calls  # type: ignore
+
+    return transport
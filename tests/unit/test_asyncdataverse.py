@@ -0,0 +1,163 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from easyDataverse.asyncdataverse import AsyncDataverse
+from easyDataverse.session import Session
+
+
+def _dataset_response(pid: str) -> httpx.Response:
+    return httpx.Response(
+        200,
+        json={
+            "data": {
+                "latestVersion": {
+                    "datasetPersistentId": pid,
+                    "license": {"name": "CC0 1.0"},
+                    "files": [],
+                    "metadataBlocks": {
+                        "citation": {"fields": [{"typeName": "title", "value": pid}]}
+                    },
+                }
+            }
+        },
+    )
+
+
+class TestAsyncDataverse:
+    @pytest.mark.unit
+    def test_connect_and_load(self, mock_installation):
+        # Arrange
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/api/datasets/:persistentId/":
+                return _dataset_response(request.url.params["persistentId"])
+
+            return mock_installation.handler(request)
+
+        session = Session(
+            base_url="http://localhost:8080",
+            transport=httpx.MockTransport(handler),
+        )
+
+        async def main():
+            dataverse = await AsyncDataverse.connect(
+                "http://localhost:8080",  # type: ignore
+                session=session,
+            )
+            dataset = await dataverse.load_dataset(
+                "doi:10.5072/first",
+                download_files=False,
+            )
+            results = await dataverse.load_datasets(["doi:10.5072/second"])
+            await dataverse.aclose()
+
+            return dataset, results
+
+        # Act
+        dataset, results = asyncio.run(main())
+
+        # Assert
+        assert dataset.citation.title == "doi:10.5072/first"  # type: ignore
+        assert dataset.license.name == "CC0 1.0"  # type: ignore
+        assert results[0].dataset.p_id == "doi:10.5072/second"  # type: ignore
+
+    @pytest.mark.unit
+    def test_expired_licenses_are_fetched_async(self, mock_installation, monkeypatch):
+        # Arrange
+        license_requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/api/datasets/:persistentId/":
+                return _dataset_response(request.url.params["persistentId"])
+            elif request.url.path == "/api/licenses":
+                license_requests.append(request)
+
+            return mock_installation.handler(request)
+
+        def fetch_licenses(self):
+            raise AssertionError("Licenses should not be fetched synchronously")
+
+        monkeypatch.setattr(AsyncDataverse, "_fetch_licenses", fetch_licenses)
+        session = Session(
+            base_url="http://localhost:8080",
+            transport=httpx.MockTransport(handler),
+        )
+
+        async def main():
+            dataverse = await AsyncDataverse.connect(
+                "http://localhost:8080",  # type: ignore
+                session=session,
+                license_ttl=60,
+            )
+
+            dataverse._licenses_fetched_at -= 120
+            dataset = await dataverse.load_dataset(
+                "doi:10.5072/first",
+                download_files=False,
+                progress="silent",
+            )
+
+            dataverse._licenses_fetched_at -= 120
+            results = await dataverse.load_datasets(["doi:10.5072/second"])
+            await dataverse.aclose()
+
+            return dataset, results
+
+        # Act
+        dataset, results = asyncio.run(main())
+
+        # Assert
+        assert len(license_requests) == 3
+        assert dataset.license.name == "CC0 1.0"  # type: ignore
+        assert results[0].ok
+        assert results[0].dataset.license.name == "CC0 1.0"  # type: ignore
+
+    @pytest.mark.unit
+    def test_upload_async(self, mock_installation):
+        # Arrange
+        created = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/api/dataverses/root/datasets":
+                created.append(json.loads(request.content))
+                return httpx.Response(
+                    201, json={"data": {"persistentId": "doi:10.5072/new"}}
+                )
+
+            return mock_installation.handler(request)
+
+        session = Session(
+            base_url="http://localhost:8080",
+            transport=httpx.MockTransport(handler),
+        )
+
+        async def main():
+            dataverse = await AsyncDataverse.connect(
+                "http://localhost:8080",  # type: ignore
+                api_token="9eb39a88-ab0d-415d-80c2-32cbafdb5f6f",  # type: ignore
+                session=session,
+            )
+
+            dataset = dataverse.create_dataset()
+            dataset.citation.title = "My dataset"  # type: ignore
+            dataset.citation.subject = ["Other"]  # type: ignore
+            dataset.citation.add_author(name="John Doe")  # type: ignore
+            dataset.citation.add_dataset_contact(  # type: ignore
+                name="John Doe",
+                email="john@doe.com",
+            )
+            dataset.citation.add_ds_description(value="Description")  # type: ignore
+
+            p_id = await dataset.upload_async("root")
+            await dataverse.aclose()
+
+            return p_id
+
+        # Act
+        p_id = asyncio.run(main())
+
+        # Assert
+        assert p_id == "doi:10.5072/new"
+        assert len(created) == 1
@@ -35,3 +35,29 @@ class TestBase:
         }
 
         assert example == expected, "Example data is not as expected"
+
+    @pytest.mark.unit
+    def test_field_index(self):
+        # Arrange
+        class Child(DataverseBase):
+            bar: Optional[str] = Field(
+                default=None,
+                alias="Bar",
+                json_schema_extra={"typeName": "childBar", "typeClass": "primitive"},
+            )
+
+        class Test(DataverseBase):
+            nested: List[Child] = Field(
+                default_factory=list,
+                alias="Nested",
+                json_schema_extra={"typeName": "testNested", "typeClass": "compound"},
+            )
+
+        # Act
+        index = Test._field_index()
+
+        # Assert
+        assert index["testNested"].name == "nested"
+        assert index["testNested"].type_class == "compound"
+        assert index["testNested"].children["childBar"].name == "bar"  # type: ignore
+        assert Test._field_index() is index
@@ -0,0 +1,208 @@
+import asyncio
+import hashlib
+import io
+import zipfile
+
+import httpx
+import pytest
+from pyDataverse.api import DataAccessApi
+
+from easyDataverse.bundle import BundleError, extract_zip_stream, plan_bundles
+from easyDataverse.downloader import download_files
+
+
+class _UnseekableBuffer:
+    """Write-only buffer, which makes zipfile stream entries with data descriptors."""
+
+    def __init__(self):
+        self.buffer = io.BytesIO()
+
+    def write(self, data: bytes) -> int:
+        return self.buffer.write(data)
+
+    def flush(self) -> None:
+        pass
+
+
+def _zip(entries, streamed=True, compression=zipfile.ZIP_DEFLATED) -> bytes:
+    target = _UnseekableBuffer() if streamed else io.BytesIO()
+
+    with zipfile.ZipFile(target, "w", compression=compression) as zf:  # type: ignore
+        for name, content in entries.items():
+            zf.writestr(name, content)
+
+    if streamed:
+        return target.buffer.getvalue()  # type: ignore
+
+    return target.getvalue()  # type: ignore
+
+
+async def _chunked(data: bytes, size: int = 7):
+    for start in range(0, len(data), size):
+        yield data[start : start + size]
+
+
+def _file(file_id: int, filename: str, content: bytes, directory_label=None):
+    metadata = {
+        "dataFile": {
+            "id": file_id,
+            "filename": filename,
+            "filesize": len(content),
+            "checksum": {"type": "MD5", "value": hashlib.md5(content).hexdigest()},
+        }
+    }
+
+    if directory_label:
+        metadata["directoryLabel"] = directory_label
+
+    return metadata
+
+
+class TestBundle:
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "streamed,compression",
+        [
+            (True, zipfile.ZIP_DEFLATED),
+            (False, zipfile.ZIP_DEFLATED),
+            (False, zipfile.ZIP_STORED),
+        ],
+    )
+    def test_extract_zip_stream(self, tmp_path, streamed, compression):
+        # Arrange
+        entries = {
+            "data/first.txt": b"first file" * 1000,
+            "second.txt": b"second file",
+            "MANIFEST.TXT": b"manifest",
+        }
+        data = _zip(entries, streamed=streamed, compression=compression)
+        targets = {
+            "data/first.txt": str(tmp_path / "data" / "first.txt"),
+            "second.txt": str(tmp_path / "second.txt"),
+        }
+        extracted = {}
+
+        # Act
+        names = asyncio.run(
+            extract_zip_stream(
+                _chunked(data),
+                target=targets.get,
+                on_extracted=lambda name, path, size, digest: extracted.update(
+                    {name: digest}
+                ),
+                checksum_types={"second.txt": "MD5"},
+            )
+        )
+
+        # Assert
+        assert names == ["data/first.txt", "second.txt"]
+        assert (tmp_path / "data" / "first.txt").read_bytes() == entries[
+            "data/first.txt"
+        ]
+        assert (tmp_path / "second.txt").read_bytes() == entries["second.txt"]
+        assert not (tmp_path / "MANIFEST.TXT").exists()
+        assert extracted == {
+            "data/first.txt": None,
+            "second.txt": hashlib.md5(entries["second.txt"]).hexdigest(),
+        }
+
+    @pytest.mark.unit
+    def test_extract_truncated_zip_stream(self, tmp_path):
+        # Arrange
+        data = _zip({"file.txt": b"content" * 1000})
+        path = tmp_path / "file.txt"
+
+        # Act & Assert
+        with pytest.raises(BundleError):
+            asyncio.run(
+                extract_zip_stream(
+                    _chunked(data[: len(data) // 2]),
+                    target=lambda name: str(path),
+                )
+            )
+
+        assert list(tmp_path.iterdir()) == []
+
+    @pytest.mark.unit
+    def test_plan_bundles(self):
+        # Arrange
+        files = [
+            {"dataFile": {"id": file_id, "filesize": size}}
+            for file_id, size in enumerate([40, 30, 50, 200, 10])
+        ]
+
+        # Act
+        bundles, oversized = plan_bundles(files, size_limit=100, max_files=3)
+
+        # Assert
+        assert [[f["dataFile"]["id"] for f in bundle] for bundle in bundles] == [
+            [0, 1],
+            [2, 4],
+        ]
+        assert [f["dataFile"]["id"] for f in oversized] == [3]
+
+    @pytest.mark.unit
+    def test_download_files_in_bundles(self, tmp_path):
+        # Arrange
+        contents = {
+            1: b"first file",
+            2: b"second file",
+            3: b"third file",
+            4: b"large file" * 100,
+        }
+        files_list = [
+            _file(1, "first.txt", contents[1], directory_label="data"),
+            _file(2, "second.txt", contents[2]),
+            _file(3, "third.txt", contents[3]),
+            _file(4, "large.txt", contents[4]),
+        ]
+        requested = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requested.append(request.url.path)
+
+            if request.url.path.startswith("/api/access/datafiles/"):
+                # Third file is missing from the bundle
+                data = _zip(
+                    {
+                        "data/first.txt": contents[1],
+                        "second.txt": contents[2],
+                        "MANIFEST.TXT": b"manifest",
+                    }
+                )
+                return httpx.Response(200, content=data)
+
+            file_id = int(request.url.path.rsplit("/", 1)[-1])
+            return httpx.Response(200, content=contents[file_id])
+
+        async def main():
+            async with httpx.AsyncClient(
+                base_url="http://localhost:8080",
+                transport=httpx.MockTransport(handler),
+            ) as client:
+                return await download_files(
+                    data_api=DataAccessApi("http://localhost:8080"),
+                    files_list=files_list,
+                    filedir=str(tmp_path),
+                    filenames=[],
+                    n_parallel_downloads=2,
+                    client=client,
+                    bundle=True,
+                    bundle_size_limit=100,
+                )
+
+        # Act
+        files = asyncio.run(main())
+
+        # Assert
+        assert sorted(requested) == [
+            "/api/access/datafile/3",
+            "/api/access/datafile/4",
+            "/api/access/datafiles/1,2,3",
+        ]
+        assert [file.file_id for file in files] == ["1", "2", "3", "4"]
+        assert (tmp_path / "data" / "first.txt").read_bytes() == contents[1]
+        assert (tmp_path / "second.txt").read_bytes() == contents[2]
+        assert (tmp_path / "third.txt").read_bytes() == contents[3]
+        assert (tmp_path / "large.txt").read_bytes() == contents[4]
+        assert files[0].checksum.value == hashlib.md5(contents[1]).hexdigest()  # type: ignore
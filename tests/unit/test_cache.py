@@ -0,0 +1,94 @@
+import json
+import os
+
+import pytest
+
+from easyDataverse.cache import SchemaCache
+
+
+BLOCKS = [
+    {"status": "OK", "data": {"name": "citation", "fields": {}}},
+    {"status": "OK", "data": {"name": "geospatial", "fields": {}}},
+]
+
+
+class TestSchemaCache:
+    @pytest.mark.unit
+    def test_store_and_load(self, tmp_path):
+        # Arrange
+        cache = SchemaCache(directory=str(tmp_path))
+
+        # Act
+        cache.store("https://demo.dataverse.org/", "6.4", BLOCKS)
+        cached = cache.load("https://demo.dataverse.org", "6.4")
+
+        # Assert
+        assert cached is not None
+        assert [block.data.name for block in cached] == ["citation", "geospatial"]
+
+    @pytest.mark.unit
+    def test_version_mismatch(self, tmp_path):
+        # Arrange
+        cache = SchemaCache(directory=str(tmp_path))
+        cache.store("https://demo.dataverse.org", "6.4", BLOCKS)
+
+        # Act
+        cached = cache.load("https://demo.dataverse.org", "6.5")
+
+        # Assert
+        assert cached is None
+
+    @pytest.mark.unit
+    def test_expired_entry(self, tmp_path):
+        # Arrange
+        cache = SchemaCache(directory=str(tmp_path), ttl=60)
+        path = cache.store("https://demo.dataverse.org", "6.4", BLOCKS)
+
+        with open(path, "r") as f:
+            entry = json.load(f)
+
+        entry["created_at"] -= 120
+
+        with open(path, "w") as f:
+            json.dump(entry, f)
+
+        # Act
+        cached = cache.load("https://demo.dataverse.org", "6.4")
+
+        # Assert
+        assert cached is None
+
+    @pytest.mark.unit
+    def test_tampered_entry(self, tmp_path):
+        # Arrange
+        cache = SchemaCache(directory=str(tmp_path))
+        path = cache.store("https://demo.dataverse.org", "6.4", BLOCKS)
+
+        with open(path, "r") as f:
+            entry = json.load(f)
+
+        entry["blocks"] = entry["blocks"][:1]
+
+        with open(path, "w") as f:
+            json.dump(entry, f)
+
+        # Act
+        cached = cache.load("https://demo.dataverse.org", "6.4")
+
+        # Assert
+        assert cached is None
+
+    @pytest.mark.unit
+    def test_invalidate(self, tmp_path):
+        # Arrange
+        cache = SchemaCache(directory=str(tmp_path))
+        cache.store("https://demo.dataverse.org", "6.4", BLOCKS)
+        cache.store("https://other.dataverse.org", "6.4", BLOCKS)
+
+        # Act
+        cache.invalidate("https://demo.dataverse.org")
+
+        # Assert
+        assert cache.load("https://demo.dataverse.org", "6.4") is None
+        assert cache.load("https://other.dataverse.org", "6.4") is not None
+        assert len(os.listdir(tmp_path)) == 1
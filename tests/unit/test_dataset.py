@@ -0,0 +1,50 @@
+import pytest
+from pydantic import ValidationError
+
+from easyDataverse.dataset import Dataset
+from easyDataverse.datasettype import DatasetType
+from easyDataverse.dataverse import Dataverse
+
+
+class TestDataset:
+    @pytest.mark.unit
+    def test_dataset_type_uses_dataverse_registry(self, monkeypatch):
+        """Test that dataset types are validated against the types cached by the Dataverse"""
+
+        def from_instance(cls, base_url):
+            raise AssertionError("Dataset types should not be fetched")
+
+        monkeypatch.setattr(DatasetType, "from_instance", classmethod(from_instance))
+
+        dataverse = Dataverse.model_construct(server_url="http://localhost:8080")
+        dataverse.__dict__["dataset_types"] = {
+            "dataset": DatasetType(id=1, name="dataset"),
+            "software": DatasetType(id=2, name="software"),
+        }
+
+        dataset = Dataset(DATAVERSE_URL="http://localhost:8080")
+        dataset._dataverse = dataverse
+
+        dataset.dataset_type = "software"
+
+        with pytest.raises(ValidationError):
+            dataset.dataset_type = "unknown"
+
+        assert dataset.dataset_type == "software"
+
+    @pytest.mark.unit
+    def test_dataset_type_is_fetched_once(self, monkeypatch):
+        """Test that standalone datasets fetch the available dataset types only once"""
+        calls = []
+
+        def from_instance(cls, base_url):
+            calls.append(base_url)
+            return [DatasetType(id=1, name="dataset")]
+
+        monkeypatch.setattr(DatasetType, "from_instance", classmethod(from_instance))
+
+        dataset = Dataset(DATAVERSE_URL="http://localhost:8080", dataset_type="dataset")
+        dataset.dataset_type = "dataset"
+        dataset.p_id = "doi:10.5072/FK2/ABCDEF"
+
+        assert len(calls) == 1
@@ -1,8 +1,24 @@
+import json
+import httpx
 import pytest
+from dotted_dict import DottedDict
 
+from easyDataverse import dataverse as dataverse_module
 from easyDataverse.dataverse import Dataverse
+from easyDataverse.license import License
+from easyDataverse.session import Session
 from easyDataverse.utils import extract_major_minor
 
+LICENSE = License(
+    name="MIT",
+    uri="https://opensource.org/licenses/MIT",
+    id=1,
+    shortDescription="MIT License",
+    active=True,
+    isDefault=True,
+    sortOrder=1,
+)
+
 
 class TestDataverse:
     @pytest.mark.unit
@@ -59,3 +75,350 @@ class TestDataverse:
         for version in cases:
             major, minor = extract_major_minor(version)
             assert not Dataverse._check_version(major, minor)
+
+    @pytest.mark.unit
+    def test_licenses_are_cached(self, monkeypatch):
+        """Test that licenses are only fetched once and indexed by name and ID"""
+        calls = []
+
+        def fetch_licenses(self):
+            calls.append(1)
+            return {"MIT": LICENSE}
+
+        monkeypatch.setattr(Dataverse, "_fetch_licenses", fetch_licenses)
+        dataverse = Dataverse.model_construct(server_url="http://localhost:8080")
+
+        assert dataverse.default_license == LICENSE
+        assert dataverse.get_license("MIT") == LICENSE
+        assert dataverse.get_license(1) == LICENSE
+        assert dataverse.get_license("Unknown") is None
+        assert len(calls) == 1
+
+        dataverse.refresh_licenses()
+
+        assert len(calls) == 2
+
+    @pytest.mark.unit
+    def test_licenses_expire(self, monkeypatch):
+        """Test that licenses are fetched again once the TTL has passed"""
+        calls = []
+
+        def fetch_licenses(self):
+            calls.append(1)
+            return {"MIT": LICENSE}
+
+        monkeypatch.setattr(Dataverse, "_fetch_licenses", fetch_licenses)
+        dataverse = Dataverse.model_construct(
+            server_url="http://localhost:8080",
+            license_ttl=60,
+        )
+
+        dataverse.licenses
+        dataverse._licenses_fetched_at -= 120
+        dataverse.licenses
+
+        assert len(calls) == 2
+
+    @pytest.mark.unit
+    def test_construct_block_classes(self, mock_installation):
+        # Arrange
+        dataverse = Dataverse(
+            "http://localhost:8080",  # type: ignore
+            session=Session(
+                base_url="http://localhost:8080",
+                transport=mock_installation,
+            ),
+        )
+        dataset = dataverse.create_dataset()
+        blocks = DottedDict(
+            {
+                "citation": {
+                    "fields": [
+                        {"typeName": "title", "value": "My dataset"},
+                        {
+                            "typeName": "author",
+                            "value": [
+                                {
+                                    "authorName": {
+                                        "typeName": "authorName",
+                                        "value": "John Doe",
+                                    }
+                                }
+                            ],
+                        },
+                    ]
+                }
+            }
+        )
+
+        # Act
+        dataverse._construct_block_classes(blocks, dataset)
+
+        # Assert
+        assert dataset.citation.title == "My dataset"  # type: ignore
+        assert dataset.citation.author[0].name == "John Doe"  # type: ignore
+        dataverse.close()
+
+    @pytest.mark.unit
+    def test_load_datasets(self, mock_installation):
+        # Arrange
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path != "/api/datasets/:persistentId/":
+                return mock_installation.handler(request)
+
+            pid = request.url.params["persistentId"]
+
+            if pid == "doi:10.5072/missing":
+                return httpx.Response(404, json={"status": "ERROR"})
+
+            return httpx.Response(
+                200,
+                json={
+                    "data": {
+                        "latestVersion": {
+                            "datasetPersistentId": pid,
+                            "license": {"name": "CC0 1.0"},
+                            "files": [],
+                            "metadataBlocks": {
+                                "citation": {
+                                    "fields": [{"typeName": "title", "value": pid}]
+                                }
+                            },
+                        }
+                    }
+                },
+            )
+
+        dataverse = Dataverse(
+            "http://localhost:8080",  # type: ignore
+            session=Session(
+                base_url="http://localhost:8080",
+                transport=httpx.MockTransport(handler),
+            ),
+        )
+        pids = ["doi:10.5072/first", "doi:10.5072/missing", "doi:10.5072/second"]
+
+        # Act
+        results = dataverse.load_datasets(pids, concurrency=2)
+
+        # Assert
+        assert [result.pid for result in results] == pids
+        assert [result.ok for result in results] == [True, False, True]
+        assert results[0].dataset.citation.title == "doi:10.5072/first"  # type: ignore
+        assert results[0].dataset.license.name == "CC0 1.0"  # type: ignore
+        assert results[2].dataset.p_id == "doi:10.5072/second"  # type: ignore
+        assert "404" in results[1].error  # type: ignore
+        dataverse.close()
+
+    @pytest.mark.unit
+    def test_load_dataset_download_options(self, mock_installation, monkeypatch):
+        # Arrange
+        calls = []
+
+        async def download_files(**kwargs):
+            calls.append(kwargs)
+            return []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path != "/api/datasets/:persistentId/":
+                return mock_installation.handler(request)
+
+            return httpx.Response(
+                200,
+                json={
+                    "data": {
+                        "latestVersion": {
+                            "datasetPersistentId": "doi:10.5072/ds",
+                            "files": [
+                                {"dataFile": {"id": 1, "filename": "a.txt"}},
+                            ],
+                            "metadataBlocks": {},
+                        }
+                    }
+                },
+            )
+
+        monkeypatch.setattr(dataverse_module, "download_files", download_files)
+        dataverse = Dataverse(
+            "http://localhost:8080",  # type: ignore
+            session=Session(
+                base_url="http://localhost:8080",
+                transport=httpx.MockTransport(handler),
+            ),
+        )
+
+        # Act
+        dataverse.load_dataset(
+            "doi:10.5072/ds",
+            progress="silent",
+            policy="lpt",
+            max_bytes_in_flight=1024,
+            segment_threshold=None,
+            max_retries=1,
+        )
+
+        # Assert
+        assert calls[0]["policy"] == "lpt"
+        assert calls[0]["max_bytes_in_flight"] == 1024
+        assert calls[0]["segment_threshold"] is None
+        assert calls[0]["max_retries"] == 1
+        dataverse.close()
+
+    @pytest.mark.unit
+    def test_upload_many(self, mock_installation):
+        # Arrange
+        created = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path != "/api/dataverses/root/datasets":
+                return mock_installation.handler(request)
+
+            payload = json.loads(request.content)
+            fields = payload["datasetVersion"]["metadataBlocks"]["citation"]["fields"]
+            title = next(f["value"] for f in fields if f["typeName"] == "title")
+
+            if title == "Rejected":
+                return httpx.Response(400, json={"status": "ERROR"})
+
+            created.append(title)
+
+            return httpx.Response(
+                201, json={"data": {"persistentId": f"doi:10.5072/{title}"}}
+            )
+
+        dataverse = Dataverse(
+            "http://localhost:8080",  # type: ignore
+            api_token="9eb39a88-ab0d-415d-80c2-32cbafdb5f6f",  # type: ignore
+            session=Session(
+                base_url="http://localhost:8080",
+                transport=httpx.MockTransport(handler),
+            ),
+        )
+
+        datasets = []
+
+        for title in ["first", "Rejected", "second"]:
+            dataset = dataverse.create_dataset()
+            dataset.citation.title = title  # type: ignore
+            dataset.citation.subject = ["Other"]  # type: ignore
+            dataset.citation.add_author(name="John Doe")  # type: ignore
+            dataset.citation.add_dataset_contact(  # type: ignore
+                name="John Doe",
+                email="john@doe.com",
+            )
+            dataset.citation.add_ds_description(value="Description")  # type: ignore
+            datasets.append(dataset)
+
+        # Act
+        results = dataverse.upload_many(datasets, "root", concurrency=2)
+
+        # Assert
+        assert [result.ok for result in results] == [True, False, True]
+        assert [result.pid for result in results] == [
+            "doi:10.5072/first",
+            None,
+            "doi:10.5072/second",
+        ]
+        assert datasets[2].p_id == "doi:10.5072/second"
+        assert sorted(created) == ["first", "second"]
+        dataverse.close()
+
+    @pytest.mark.unit
+    def test_fetch_dataset_version(self, mock_installation):
+        # Arrange
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            path = request.url.path
+
+            if not path.startswith("/api/datasets/:persistentId/versions"):
+                return mock_installation.handler(request)
+
+            requests.append(request.url)
+
+            if path.endswith("/versions/1.0"):
+                return httpx.Response(
+                    200,
+                    json={"data": {"versionNumber": 1, "metadataBlocks": {}}},
+                )
+            elif path.endswith("/versions"):
+                return httpx.Response(
+                    200,
+                    json={
+                        "data": [
+                            {
+                                "versionNumber": 1,
+                                "versionMinorNumber": 0,
+                                "versionState": "RELEASED",
+                            },
+                            {"versionState": "DRAFT"},
+                        ]
+                    },
+                )
+
+            return httpx.Response(404, json={"status": "ERROR"})
+
+        dataverse = Dataverse(
+            "http://localhost:8080",  # type: ignore
+            session=Session(
+                base_url="http://localhost:8080",
+                transport=httpx.MockTransport(handler),
+            ),
+        )
+
+        # Act
+        remote_ds = dataverse._fetch_dataset(
+            "doi:10.5072/ds", "1.0", include_files=False
+        )
+
+        with pytest.raises(ValueError, match=r"\['1.0'\]"):
+            dataverse._fetch_dataset("doi:10.5072/ds", "2.0")
+
+        dataverse._available_versions("doi:10.5072/ds")
+
+        # Assert
+        assert remote_ds.data.latestVersion.files == []  # type: ignore
+        assert requests[0].params["excludeFiles"] == "true"
+        assert "excludeFiles" not in requests[1].params
+        assert requests[2].params["excludeFiles"] == "true"
+        assert len(requests) == 3
+        dataverse.close()
+
+    @pytest.mark.unit
+    def test_load_dataset_version_lists_files(self, mock_installation, capsys):
+        # Arrange
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path != "/api/datasets/:persistentId/versions/1.0":
+                return mock_installation.handler(request)
+
+            requests.append(request.url)
+
+            return httpx.Response(
+                200,
+                json={
+                    "data": {
+                        "datasetPersistentId": "doi:10.5072/ds",
+                        "versionNumber": 1,
+                        "files": [{"dataFile": {"id": 1, "filename": "a.txt"}}],
+                        "metadataBlocks": {},
+                    }
+                },
+            )
+
+        dataverse = Dataverse(
+            "http://localhost:8080",  # type: ignore
+            session=Session(
+                base_url="http://localhost:8080",
+                transport=httpx.MockTransport(handler),
+            ),
+        )
+
+        # Act
+        dataverse.load_dataset("doi:10.5072/ds", version="1.0", download_files=False)
+
+        # Assert
+        assert "excludeFiles" not in requests[0].params
+        assert "Files: 1" in capsys.readouterr().out
+        dataverse.close()
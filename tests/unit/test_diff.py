@@ -0,0 +1,208 @@
+import httpx
+import pytest
+from dotted_dict import DottedDict
+
+from easyDataverse import Dataverse, Session, uploader
+from easyDataverse.diff import MetadataSnapshot, diff_metadata
+
+
+def _dataverse_dict(fields):
+    return {
+        "datasetType": "dataset",
+        "datasetVersion": {"metadataBlocks": {"citation": {"fields": fields}}},
+    }
+
+
+def _field(name, value, multiple=False, type_class="primitive"):
+    return {
+        "multiple": multiple,
+        "typeClass": type_class,
+        "typeName": name,
+        "value": value,
+    }
+
+
+def _author(name):
+    return {
+        "authorName": _field("authorName", name),
+    }
+
+
+class TestDiff:
+    @pytest.mark.unit
+    def test_unchanged(self):
+        # Arrange
+        metadata = _dataverse_dict(
+            [
+                _field("title", "My dataset"),
+                _field("subject", ["Other"], multiple=True),
+            ]
+        )
+        snapshot = MetadataSnapshot.from_dataverse_dict(metadata)
+
+        # Act
+        diff = diff_metadata(snapshot, metadata)
+
+        # Assert
+        assert diff.is_empty
+
+    @pytest.mark.unit
+    def test_minimal_changes(self):
+        # Arrange
+        authors = [_author(f"Author {i}") for i in range(100)]
+        subjects = ["Other"]
+        snapshot = MetadataSnapshot.from_dataverse_dict(
+            _dataverse_dict(
+                [
+                    _field("title", "My dataset"),
+                    _field("subject", subjects, multiple=True),
+                    _field("author", authors, multiple=True, type_class="compound"),
+                    _field("notesText", "Some notes"),
+                ]
+            )
+        )
+
+        # Modify in place, as done by users of the dataset
+        subjects.append("Chemistry")
+        authors[42] = _author("Changed Author")
+
+        # Act
+        diff = diff_metadata(
+            snapshot,
+            _dataverse_dict(
+                [
+                    _field("title", "My new dataset"),
+                    _field("subject", subjects, multiple=True),
+                    _field("author", authors, multiple=True, type_class="compound"),
+                    _field("alternativeTitle", "Other title"),
+                ]
+            ),
+        )
+
+        # Assert
+        assert diff.replace == [{"typeName": "title", "value": "My new dataset"}]
+        assert diff.add == [
+            {"typeName": "subject", "value": ["Chemistry"]},
+            {"typeName": "author", "value": [_author("Changed Author")]},
+            {"typeName": "alternativeTitle", "value": "Other title"},
+        ]
+        assert diff.delete == [
+            {"typeName": "author", "value": [_author("Author 42")]},
+            {"typeName": "notesText", "value": "Some notes"},
+        ]
+
+    @pytest.mark.unit
+    def test_replace_single_required_value(self):
+        # Arrange
+        snapshot = MetadataSnapshot.from_dataverse_dict(
+            _dataverse_dict(
+                [
+                    _field("subject", ["Other"], multiple=True),
+                    _field(
+                        "author",
+                        [_author("John Doe")],
+                        multiple=True,
+                        type_class="compound",
+                    ),
+                ]
+            )
+        )
+
+        # Act
+        diff = diff_metadata(
+            snapshot,
+            _dataverse_dict(
+                [
+                    _field("subject", ["Chemistry"], multiple=True),
+                    _field(
+                        "author",
+                        [_author("Jane Doe")],
+                        multiple=True,
+                        type_class="compound",
+                    ),
+                ]
+            ),
+        )
+
+        # Assert
+        assert diff.replace == [
+            {"typeName": "subject", "value": ["Chemistry"]},
+            {"typeName": "author", "value": [_author("Jane Doe")]},
+        ]
+        assert diff.add == []
+        assert diff.delete == []
+
+    @pytest.mark.unit
+    def test_update_adds_before_deleting(self):
+        # Arrange
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request.url.path.rsplit("/", 1)[-1])
+            return httpx.Response(200, json={"status": "OK"})
+
+        client = httpx.Client(transport=httpx.MockTransport(handler))
+        author = {"typeName": "author", "value": [_author("Jane Doe")]}
+
+        # Act
+        uploader.update_dataset(
+            p_id="doi:10.5072/A",
+            to_change={"fields": [{"typeName": "title", "value": "My dataset"}]},
+            files=[],
+            DATAVERSE_URL="http://localhost:8080",
+            API_TOKEN="token",
+            client=client,
+            to_add={"fields": [author]},
+            to_delete={"fields": [{**author, "value": [_author("John Doe")]}]},
+        )
+
+        # Assert
+        assert requests == ["editMetadata", "editMetadata", "deleteMetadata"]
+
+    @pytest.mark.unit
+    def test_dataset_changes_against_snapshot(self, mock_installation):
+        # Arrange
+        dataverse = Dataverse(
+            "http://localhost:8080",  # type: ignore
+            session=Session(
+                base_url="http://localhost:8080",
+                transport=mock_installation,
+            ),
+        )
+        dataset = dataverse.create_dataset()
+        blocks = DottedDict(
+            {
+                "citation": {
+                    "fields": [
+                        {"typeName": "title", "value": "My dataset"},
+                        {
+                            "typeName": "author",
+                            "value": [
+                                {
+                                    "authorName": {
+                                        "typeName": "authorName",
+                                        "value": "John Doe",
+                                    }
+                                }
+                            ],
+                        },
+                    ]
+                }
+            }
+        )
+        dataverse._construct_block_classes(blocks, dataset)
+        dataset._take_metadata_snapshot()
+
+        # Act
+        unchanged = dataset._extract_changes()
+        dataset.citation.add_author(name="Jane Doe")  # type: ignore
+        changed = dataset._extract_changes()
+
+        # Assert
+        assert unchanged.is_empty
+        assert changed.replace == []
+        assert changed.delete == []
+        assert [field["typeName"] for field in changed.add] == ["author"]
+        assert len(changed.add[0]["value"]) == 1
+        assert changed.add[0]["value"][0]["authorName"]["value"] == "Jane Doe"
+        dataverse.close()
@@ -0,0 +1,565 @@
+import asyncio
+import hashlib
+import json
+import os
+import threading
+
+import httpx
+import pytest
+from pyDataverse.api import DataAccessApi
+
+from easyDataverse import downloader, fileindex
+from easyDataverse.downloader import (
+    ChecksumMismatchError,
+    IncompleteDownloadError,
+    _download_file,
+    download_files,
+)
+from easyDataverse.fileindex import INDEX_FILENAME
+from easyDataverse.progress import DownloadProgress
+
+CONTENT = b"0123456789" * 100
+
+
+class _DroppingStream(httpx.AsyncByteStream):
+    """Sends the first bytes of the content and then drops the connection."""
+
+    def __init__(self, content: bytes, n_bytes: int):
+        self.content = content
+        self.n_bytes = n_bytes
+
+    async def __aiter__(self):
+        yield self.content[: self.n_bytes]
+        raise httpx.ReadError("Connection dropped")
+
+
+def _file_metadata(filesize: int = len(CONTENT), checksum=None):
+    metadata = {
+        "directoryLabel": "data",
+        "dataFile": {"id": 1, "filename": "file.txt", "filesize": filesize},
+    }
+
+    if checksum:
+        metadata["dataFile"]["checksum"] = checksum
+
+    return metadata
+
+
+def _ranged_response(request: httpx.Request) -> httpx.Response:
+    """Answers a range request like a server supporting partial content."""
+
+    start, end = request.headers["Range"].removeprefix("bytes=").split("-")
+    end = int(end) + 1 if end else len(CONTENT)
+
+    return httpx.Response(206, content=CONTENT[int(start) : end])
+
+
+def _download(
+    transport: httpx.MockTransport,
+    filedir: str,
+    segment_threshold=None,
+    segment_size=downloader.SEGMENT_SIZE,
+    **kwargs,
+):
+    async def main():
+        async with httpx.AsyncClient(
+            base_url="http://localhost:8080",
+            transport=transport,
+        ) as client:
+            file = _file_metadata(**kwargs)
+            return await _download_file(
+                client=client,
+                file=file,
+                filedir=filedir,
+                progress=DownloadProgress([file], mode="silent"),
+                index=0,
+                max_retries=2,
+                semaphore=asyncio.Semaphore(2),
+                segment_threshold=segment_threshold,
+                segment_size=segment_size,
+            )
+
+    return asyncio.run(main())
+
+
+class TestDownloader:
+    @pytest.mark.unit
+    def test_resume_after_dropped_connection(self, tmp_path, monkeypatch):
+        # Arrange
+        monkeypatch.setattr(downloader, "BACKOFF_BASE", 0.0)
+        monkeypatch.setattr(downloader, "CHUNK_SIZE", 100)
+        ranges = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            ranges.append(request.headers.get("Range"))
+
+            if "Range" not in request.headers:
+                return httpx.Response(200, stream=_DroppingStream(CONTENT, 300))
+
+            return httpx.Response(206, content=CONTENT[300:])
+
+        # Act
+        file = _download(httpx.MockTransport(handler), str(tmp_path))
+
+        # Assert
+        assert ranges == [None, "bytes=300-"]
+        assert open(file.filepath, "rb").read() == CONTENT
+        assert not os.path.exists(file.filepath + ".part")
+
+    @pytest.mark.unit
+    def test_restart_if_range_is_ignored(self, tmp_path, monkeypatch):
+        # Arrange
+        monkeypatch.setattr(downloader, "BACKOFF_BASE", 0.0)
+        os.makedirs(tmp_path / "data")
+        (tmp_path / "data" / "file.txt.part").write_bytes(b"garbage")
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, content=CONTENT)
+
+        # Act
+        file = _download(httpx.MockTransport(handler), str(tmp_path))
+
+        # Assert
+        assert open(file.filepath, "rb").read() == CONTENT
+
+    @pytest.mark.unit
+    def test_incomplete_download(self, tmp_path, monkeypatch):
+        # Arrange
+        monkeypatch.setattr(downloader, "BACKOFF_BASE", 0.0)
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, content=CONTENT)
+
+        # Act & Assert
+        with pytest.raises(IncompleteDownloadError):
+            _download(
+                httpx.MockTransport(handler),
+                str(tmp_path),
+                filesize=len(CONTENT) + 1,
+            )
+
+        assert len(requests) == 3
+        assert not os.path.exists(tmp_path / "data" / "file.txt")
+
+    @pytest.mark.unit
+    def test_checksum_mismatch_is_retried(self, tmp_path, monkeypatch):
+        # Arrange
+        monkeypatch.setattr(downloader, "BACKOFF_BASE", 0.0)
+        monkeypatch.setattr(downloader, "CHUNK_SIZE", 100)
+        checksum = {"type": "SHA-256", "value": hashlib.sha256(CONTENT).hexdigest()}
+        ranges = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            ranges.append(request.headers.get("Range"))
+
+            if len(ranges) == 1:
+                # Corrupt first attempt
+                return httpx.Response(200, content=CONTENT[::-1])
+            elif len(ranges) == 2:
+                return httpx.Response(200, stream=_DroppingStream(CONTENT, 300))
+
+            return httpx.Response(206, content=CONTENT[300:])
+
+        # Act
+        file = _download(
+            httpx.MockTransport(handler),
+            str(tmp_path),
+            checksum=checksum,
+        )
+
+        # Assert
+        assert ranges == [None, None, "bytes=300-"]
+        assert open(file.filepath, "rb").read() == CONTENT
+        assert file.checksum.type == "SHA-256"  # type: ignore
+        assert file.checksum.value == checksum["value"]  # type: ignore
+
+    @pytest.mark.unit
+    def test_checksum_mismatch(self, tmp_path, monkeypatch):
+        # Arrange
+        monkeypatch.setattr(downloader, "BACKOFF_BASE", 0.0)
+        checksum = {"type": "MD5", "value": hashlib.md5(b"other").hexdigest()}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, content=CONTENT)
+
+        # Act & Assert
+        with pytest.raises(ChecksumMismatchError):
+            _download(
+                httpx.MockTransport(handler),
+                str(tmp_path),
+                checksum=checksum,
+            )
+
+        assert not os.path.exists(tmp_path / "data" / "file.txt.part")
+
+    @pytest.mark.unit
+    def test_segmented_download(self, tmp_path, monkeypatch):
+        # Arrange
+        monkeypatch.setattr(downloader, "BACKOFF_BASE", 0.0)
+        checksum = {"type": "MD5", "value": hashlib.md5(CONTENT).hexdigest()}
+        ranges = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            ranges.append(request.headers["Range"])
+
+            if ranges.count("bytes=300-599") == 1 and ranges[-1] == "bytes=300-599":
+                # Fail the second segment once
+                return httpx.Response(503)
+
+            return _ranged_response(request)
+
+        # Act
+        file = _download(
+            httpx.MockTransport(handler),
+            str(tmp_path),
+            segment_threshold=100,
+            segment_size=300,
+            checksum=checksum,
+        )
+
+        # Assert
+        assert sorted(set(ranges)) == [
+            "bytes=0-299",
+            "bytes=300-599",
+            "bytes=600-899",
+            "bytes=900-999",
+        ]
+        assert open(file.filepath, "rb").read() == CONTENT
+        assert file.checksum.value == checksum["value"]  # type: ignore
+
+    @pytest.mark.unit
+    def test_resume_segmented_download(self, tmp_path):
+        # Arrange
+        checksum = {"type": "MD5", "value": hashlib.md5(CONTENT).hexdigest()}
+        part_path = tmp_path / "data" / "file.txt.part"
+        sidecar_path = tmp_path / "data" / "file.txt.part.segments"
+        ranges = []
+
+        def failing(request: httpx.Request) -> httpx.Response:
+            if request.headers["Range"] == "bytes=600-899":
+                return httpx.Response(403)
+
+            return _ranged_response(request)
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            ranges.append(request.headers["Range"])
+            return _ranged_response(request)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            _download(
+                httpx.MockTransport(failing),
+                str(tmp_path),
+                segment_threshold=100,
+                segment_size=300,
+                checksum=checksum,
+            )
+
+        kept_part = part_path.exists()
+        done = json.loads(sidecar_path.read_text())["done"]
+        segments = {0: "bytes=0-299", 300: "bytes=300-599", 600: "bytes=600-899"}
+        segments[900] = "bytes=900-999"
+
+        # Act
+        file = _download(
+            httpx.MockTransport(handler),
+            str(tmp_path),
+            segment_threshold=100,
+            segment_size=300,
+            checksum=checksum,
+        )
+
+        # Assert
+        assert kept_part
+        assert done
+        assert sorted(ranges) == sorted(
+            rng for start, rng in segments.items() if start not in done
+        )
+        assert open(file.filepath, "rb").read() == CONTENT
+        assert not part_path.exists()
+        assert not sidecar_path.exists()
+
+    @pytest.mark.unit
+    def test_segmented_download_without_range_support(self, tmp_path):
+        # Arrange
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, content=CONTENT)
+
+        # Act
+        file = _download(
+            httpx.MockTransport(handler),
+            str(tmp_path),
+            segment_threshold=100,
+            segment_size=300,
+        )
+
+        # Assert
+        assert open(file.filepath, "rb").read() == CONTENT
+
+    @pytest.mark.unit
+    def test_client_errors_are_not_retried(self, tmp_path):
+        # Arrange
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(403)
+
+        # Act & Assert
+        with pytest.raises(httpx.HTTPStatusError):
+            _download(httpx.MockTransport(handler), str(tmp_path))
+
+        assert len(requests) == 1
+
+    @pytest.mark.unit
+    def test_sync_downloads_only_changed_files(self, tmp_path):
+        # Arrange
+        contents = {1: b"first file", 2: b"second file"}
+        files_list = [
+            {
+                "dataFile": {
+                    "id": file_id,
+                    "filename": f"file_{file_id}.txt",
+                    "filesize": len(content),
+                    "checksum": {
+                        "type": "MD5",
+                        "value": hashlib.md5(content).hexdigest(),
+                    },
+                }
+            }
+            for file_id, content in contents.items()
+        ]
+        requested = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            file_id = int(request.url.path.rsplit("/", 1)[-1])
+            requested.append(file_id)
+            return httpx.Response(200, content=contents[file_id])
+
+        def sync():
+            async def main():
+                async with httpx.AsyncClient(
+                    base_url="http://localhost:8080",
+                    transport=httpx.MockTransport(handler),
+                ) as client:
+                    return await download_files(
+                        data_api=DataAccessApi("http://localhost:8080"),
+                        files_list=files_list,
+                        filedir=str(tmp_path),
+                        filenames=[],
+                        n_parallel_downloads=2,
+                        client=client,
+                        sync=True,
+                    )
+
+            return asyncio.run(main())
+
+        # Act
+        sync()
+        first_run = sorted(requested)
+        requested.clear()
+
+        (tmp_path / "file_2.txt").write_bytes(b"second FILE")
+        files = sync()
+
+        # Assert
+        assert first_run == [1, 2]
+        assert requested == [2]
+        assert len(files) == 2
+        assert (tmp_path / "file_2.txt").read_bytes() == contents[2]
+        assert os.path.exists(tmp_path / INDEX_FILENAME)
+
+    @pytest.mark.unit
+    def test_sync_reuses_index_of_unchanged_files(self, tmp_path, monkeypatch):
+        # Arrange
+        content = b"local file"
+        (tmp_path / "file.txt").write_bytes(content)
+        files_list = [
+            {
+                "dataFile": {
+                    "id": 1,
+                    "filename": "file.txt",
+                    "filesize": len(content),
+                    "checksum": {
+                        "type": "MD5",
+                        "value": hashlib.md5(content).hexdigest().upper(),
+                    },
+                }
+            }
+        ]
+        hashed = []
+        file_checksum = fileindex.file_checksum
+
+        def counting_checksum(path, checksum_type):
+            hashed.append(threading.current_thread())
+            return file_checksum(path, checksum_type)
+
+        monkeypatch.setattr(fileindex, "file_checksum", counting_checksum)
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise AssertionError("Unchanged files should not be downloaded")
+
+        def sync():
+            return asyncio.run(
+                download_files(
+                    data_api=DataAccessApi("http://localhost:8080"),
+                    files_list=files_list,
+                    filedir=str(tmp_path),
+                    filenames=[],
+                    n_parallel_downloads=1,
+                    client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+                    sync=True,
+                )
+            )
+
+        # Act
+        sync()
+        first_run = list(hashed)
+        hashed.clear()
+        files = sync()
+
+        # Assert
+        assert len(first_run) == 1
+        assert first_run[0] is not threading.main_thread()
+        assert hashed == []
+        assert len(files) == 1
+        assert os.path.exists(tmp_path / INDEX_FILENAME)
+
+    @pytest.mark.unit
+    def test_sync_skips_unchanged_files_without_checksum(self, tmp_path):
+        # Arrange
+        content = b"a,b\n1,2\n"
+        # Stale local copy of the same size, which is not in the index yet
+        (tmp_path / "table.csv").write_bytes(b"a,b\n0,0\n")
+        files_list = [
+            {
+                "dataFile": {
+                    "id": 1,
+                    "filename": "table.csv",
+                    "filesize": len(content),
+                    "originalFileFormat": "text/csv",
+                    "checksum": {"type": "MD5", "value": "of-the-ingested-file"},
+                }
+            }
+        ]
+        requested = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requested.append(request)
+            return httpx.Response(200, content=content)
+
+        def sync():
+            return asyncio.run(
+                download_files(
+                    data_api=DataAccessApi("http://localhost:8080"),
+                    files_list=files_list,
+                    filedir=str(tmp_path),
+                    filenames=[],
+                    n_parallel_downloads=1,
+                    client=httpx.AsyncClient(
+                        base_url="http://localhost:8080",
+                        transport=httpx.MockTransport(handler),
+                    ),
+                    sync=True,
+                )
+            )
+
+        # Act
+        sync()
+        first_run = len(requested)
+        requested.clear()
+        second_files = sync()
+        second_run = len(requested)
+
+        (tmp_path / "table.csv").write_bytes(b"a,b\n3,4\n")
+        os.utime(tmp_path / "table.csv", ns=(0, 0))
+        sync()
+
+        # Assert
+        assert first_run == 1
+        assert second_run == 0
+        assert len(second_files) == 1
+        assert len(requested) == 1
+        assert (tmp_path / "table.csv").read_bytes() == content
+
+    @pytest.mark.unit
+    def test_expected_checksum(self):
+        # Arrange
+        checksum = {"type": "MD5", "value": "abc"}
+        plain = {"dataFile": {"checksum": checksum}}
+        tabular = {
+            "dataFile": {"checksum": checksum, "originalFileFormat": "text/csv"}
+        }
+        unsupported = {"dataFile": {"checksum": {"type": "UNF", "value": "abc"}}}
+
+        # Act & Assert
+        assert downloader._expected_checksum(plain) == checksum
+        assert downloader._expected_checksum(tabular) is None
+        assert downloader._expected_checksum(unsupported) is None
+
+
+class TestScheduler:
+    @staticmethod
+    def _files(sizes):
+        return [
+            {"dataFile": {"id": index, "filesize": size}}
+            for index, size in enumerate(sizes)
+        ]
+
+    @pytest.mark.unit
+    def test_order_files(self):
+        # Arrange
+        files = self._files([20, 50, 10])
+
+        # Act
+        largest = downloader._order_files(files, "largest-first")
+        smallest = downloader._order_files(files, "smallest-first")
+
+        # Assert
+        assert largest == [1, 0, 2]
+        assert smallest == [2, 0, 1]
+
+    @pytest.mark.unit
+    def test_lpt_bins(self):
+        # Arrange
+        files = self._files([7, 5, 4, 3, 3, 2])
+
+        # Act
+        bins = downloader._lpt_bins(files, 2)
+
+        # Assert
+        loads = sorted(sum(files[i]["dataFile"]["filesize"] for i in b) for b in bins)
+        assert loads == [12, 12]
+        assert sorted(i for b in bins for i in b) == list(range(6))
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("policy", downloader.SCHEDULING_POLICIES)
+    def test_bytes_in_flight(self, policy):
+        # Arrange
+        files = self._files([60, 50, 40, 30, 200, 10])
+        in_flight = []
+        peak = []
+
+        async def download(index):
+            in_flight.append(files[index]["dataFile"]["filesize"])
+            peak.append(sum(in_flight))
+            await asyncio.sleep(0.001)
+            in_flight.remove(files[index]["dataFile"]["filesize"])
+            return index
+
+        # Act
+        results = asyncio.run(
+            downloader._run_scheduled(
+                files=files,
+                download=download,
+                n_workers=3,
+                policy=policy,
+                max_bytes_in_flight=100,
+            )
+        )
+
+        # Assert
+        assert results == list(range(len(files)))
+        assert max(value for value in peak if value != 200) <= 100
+        assert max(peak) == 200
@@ -0,0 +1,37 @@
+import hashlib
+
+import pytest
+
+from easyDataverse import fileindex
+from easyDataverse.fileindex import FileIndex
+
+
+class TestFileIndex:
+    @pytest.mark.unit
+    def test_unchanged_files_are_not_rehashed(self, tmp_path, monkeypatch):
+        # Arrange
+        (tmp_path / "file.txt").write_bytes(b"content")
+        calls = []
+
+        def file_checksum(path, checksum_type):
+            calls.append(path)
+            return hashlib.md5(open(path, "rb").read()).hexdigest()
+
+        monkeypatch.setattr(fileindex, "file_checksum", file_checksum)
+
+        index = FileIndex.load(str(tmp_path))
+        index.checksum("file.txt", "MD5")
+        index.save()
+
+        # Act
+        reloaded = FileIndex.load(str(tmp_path))
+        checksum = reloaded.checksum("file.txt", "MD5")
+
+        (tmp_path / "file.txt").write_bytes(b"changed content")
+        changed = reloaded.checksum("file.txt", "MD5")
+
+        # Assert
+        assert checksum == hashlib.md5(b"content").hexdigest()
+        assert changed == hashlib.md5(b"changed content").hexdigest()
+        assert len(calls) == 2
+        assert reloaded.checksum("missing.txt", "MD5") is None
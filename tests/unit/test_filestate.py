@@ -0,0 +1,89 @@
+import hashlib
+import os
+
+import pytest
+from dvuploader import File
+from dvuploader.checksum import Checksum
+
+from easyDataverse import dataset as dataset_module
+from easyDataverse.dataset import Dataset
+from easyDataverse.filestate import FileState, plan_file_updates
+
+
+def _downloaded_file(path, directory_label="data"):
+    content = path.read_bytes()
+
+    return File(
+        filepath=str(path),
+        directoryLabel=directory_label,
+        checksum=Checksum(type="MD5", value=hashlib.md5(content).hexdigest()),
+    )
+
+
+class TestFileState:
+    @pytest.mark.unit
+    def test_plan_file_updates(self, tmp_path):
+        # Arrange
+        for name in ["unchanged", "touched", "modified", "new"]:
+            (tmp_path / f"{name}.txt").write_bytes(name.encode())
+
+        loaded = {
+            name: _downloaded_file(tmp_path / f"{name}.txt")
+            for name in ["unchanged", "touched", "modified"]
+        }
+        states = {
+            f"data/{name}.txt": FileState.from_file(file)
+            for name, file in loaded.items()
+        }
+
+        stat = os.stat(tmp_path / "touched.txt")
+        os.utime(
+            tmp_path / "touched.txt",
+            ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9),
+        )
+        (tmp_path / "modified.txt").write_bytes(b"MODIFIED")
+        new = File(filepath=str(tmp_path / "new.txt"), directoryLabel="data")
+
+        # Act
+        plan = plan_file_updates(list(loaded.values()) + [new], states)
+
+        # Assert
+        assert [(op.path, op.action) for op in plan.operations] == [
+            ("data/unchanged.txt", "skip"),
+            ("data/touched.txt", "skip"),
+            ("data/modified.txt", "replace"),
+            ("data/new.txt", "upload"),
+        ]
+        assert plan.to_upload == [loaded["modified"], new]
+        assert plan.count("skip") == 2
+
+    @pytest.mark.unit
+    def test_update_uploads_only_changed_files(self, tmp_path, monkeypatch):
+        # Arrange
+        uploaded = []
+
+        def update_dataset(files, **kwargs):
+            uploaded.append(list(files))
+
+        monkeypatch.setattr(dataset_module, "update_dataset", update_dataset)
+
+        for name in ["first", "second"]:
+            (tmp_path / f"{name}.txt").write_bytes(name.encode())
+
+        dataset = Dataset(p_id="doi:10.5072/FK2/ABCDEF")
+        dataset._track_files(
+            [_downloaded_file(tmp_path / f"{name}.txt") for name in ["first", "second"]]
+        )
+
+        # Act
+        dataset.update()
+        (tmp_path / "second.txt").write_bytes(b"changed")
+        dataset.update()
+        dataset.update()
+
+        # Assert
+        assert [[os.path.basename(f.filepath) for f in files] for files in uploaded] == [
+            [],
+            ["second.txt"],
+            [],
+        ]
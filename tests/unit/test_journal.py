@@ -0,0 +1,252 @@
+import json
+import os
+import threading
+
+import httpx
+import pytest
+from dvuploader import File
+
+from easyDataverse import uploader
+from easyDataverse.dataverse import Dataverse
+from easyDataverse.journal import UploadJournal
+from easyDataverse.session import Session
+
+
+class TestUploadJournal:
+    @pytest.mark.unit
+    def test_resume_from_journal(self, tmp_path):
+        # Arrange
+        for name in ["done", "modified", "pending"]:
+            (tmp_path / f"{name}.txt").write_bytes(name.encode())
+
+        files = [
+            File(filepath=str(tmp_path / f"{name}.txt"), directoryLabel="data")
+            for name in ["done", "modified", "pending"]
+        ]
+        path = str(tmp_path / "journal.jsonl")
+        entry = UploadJournal(path=path).dataset('{"title": "A"}', "root")
+        entry.record_created("doi:10.5072/A")
+        entry.record_uploaded(files[:2])
+
+        (tmp_path / "modified.txt").write_bytes(b"modified twice")
+
+        # Act
+        resumed = UploadJournal(path=path).dataset('{"title": "A"}', "root")
+        other = UploadJournal(path=path).dataset('{"title": "B"}', "root")
+
+        # Assert
+        assert resumed.pid == "doi:10.5072/A"
+        assert [os.path.basename(f.filepath) for f in resumed.pending(files)] == [
+            "modified.txt",
+            "pending.txt",
+        ]
+        assert other.pid is None
+        assert len(other.pending(files)) == 3
+
+    @pytest.mark.unit
+    def test_truncated_line(self, tmp_path):
+        # Arrange
+        path = tmp_path / "journal.jsonl"
+        created = {"event": "created", "key": "a", "pid": "doi:10.5072/A"}
+        path.write_text(json.dumps(created) + '\n{"event": "crea')
+
+        # Act
+        journal = UploadJournal(path=str(path))
+        journal.record_created("b", "doi:10.5072/B")
+        reloaded = UploadJournal(path=str(path))
+
+        # Assert
+        assert reloaded.pid("a") == "doi:10.5072/A"
+        assert reloaded.pid("b") == "doi:10.5072/B"
+
+    @pytest.mark.unit
+    def test_upload_files_in_batches(self, tmp_path, monkeypatch):
+        # Arrange
+        uploaded = []
+        recorded = []
+
+        class FakeUploader:
+            def __init__(self, files, verbose):
+                self.files = files
+
+            def upload(self, **kwargs):
+                uploaded.append(len(self.files))
+
+        monkeypatch.setattr(uploader, "DVUploader", FakeUploader)
+        monkeypatch.setattr(uploader, "UPLOAD_BATCH_SIZE", 2)
+
+        files = []
+
+        for i in range(5):
+            (tmp_path / f"{i}.txt").write_bytes(b"x")
+            files.append(File(filepath=str(tmp_path / f"{i}.txt")))
+
+        api = uploader.NativeApi("http://localhost:8080", "token")
+
+        # Act
+        uploader._uploadFiles(
+            files=files,
+            p_id="doi:10.5072/A",
+            api=api,
+            on_uploaded=lambda batch: recorded.append(len(batch)),
+        )
+
+        # Assert
+        assert uploaded == [2, 2, 1]
+        assert recorded == [2, 2, 1]
+
+    @pytest.mark.unit
+    def test_upload_batches_in_parallel(self, tmp_path, monkeypatch):
+        # Arrange
+        barrier = threading.Barrier(2, timeout=5)
+        recorded = []
+
+        class FakeUploader:
+            def __init__(self, files, verbose):
+                self.files = files
+
+            def upload(self, n_parallel_uploads, **kwargs):
+                if os.path.basename(self.files[0].filepath) == "fail.txt":
+                    raise ValueError("Upload failed")
+
+                # Only passes if both batches are uploaded at the same time
+                barrier.wait()
+
+        monkeypatch.setattr(uploader, "DVUploader", FakeUploader)
+
+        files = []
+
+        for name in ["a", "b", "c", "d", "fail"]:
+            (tmp_path / f"{name}.txt").write_bytes(b"x")
+            files.append(File(filepath=str(tmp_path / f"{name}.txt")))
+
+        api = uploader.NativeApi("http://localhost:8080", "token")
+
+        # Act
+        uploader._uploadFiles(
+            files=files[:4],
+            p_id="doi:10.5072/A",
+            api=api,
+            n_parallel=2,
+            on_uploaded=lambda batch: recorded.append(len(batch)),
+        )
+
+        with pytest.raises(ValueError):
+            uploader._uploadFiles(
+                files=files[4:],
+                p_id="doi:10.5072/A",
+                api=api,
+                n_parallel=2,
+                on_uploaded=lambda batch: recorded.append(len(batch)),
+            )
+
+        # Assert
+        assert recorded == [2, 2]
+
+    @pytest.mark.unit
+    def test_upload_many_skips_created_datasets(self, mock_installation, tmp_path):
+        # Arrange
+        created = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path != "/api/dataverses/root/datasets":
+                return mock_installation.handler(request)
+
+            created.append(request.url.path)
+
+            return httpx.Response(
+                201, json={"data": {"persistentId": "doi:10.5072/new"}}
+            )
+
+        dataverse = Dataverse(
+            "http://localhost:8080",  # type: ignore
+            api_token="9eb39a88-ab0d-415d-80c2-32cbafdb5f6f",  # type: ignore
+            session=Session(
+                base_url="http://localhost:8080",
+                transport=httpx.MockTransport(handler),
+            ),
+        )
+
+        dataset = dataverse.create_dataset()
+        dataset.citation.title = "My dataset"  # type: ignore
+        dataset.citation.subject = ["Other"]  # type: ignore
+        dataset.citation.add_author(name="John Doe")  # type: ignore
+        dataset.citation.add_dataset_contact(  # type: ignore
+            name="John Doe",
+            email="john@doe.com",
+        )
+        dataset.citation.add_ds_description(value="Description")  # type: ignore
+
+        path = str(tmp_path / "journal.jsonl")
+        journal = UploadJournal(path=path)
+        journal.dataset(dataset.dataverse_json(), "root", 0).record_created(
+            "doi:10.5072/previous"
+        )
+
+        # Act
+        results = dataverse.upload_many([dataset], "root", journal=journal)
+
+        # Assert
+        assert created == []
+        assert results[0].ok
+        assert results[0].pid == "doi:10.5072/previous"
+        dataverse.close()
+
+    @pytest.mark.unit
+    def test_upload_many_keeps_identical_datasets_apart(
+        self, mock_installation, tmp_path
+    ):
+        # Arrange
+        created = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path != "/api/dataverses/root/datasets":
+                return mock_installation.handler(request)
+
+            created.append(request.url.path)
+
+            return httpx.Response(
+                201, json={"data": {"persistentId": f"doi:10.5072/{len(created)}"}}
+            )
+
+        dataverse = Dataverse(
+            "http://localhost:8080",  # type: ignore
+            api_token="9eb39a88-ab0d-415d-80c2-32cbafdb5f6f",  # type: ignore
+            session=Session(
+                base_url="http://localhost:8080",
+                transport=httpx.MockTransport(handler),
+            ),
+        )
+
+        def identical_datasets():
+            datasets = [dataverse.create_dataset() for _ in range(2)]
+
+            for dataset in datasets:
+                dataset.citation.title = "My dataset"  # type: ignore
+                dataset.citation.subject = ["Other"]  # type: ignore
+                dataset.citation.add_author(name="John Doe")  # type: ignore
+                dataset.citation.add_dataset_contact(  # type: ignore
+                    name="John Doe",
+                    email="john@doe.com",
+                )
+                dataset.citation.add_ds_description(value="Description")  # type: ignore
+
+            return datasets
+
+        path = str(tmp_path / "journal.jsonl")
+
+        # Act
+        first = dataverse.upload_many(
+            identical_datasets(), "root", journal=UploadJournal(path=path)
+        )
+        first_created = len(created)
+        resumed = dataverse.upload_many(
+            identical_datasets(), "root", journal=UploadJournal(path=path)
+        )
+
+        # Assert
+        assert first_created == 2
+        assert len(created) == 2
+        assert {result.pid for result in first} == {"doi:10.5072/1", "doi:10.5072/2"}
+        assert [result.pid for result in resumed] == [result.pid for result in first]
+        dataverse.close()
@@ -0,0 +1,100 @@
+import asyncio
+
+import httpx
+import pytest
+from pyDataverse.api import DataAccessApi
+
+from easyDataverse.downloader import download_files
+from easyDataverse.progress import MAXIMUM_DISPLAYED_FILES, DownloadProgress
+
+
+def _files(sizes):
+    return [
+        {"dataFile": {"id": index, "filename": f"file_{index}.txt", "filesize": size}}
+        for index, size in enumerate(sizes)
+    ]
+
+
+class TestProgress:
+    @pytest.mark.unit
+    def test_auto_mode(self):
+        # Arrange
+        few = _files([1] * MAXIMUM_DISPLAYED_FILES)
+        many = _files([1] * (MAXIMUM_DISPLAYED_FILES + 1))
+
+        # Act
+        few_progress = DownloadProgress(few)
+        many_progress = DownloadProgress(many)
+
+        # Assert
+        assert few_progress.mode == "files"
+        assert many_progress.mode == "aggregate"
+        assert len(many_progress._display.tasks) == 1  # type: ignore
+
+    @pytest.mark.unit
+    def test_invalid_mode(self):
+        # Act & Assert
+        with pytest.raises(ValueError):
+            DownloadProgress(_files([1]), mode="verbose")
+
+    @pytest.mark.unit
+    def test_counters_and_callback(self):
+        # Arrange
+        updates = []
+        progress = DownloadProgress(
+            _files([10, 20]),
+            mode="aggregate",
+            callback=updates.append,
+        )
+
+        # Act
+        progress.advance(0, 4)
+        progress.reset(0)
+        progress.advance(0, 10)
+        progress.finish(0)
+        progress.advance(1, 5)
+        progress.finish(1)
+
+        # Assert
+        assert progress.bytes_done == 30
+        assert progress.files_done == 2
+        assert progress._display.tasks[0].completed == 30  # type: ignore
+        assert progress._display.tasks[0].fields["files"] == "2/2 files"  # type: ignore
+        assert updates[-1].bytes_done == 30
+        assert updates[-1].files_done == 2
+        assert updates[-1].total_files == 2
+        assert updates[1].advance == -4
+
+    @pytest.mark.unit
+    def test_silent_download(self, tmp_path, capsys):
+        # Arrange
+        files_list = _files([5, 5])
+        updates = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, content=b"12345")
+
+        async def main():
+            async with httpx.AsyncClient(
+                base_url="http://localhost:8080",
+                transport=httpx.MockTransport(handler),
+            ) as client:
+                return await download_files(
+                    data_api=DataAccessApi("http://localhost:8080"),
+                    files_list=files_list,
+                    filedir=str(tmp_path),
+                    filenames=[],
+                    n_parallel_downloads=2,
+                    client=client,
+                    progress="silent",
+                    progress_callback=updates.append,
+                )
+
+        # Act
+        files = asyncio.run(main())
+
+        # Assert
+        assert len(files) == 2
+        assert capsys.readouterr().out == ""
+        assert updates[-1].files_done == 2
+        assert updates[-1].bytes_done == 10
@@ -0,0 +1,111 @@
+import json
+import warnings
+
+import pytest
+
+from easyDataverse.base import DataverseBase
+from easyDataverse.dataset import Dataset
+from easyDataverse.registry import LazyMetadatablocks, MetadatablockRegistry
+
+
+class TestMetadatablockRegistry:
+    @pytest.mark.unit
+    def test_classes_are_generated_once(self, metadatablocks):
+        # Arrange
+        registry = MetadatablockRegistry.from_payloads(metadatablocks)
+
+        # Act
+        first = registry.get_class("citation")
+        second = registry.get_class("citation")
+
+        # Assert
+        assert first is second
+        assert issubclass(first, DataverseBase)
+        assert first._metadatablock_name == "citation"  # type: ignore
+        assert not registry.is_built("geospatial")
+
+    @pytest.mark.unit
+    def test_instantiate(self, metadatablocks):
+        # Arrange
+        registry = MetadatablockRegistry.from_payloads(metadatablocks)
+
+        # Act
+        block = registry.instantiate("citation")
+        block.title = "My dataset"  # type: ignore
+        block.add_author(name="John Doe")  # type: ignore
+
+        # Assert
+        assert registry.instantiate("citation").title is None  # type: ignore
+        assert block.author[0].name == "John Doe"  # type: ignore
+
+    @pytest.mark.unit
+    def test_blank_datasets_are_independent(self, metadatablocks):
+        # Arrange
+        registry = MetadatablockRegistry.from_payloads(metadatablocks)
+
+        # Act
+        first = Dataset.from_registry(registry)
+        second = Dataset.from_registry(registry)
+        first.citation.title = "My dataset"  # type: ignore
+
+        # Assert
+        assert set(first.metadatablocks) == {"citation", "geospatial"}
+        assert first.citation.__class__ is second.citation.__class__  # type: ignore
+        assert second.citation.title is None  # type: ignore
+
+
+class TestLazyMetadatablocks:
+    @pytest.mark.unit
+    def test_attribute_access(self, metadatablocks):
+        # Arrange
+        registry = MetadatablockRegistry.from_payloads(metadatablocks)
+        dataset = Dataset.from_registry(registry, lazy=True)
+
+        # Act
+        dataset.citation.title = "My dataset"  # type: ignore
+
+        # Assert
+        assert isinstance(dataset.metadatablocks, LazyMetadatablocks)
+        assert registry.is_built("citation")
+        assert not registry.is_built("geospatial")
+        assert dataset.metadatablocks["citation"] is dataset.citation  # type: ignore
+        assert dataset.dict() == {
+            "metadatablocks": {"citation": {"title": "My dataset"}}
+        }
+
+    @pytest.mark.unit
+    def test_item_access(self, metadatablocks):
+        # Arrange
+        registry = MetadatablockRegistry.from_payloads(metadatablocks)
+        dataset = Dataset.from_registry(registry, lazy=True)
+
+        # Act
+        geospatial = dataset.metadatablocks["geospatial"]
+
+        # Assert
+        assert registry.is_built("geospatial")
+        assert not registry.is_built("citation")
+        assert dataset.geospatial is geospatial  # type: ignore
+        assert "citation" in dataset.metadatablocks
+        assert dataset.dataverse_dict()["datasetVersion"]["metadataBlocks"] == {}
+
+    @pytest.mark.unit
+    def test_serialization(self, metadatablocks):
+        # Arrange
+        registry = MetadatablockRegistry.from_payloads(metadatablocks)
+        dataset = Dataset.from_registry(registry, lazy=True)
+        dataset.citation.title = "My dataset"  # type: ignore
+
+        # Act
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            dumped = dataset.model_dump()
+            dumped_json = json.loads(dataset.model_dump_json())
+
+        # Assert
+        assert list(dumped["metadatablocks"]) == ["citation"]
+        assert dumped["citation"]["title"] == "My dataset"
+        assert "geospatial" not in dumped
+        assert dumped_json["metadatablocks"] == dumped["metadatablocks"]
+        assert dumped_json["citation"]["title"] == "My dataset"
+        assert not registry.is_built("geospatial")
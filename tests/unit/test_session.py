@@ -0,0 +1,130 @@
+import asyncio
+import gc
+
+import httpx
+import pytest
+
+from easyDataverse.dataverse import Dataverse
+from easyDataverse.session import Session
+
+
+class TestSession:
+    @pytest.mark.unit
+    def test_clients_are_reused(self):
+        # Arrange
+        session = Session(base_url="http://localhost:8080")
+
+        async def get_client():
+            return session.async_client()
+
+        # Act
+        first = session.run(get_client())
+        second = session.run(get_client())
+
+        # Assert
+        assert session.client is session.client
+        assert first is second
+        session.close()
+
+    @pytest.mark.unit
+    def test_headers(self):
+        # Arrange
+        session = Session(base_url="http://localhost:8080", api_token="token")
+
+        # Act
+        headers = session.headers
+
+        # Assert
+        assert headers == {"X-Dataverse-key": "token"}
+        assert Session(base_url="http://localhost:8080").headers == {}
+
+    @pytest.mark.unit
+    def test_run_propagates_errors(self):
+        # Arrange
+        session = Session(base_url="http://localhost:8080")
+
+        async def fail():
+            await asyncio.sleep(0)
+            raise ValueError("Failed")
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            session.run(fail())
+
+        session.close()
+
+    @pytest.mark.unit
+    def test_close_stops_loop(self):
+        # Arrange
+        session = Session(base_url="http://localhost:8080")
+        session.run(asyncio.sleep(0))
+        thread = session._thread
+
+        # Act
+        session.close()
+
+        # Assert
+        assert not thread.is_alive()  # type: ignore
+        assert session.run(asyncio.sleep(0, result=1)) == 1
+        session.close()
+
+
+class TestDataverseSession:
+    @pytest.mark.unit
+    def test_connect_uses_session(self, mock_installation):
+        # Arrange
+        session = Session(
+            base_url="http://localhost:8080",
+            transport=mock_installation,
+        )
+
+        # Act
+        dataverse = Dataverse("http://localhost:8080", session=session)  # type: ignore
+
+        # Assert
+        assert dataverse.session is session
+        assert dataverse.default_license.name == "CC0 1.0"
+        assert set(dataverse.dataset_types) == {"dataset"}
+        assert "/api/metadatablocks/citation" in mock_installation.calls
+        assert set(dataverse.create_dataset().metadatablocks) == {
+            "citation",
+            "geospatial",
+        }
+        dataverse.close()
+
+    @pytest.mark.unit
+    def test_incompatible_installation(self):
+        # Arrange
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={"data": {"version": "5.10"}})
+
+        session = Session(
+            base_url="http://localhost:8080",
+            transport=httpx.MockTransport(handler),
+        )
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            Dataverse("http://localhost:8080", session=session)  # type: ignore
+
+        session.close()
+
+    @pytest.mark.unit
+    def test_loop_stops_when_dataverse_is_collected(self, mock_installation):
+        # Arrange
+        dataverse = Dataverse(
+            "http://localhost:8080",  # type: ignore
+            session=Session(
+                base_url="http://localhost:8080",
+                transport=mock_installation,
+            ),
+        )
+        thread = dataverse.session._thread  # type: ignore
+
+        # Act
+        del dataverse
+        gc.collect()
+
+        # Assert
+        assert thread is not None
+        assert not thread.is_alive()
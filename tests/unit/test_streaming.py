@@ -0,0 +1,175 @@
+import asyncio
+import io
+
+import httpx
+import pytest
+
+from easyDataverse import Dataverse, Session
+from easyDataverse.downloader import RangeNotSupportedError
+from easyDataverse.streaming import RemoteFile, find_file_id
+
+CONTENT = bytes(range(256)) * 40
+
+
+def _ranged_handler(requests):
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request.headers.get("Range"))
+
+        if "Range" not in request.headers:
+            return httpx.Response(200, content=CONTENT)
+
+        start, end = request.headers["Range"].removeprefix("bytes=").split("-")
+        start = int(start)
+        end = min(int(end) + 1 if end else len(CONTENT), len(CONTENT))
+
+        if start >= len(CONTENT):
+            return httpx.Response(
+                416, headers={"Content-Range": f"bytes */{len(CONTENT)}"}
+            )
+
+        return httpx.Response(
+            206,
+            content=CONTENT[start:end],
+            headers={"Content-Range": f"bytes {start}-{end - 1}/{len(CONTENT)}"},
+        )
+
+    return handler
+
+
+class TestStreaming:
+    @pytest.mark.unit
+    def test_remote_file_reads_ranges(self):
+        # Arrange
+        requests = []
+        client = httpx.Client(
+            base_url="http://localhost:8080",
+            transport=httpx.MockTransport(_ranged_handler(requests)),
+        )
+        f = io.BufferedReader(
+            RemoteFile(client, "/api/access/datafile/1"),  # type: ignore
+            buffer_size=1024,
+        )
+
+        # Act
+        head = f.read(10)
+        second = f.read(10)
+        f.seek(-5, io.SEEK_END)
+        tail = f.read()
+        f.seek(5000)
+        middle = f.read(100)
+        f.seek(len(CONTENT) + 10)
+        beyond = f.read(10)
+
+        # Assert
+        assert head == CONTENT[:10]
+        assert second == CONTENT[10:20]
+        assert tail == CONTENT[-5:]
+        assert middle == CONTENT[5000:5100]
+        assert beyond == b""
+        assert requests[0] == "bytes=0-1023"
+        assert len(requests) == 3
+        client.close()
+
+    @pytest.mark.unit
+    def test_remote_file_readall(self):
+        # Arrange
+        requests = []
+        client = httpx.Client(
+            base_url="http://localhost:8080",
+            transport=httpx.MockTransport(_ranged_handler(requests)),
+        )
+        raw = RemoteFile(client, "/api/access/datafile/1")
+        raw.seek(100)
+
+        # Act
+        data = raw.readall()
+
+        # Assert
+        assert data == CONTENT[100:]
+        assert requests == ["bytes=100-"]
+        assert raw.size == len(CONTENT)
+        client.close()
+
+    @pytest.mark.unit
+    def test_remote_file_without_range_support(self):
+        # Arrange
+        client = httpx.Client(
+            base_url="http://localhost:8080",
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(200, content=CONTENT)
+            ),
+        )
+        raw = RemoteFile(client, "/api/access/datafile/1")
+
+        # Act & Assert
+        with pytest.raises(RangeNotSupportedError):
+            raw.read(10)
+
+        client.close()
+
+    @pytest.mark.unit
+    def test_find_file_id(self):
+        # Arrange
+        files = [
+            {"dataFile": {"id": 1, "filename": "table.csv"}},
+            {"directoryLabel": "data", "dataFile": {"id": 2, "filename": "table.csv"}},
+        ]
+
+        # Act & Assert
+        assert find_file_id(files, "table.csv") == 1
+        assert find_file_id(files, "data/table.csv") == 2
+
+        with pytest.raises(ValueError):
+            find_file_id(files, "missing.csv")
+
+    @pytest.mark.unit
+    def test_open_and_stream_file_by_path(self, mock_installation):
+        # Arrange
+        requests = []
+        ranged = _ranged_handler(requests)
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/api/datasets/:persistentId/":
+                files = [
+                    {
+                        "directoryLabel": "data",
+                        "dataFile": {"id": 7, "filename": "table.csv"},
+                    }
+                ]
+                return httpx.Response(
+                    200, json={"data": {"latestVersion": {"files": files}}}
+                )
+            elif request.url.path == "/api/access/datafile/7":
+                return ranged(request)
+
+            return mock_installation.handler(request)
+
+        dataverse = Dataverse(
+            "http://localhost:8080",  # type: ignore
+            session=Session(
+                base_url="http://localhost:8080",
+                transport=httpx.MockTransport(handler),
+            ),
+        )
+
+        async def stream():
+            return b"".join(
+                [
+                    chunk
+                    async for chunk in dataverse.stream_file(
+                        "data/table.csv", pid="doi:10.5072/FK2/ABCDEF"
+                    )
+                ]
+            )
+
+        # Act
+        with dataverse.open_file("data/table.csv", pid="doi:10.5072/FK2/ABCDEF") as f:
+            f.seek(1000)
+            data = f.read(24)
+
+        streamed = asyncio.run(stream())
+
+        # Assert
+        assert data == CONTENT[1000:1024]
+        assert streamed == CONTENT
+        dataverse.close()
@@ -0,0 +1,106 @@
+import httpx
+import pytest
+
+from easyDataverse.dataverse import Dataverse
+from easyDataverse.session import Session
+from easyDataverse.validation import (
+    MetadataValidationError,
+    compile_rules,
+    validate_metadata,
+)
+
+
+def _dataverse(mock_installation, handler=None):
+    return Dataverse(
+        "http://localhost:8080",  # type: ignore
+        api_token="9eb39a88-ab0d-415d-80c2-32cbafdb5f6f",  # type: ignore
+        session=Session(
+            base_url="http://localhost:8080",
+            transport=httpx.MockTransport(handler or mock_installation.handler),
+        ),
+    )
+
+
+def _fill_required(dataset):
+    dataset.citation.title = "My dataset"
+    dataset.citation.subject = ["Other"]
+    dataset.citation.add_author(name="John Doe")
+    dataset.citation.add_dataset_contact(name="John Doe", email="john@doe.com")
+    dataset.citation.add_ds_description(value="Description")
+
+
+class TestValidation:
+    @pytest.mark.unit
+    def test_valid_dataset(self, mock_installation):
+        # Arrange
+        dataverse = _dataverse(mock_installation)
+        dataset = dataverse.create_dataset()
+        _fill_required(dataset)
+
+        # Act
+        errors = dataset.validate()
+
+        # Assert
+        assert errors == []
+        dataverse.close()
+
+    @pytest.mark.unit
+    def test_errors_by_field_path(self, mock_installation):
+        # Arrange
+        dataverse = _dataverse(mock_installation)
+        dataset = dataverse.create_dataset()
+        _fill_required(dataset)
+        dataset.citation.add_author(name="Jane Doe")  # type: ignore
+
+        data = dataset.dataverse_dict()
+        fields = {
+            field["typeName"]: field
+            for field in data["datasetVersion"]["metadataBlocks"]["citation"]["fields"]
+        }
+        fields["subject"]["value"].append("Alchemy")
+        fields["datasetContact"]["value"][0]["datasetContactEmail"]["value"] = "john"
+        del fields["author"]["value"][1]["authorName"]
+        data["datasetVersion"]["metadataBlocks"]["citation"]["fields"].remove(
+            fields["title"]
+        )
+
+        rules = {"citation": compile_rules(type(dataset.citation))}
+        required = ["citation/title", "citation/author/authorName"]
+
+        # Act
+        errors = validate_metadata(data, rules, required)
+
+        # Assert
+        assert {error.path for error in errors} == {
+            "citation/title",
+            "citation/subject/1",
+            "citation/datasetContact/0/datasetContactEmail",
+            "citation/author/1/authorName",
+        }
+        dataverse.close()
+
+    @pytest.mark.unit
+    def test_upload_rejects_invalid_metadata(self, mock_installation):
+        # Arrange
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.method == "POST":
+                requests.append(request)
+
+            return mock_installation.handler(request)
+
+        dataverse = _dataverse(mock_installation, handler)
+        dataset = dataverse.create_dataset()
+        dataset.citation.title = "My dataset"  # type: ignore
+
+        # Act
+        with pytest.raises(MetadataValidationError) as exc_info:
+            dataset.upload("root")
+
+        # Assert
+        paths = {error.path for error in exc_info.value.errors}
+        assert "citation/author" in paths
+        assert "citation/title" not in paths
+        assert requests == []
+        dataverse.close()